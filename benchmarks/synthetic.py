@@ -0,0 +1,178 @@
+# -*- mode: python; coding: utf-8 -*-
+# Copyright (c) 2020 Radio Astronomy Software Group
+# Licensed under the 2-clause BSD License
+
+"""Generate synthetic data sets for the benchmarks."""
+import os
+import shutil
+
+import numpy as np
+from astropy.io import fits
+
+from pyuvdata import UVData
+from pyuvdata import utils as uvutils
+from pyuvdata.data import DATA_PATH
+
+# Data set sizes as (Nants, Ntimes, Nfreqs). Baselines include autos, so
+# Nbls = Nants * (Nants + 1) / 2: 28, 120 and 351 baselines.
+SCALES = {
+    "small": (7, 10, 64),
+    "medium": (15, 30, 256),
+    "large": (26, 60, 512),
+}
+
+# MWA correlator data set sizes as (number of coarse channels, Ntimes).
+# The number of baselines is set by the metafits file (128 tiles, 8256
+# baselines) and each coarse channel has 32 fine channels.
+MWA_SCALES = {
+    "small": (1, 2),
+    "medium": (2, 4),
+    "large": (4, 8),
+}
+
+MWA_METAFITS = os.path.join(DATA_PATH, "mwa_corr_fits_testfiles", "1131733552.metafits")
+MWA_GPUBOX = os.path.join(
+    DATA_PATH,
+    "mwa_corr_fits_testfiles",
+    "1131733552_20151116182537_mini_gpubox01_00.fits",
+)
+
+
+def make_uvdata(nants, ntimes, nfreqs, npols=2, seed=0):
+    """
+    Make a drift scan UVData object with random data.
+
+    The antennas are on a regular grid at the HERA site, the baseline-time
+    axis is ordered by time and then baseline.
+
+    Parameters
+    ----------
+    nants : int
+        Number of antennas.
+    ntimes : int
+        Number of times.
+    nfreqs : int
+        Number of frequencies.
+    npols : int
+        Number of polarizations, 1, 2 or 4.
+    seed : int
+        Seed for the random data.
+
+    Returns
+    -------
+    UVData object
+        The synthetic data set.
+
+    """
+    uvd = UVData()
+    uvd.Nants_telescope = nants
+    uvd.telescope_name = "HERA"
+    uvd.instrument = "HERA"
+    uvd.set_telescope_params()
+    uvd.object_name = "zenith"
+    uvd.history = "Synthetic data set for benchmarking."
+    uvd.vis_units = "uncalib"
+
+    uvd.antenna_numbers = np.arange(nants)
+    uvd.antenna_names = ["ant{}".format(ant) for ant in range(nants)]
+    side = int(np.ceil(np.sqrt(nants)))
+    enu = np.zeros((nants, 3))
+    enu[:, 0] = (np.arange(nants) % side) * 14.6
+    enu[:, 1] = (np.arange(nants) // side) * 14.6
+    uvd.antenna_positions = (
+        uvutils.ECEF_from_ENU(enu, *uvd.telescope_location_lat_lon_alt)
+        - uvd.telescope_location
+    )
+
+    ant_1, ant_2 = np.triu_indices(nants)
+    uvd.Nbls = ant_1.size
+    uvd.Ntimes = ntimes
+    uvd.Nblts = uvd.Nbls * ntimes
+    uvd.Nants_data = nants
+    uvd.ant_1_array = np.tile(ant_1, ntimes)
+    uvd.ant_2_array = np.tile(ant_2, ntimes)
+    uvd.baseline_array = uvd.antnums_to_baseline(uvd.ant_1_array, uvd.ant_2_array)
+    integration_time = 10.0
+    times = 2458000.5 + np.arange(ntimes) * integration_time / 86400.0
+    uvd.time_array = np.repeat(times, uvd.Nbls)
+    uvd.integration_time = np.full(uvd.Nblts, integration_time)
+    uvd.set_lsts_from_time_array()
+
+    uvd.Nspws = 1
+    uvd.spw_array = np.array([0])
+    uvd.Nfreqs = nfreqs
+    uvd.channel_width = 97656.25
+    uvd.freq_array = 100e6 + np.arange(nfreqs)[np.newaxis, :] * uvd.channel_width
+    uvd.Npols = npols
+    uvd.polarization_array = np.array([-5, -6, -7, -8][:npols])
+
+    uvd.set_drift()
+    uvd.set_uvws_from_antenna_positions()
+
+    rng = np.random.RandomState(seed)
+    shape = (uvd.Nblts, uvd.Nspws, uvd.Nfreqs, uvd.Npols)
+    uvd.data_array = (rng.normal(size=shape) + 1j * rng.normal(size=shape)).astype(
+        np.complex64
+    )
+    uvd.flag_array = np.zeros(shape, dtype=np.bool)
+    uvd.nsample_array = np.ones(shape, dtype=np.float32)
+
+    uvd.check()
+    return uvd
+
+
+def write_mwa_corr_fits(path, n_coarse, ntimes, seed=0):
+    """
+    Write a synthetic MWA correlator FITS data set.
+
+    The metafits file from the test data is copied and random gpubox files
+    are written for the first `n_coarse` coarse channels.
+
+    Parameters
+    ----------
+    path : str
+        Directory to write the files to.
+    n_coarse : int
+        Number of coarse channels (gpubox files) to write.
+    ntimes : int
+        Number of integrations in each gpubox file.
+    seed : int
+        Seed for the random data.
+
+    Returns
+    -------
+    list of str
+        The metafits and gpubox file names.
+
+    """
+    if not os.path.exists(path):
+        os.makedirs(path)
+    metafits = os.path.join(path, os.path.basename(MWA_METAFITS))
+    shutil.copyfile(MWA_METAFITS, metafits)
+
+    int_time = fits.getheader(MWA_METAFITS)["INTTIME"]
+    with fits.open(MWA_GPUBOX) as template:
+        primary_header = template[0].header.copy()
+        image_header = template[1].header.copy()
+    start_time = image_header["TIME"]
+    # 128 tiles, 8256 baselines with 4 polarizations and real/imag parts.
+    nvalues = image_header["NAXIS1"]
+    num_fine_chans = 32
+
+    rng = np.random.RandomState(seed)
+    filelist = [metafits]
+    for file_num in range(1, n_coarse + 1):
+        hdus = [fits.PrimaryHDU(header=primary_header)]
+        for time_ind in range(ntimes):
+            header = image_header.copy()
+            header["TIME"] = start_time + int(time_ind * int_time)
+            header["MILLITIM"] = int(round((time_ind * int_time) % 1 * 1000))
+            data = rng.normal(size=(num_fine_chans, nvalues)).astype(np.float32)
+            hdus.append(fits.ImageHDU(data=data, header=header))
+        filename = os.path.join(
+            path, "1131733552_20151116182537_gpubox{:02d}_00.fits".format(file_num)
+        )
+        fits.HDUList(hdus).writeto(filename, overwrite=True)
+        filelist.append(filename)
+
+    return filelist
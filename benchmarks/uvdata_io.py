@@ -0,0 +1,129 @@
+# -*- mode: python; coding: utf-8 -*-
+# Copyright (c) 2020 Radio Astronomy Software Group
+# Licensed under the 2-clause BSD License
+
+"""Benchmarks for reading and writing UVData files."""
+import os
+import shutil
+import warnings
+
+from pyuvdata import UVData
+
+from .synthetic import SCALES, MWA_SCALES, make_uvdata, write_mwa_corr_fits
+
+FILE_TYPES = ["uvh5", "uvfits", "miriad"]
+
+
+def _write_file(uvd, filename, file_type):
+    """Write a UVData object to a file of the given type."""
+    if file_type == "uvh5":
+        uvd.write_uvh5(filename, clobber=True)
+    elif file_type == "uvfits":
+        uvd.write_uvfits(filename, spoof_nonessential=True)
+    else:
+        uvd.write_miriad(filename, clobber=True)
+
+
+def _remove_file(filename):
+    """Remove a file or a directory (for miriad files) if it exists."""
+    if os.path.isdir(filename):
+        shutil.rmtree(filename)
+    elif os.path.exists(filename):
+        os.remove(filename)
+
+
+class ReadUVData:
+    """Read uvh5, uvfits and miriad files."""
+
+    params = [list(SCALES), FILE_TYPES]
+    param_names = ["scale", "file_type"]
+    timeout = 600
+
+    def setup_cache(self):
+        """Write a file of each type for each scale."""
+        filenames = {}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            for scale, (nants, ntimes, nfreqs) in SCALES.items():
+                uvd = make_uvdata(nants, ntimes, nfreqs)
+                filenames[scale] = {}
+                for file_type in FILE_TYPES:
+                    if file_type == "uvfits":
+                        uvd_write = uvd.copy()
+                        uvd_write.phase_to_time(uvd_write.time_array[0])
+                    else:
+                        uvd_write = uvd
+                    filename = "read_{}.{}".format(scale, file_type)
+                    _write_file(uvd_write, filename, file_type)
+                    filenames[scale][file_type] = os.path.abspath(filename)
+        return filenames
+
+    def setup(self, filenames, scale, file_type):
+        """Ignore warnings from the readers."""
+        warnings.simplefilter("ignore")
+
+    def time_read(self, filenames, scale, file_type):
+        """Time reading a file."""
+        UVData().read(filenames[scale][file_type])
+
+    def peakmem_read(self, filenames, scale, file_type):
+        """Peak memory when reading a file."""
+        UVData().read(filenames[scale][file_type])
+
+
+class WriteUVData:
+    """Write uvh5, uvfits and miriad files."""
+
+    params = [list(SCALES), FILE_TYPES]
+    param_names = ["scale", "file_type"]
+    timeout = 600
+    number = 1
+    warmup_time = 0
+
+    def setup(self, scale, file_type):
+        """Make the object to write, uvfits requires phased data."""
+        warnings.simplefilter("ignore")
+        self.uvd = make_uvdata(*SCALES[scale])
+        if file_type == "uvfits":
+            self.uvd.phase_to_time(self.uvd.time_array[0])
+        self.filename = "write_{}.{}".format(scale, file_type)
+
+    def teardown(self, scale, file_type):
+        """Remove the written file."""
+        _remove_file(self.filename)
+
+    def time_write(self, scale, file_type):
+        """Time writing a file."""
+        _write_file(self.uvd, self.filename, file_type)
+
+    def peakmem_write(self, scale, file_type):
+        """Peak memory when writing a file."""
+        _write_file(self.uvd, self.filename, file_type)
+
+
+class ReadMWACorrFits:
+    """Read MWA correlator FITS files."""
+
+    params = [list(MWA_SCALES)]
+    param_names = ["scale"]
+    timeout = 600
+
+    def setup_cache(self):
+        """Write a set of gpubox files for each scale."""
+        filelists = {}
+        for scale, (n_coarse, ntimes) in MWA_SCALES.items():
+            path = os.path.abspath("mwa_corr_fits_{}".format(scale))
+            filelists[scale] = write_mwa_corr_fits(path, n_coarse, ntimes)
+        return filelists
+
+    def setup(self, filelists, scale):
+        """Ignore warnings from the reader."""
+        warnings.simplefilter("ignore")
+
+    def time_read_mwa_corr_fits(self, filelists, scale):
+        """Time reading a set of gpubox files."""
+        UVData().read(filelists[scale])
+
+    def peakmem_read_mwa_corr_fits(self, filelists, scale):
+        """Peak memory when reading a set of gpubox files."""
+        UVData().read(filelists[scale])
@@ -0,0 +1,96 @@
+# -*- mode: python; coding: utf-8 -*-
+# Copyright (c) 2020 Radio Astronomy Software Group
+# Licensed under the 2-clause BSD License
+
+"""Benchmarks for the core UVData transformations."""
+import warnings
+
+import numpy as np
+
+from .synthetic import SCALES, make_uvdata
+
+
+class UVDataTransforms:
+    """Select, phase and average UVData objects in place."""
+
+    params = [list(SCALES)]
+    param_names = ["scale"]
+    timeout = 600
+    # the operations modify the object, so make a new one for every call
+    number = 1
+    warmup_time = 0
+
+    def setup(self, scale):
+        """Make the object to transform."""
+        warnings.simplefilter("ignore")
+        self.uvd = make_uvdata(*SCALES[scale])
+        self.select_ants = self.uvd.antenna_numbers[::2]
+        self.select_chans = np.arange(0, self.uvd.Nfreqs, 2)
+        self.phase_time = self.uvd.time_array[0]
+
+    def _select(self):
+        self.uvd.select(antenna_nums=self.select_ants, freq_chans=self.select_chans)
+
+    def time_select(self, scale):
+        """Time selecting half the antennas and frequencies."""
+        self._select()
+
+    def peakmem_select(self, scale):
+        """Peak memory when selecting half the antennas and frequencies."""
+        self._select()
+
+    def time_phase(self, scale):
+        """Time phasing to zenith at the first time."""
+        self.uvd.phase_to_time(self.phase_time)
+
+    def peakmem_phase(self, scale):
+        """Peak memory when phasing to zenith at the first time."""
+        self.uvd.phase_to_time(self.phase_time)
+
+    def time_downsample_in_time(self, scale):
+        """Time averaging pairs of times."""
+        self.uvd.downsample_in_time(n_times_to_avg=2, allow_drift=True)
+
+    def peakmem_downsample_in_time(self, scale):
+        """Peak memory when averaging pairs of times."""
+        self.uvd.downsample_in_time(n_times_to_avg=2, allow_drift=True)
+
+    def time_frequency_average(self, scale):
+        """Time averaging pairs of frequencies."""
+        self.uvd.frequency_average(2)
+
+    def peakmem_frequency_average(self, scale):
+        """Peak memory when averaging pairs of frequencies."""
+        self.uvd.frequency_average(2)
+
+
+class UVDataCombine:
+    """Combine UVData objects split in time."""
+
+    params = [list(SCALES)]
+    param_names = ["scale"]
+    timeout = 600
+
+    def setup(self, scale):
+        """Split an object into two halves in time."""
+        warnings.simplefilter("ignore")
+        uvd = make_uvdata(*SCALES[scale])
+        times = np.unique(uvd.time_array)
+        self.uvd1 = uvd.select(times=times[: times.size // 2], inplace=False)
+        self.uvd2 = uvd.select(times=times[times.size // 2 :], inplace=False)
+
+    def time_add(self, scale):
+        """Time adding the two halves."""
+        self.uvd1 + self.uvd2
+
+    def peakmem_add(self, scale):
+        """Peak memory when adding the two halves."""
+        self.uvd1 + self.uvd2
+
+    def time_fast_concat(self, scale):
+        """Time concatenating the two halves."""
+        self.uvd1.fast_concat(self.uvd2, "blt")
+
+    def peakmem_fast_concat(self, scale):
+        """Peak memory when concatenating the two halves."""
+        self.uvd1.fast_concat(self.uvd2, "blt")
@@ -730,6 +730,52 @@ def test_redundancy_finder_fully_redundant_array():
     assert baseline_groups[0].sort() == np.unique(uvd.baseline_array).sort()
 
 
+@pytest.mark.parametrize("tol", [0.1, 0.5, 1.0])
+def test_redundancy_finder_matches_pairwise(tol):
+    """Test the redundancy finder matches a direct pairwise calculation."""
+    from scipy.spatial.distance import pdist, squareform
+
+    rng = np.random.RandomState(7)
+    # clusters of baselines, a chain of overlapping baselines and random ones
+    centers = rng.uniform(-100, 100, (30, 3))
+    bl_vecs = np.concatenate(
+        (
+            np.repeat(centers, 5, axis=0) + rng.normal(0, 0.01, (150, 3)),
+            np.outer(np.arange(10) * 0.7, [1.0, 0.0, 0.0]) + 200.0,
+            rng.uniform(-100, 100, (40, 3)),
+        )
+    )
+    bls = rng.permutation(np.arange(bl_vecs.shape[0]) * 3 + 70000)
+
+    # each baseline is grouped with the adjacent baselines that are adjacent
+    # to everything it is adjacent to.
+    adj = squareform(pdist(bl_vecs) < tol)
+    adj[np.diag_indices_from(adj)] = True
+    expected_groups = set()
+    for bi in range(bls.size):
+        group = [
+            bls[ai]
+            for ai in np.nonzero(adj[bi])[0]
+            if np.all(adj[ai][adj[bi]]) or ai == bi
+        ]
+        expected_groups.add(tuple(sorted(group)))
+    expected_groups = sorted(expected_groups)
+
+    if sum(len(gp) for gp in expected_groups) > bls.size:
+        with pytest.raises(ValueError, match="Some baselines are falling into"):
+            uvutils.get_baseline_redundancies(bls, bl_vecs, tol=tol)
+        return
+
+    bl_gps, vec_bin_centers, lens = uvutils.get_baseline_redundancies(
+        bls, bl_vecs, tol=tol
+    )
+    assert bl_gps == [list(gp) for gp in expected_groups]
+    for gp, center, length in zip(bl_gps, vec_bin_centers, lens):
+        inds = [np.nonzero(bls == bl)[0][0] for bl in gp]
+        assert np.allclose(center, np.mean(bl_vecs[inds], axis=0))
+        assert np.isclose(length, np.linalg.norm(center))
+
+
 def test_str_to_bytes():
     test_str = "HERA"
 
@@ -1277,6 +1323,52 @@ def test_uvcalibrate_flag_propagation():
     assert uvdcal.get_flags(20, 72, "xx").min()  # assert completely flagged
 
 
+@pytest.mark.parametrize("blt_chunk_size", [1, 7, 100000])
+def test_uvcalibrate_blt_chunks(blt_chunk_size):
+    uvd = UVData()
+    uvd.read(os.path.join(DATA_PATH, "zen.2457698.40355.xx.HH.uvcAA"))
+    uvc = UVCal()
+    uvc.read_calfits(os.path.join(DATA_PATH, "zen.2457698.40355.xx.gain.calfits"))
+    uvd.select(frequencies=uvd.freq_array[0, :10])
+    uvc.select(times=uvc.time_array[:3])
+    uvc.flag_array[0] = True
+    uvc.gain_array[1] = 0.0
+    uvc = uvc.select(antenna_nums=uvc.ant_array[:-1], inplace=False)
+
+    uvdcal = uvutils.uvcalibrate(uvd, uvc, inplace=False)
+    uvdcal2 = uvutils.uvcalibrate(
+        uvd, uvc, inplace=False, blt_chunk_size=blt_chunk_size
+    )
+    assert uvdcal == uvdcal2
+
+    # check against calibrating each baseline separately
+    for key in uvd.get_antpairpols():
+        ant1 = (key[0], "Jxx")
+        ant2 = (key[1], "Jxx")
+        if not uvc._has_key(*ant1) or not uvc._has_key(*ant2):
+            assert np.all(uvdcal2.get_flags(key))
+            continue
+        gain = (uvc.get_gains(ant1) * uvc.get_gains(ant2).conj()).T
+        flag = (uvc.get_flags(ant1) | uvc.get_flags(ant2)).T | (gain == 0)
+        gain[flag] = 1.0
+        np.testing.assert_array_equal(uvdcal2.get_flags(key), uvd.get_flags(key) | flag)
+        np.testing.assert_allclose(uvdcal2.get_data(key), uvd.get_data(key) / gain)
+
+
+def test_uvcalibrate_errors():
+    uvd = UVData()
+    uvd.read(os.path.join(DATA_PATH, "zen.2457698.40355.xx.HH.uvcAA"))
+    uvc = UVCal()
+    uvc.read_calfits(os.path.join(DATA_PATH, "zen.2457698.40355.xx.gain.calfits"))
+    uvd.select(frequencies=uvd.freq_array[0, :10])
+
+    with pytest.raises(ValueError, match="blt_chunk_size must be a positive integer"):
+        uvutils.uvcalibrate(uvd, uvc, blt_chunk_size=0)
+
+    with pytest.raises(ValueError, match="The number of times for each baseline"):
+        uvutils.uvcalibrate(uvd, uvc.select(times=uvc.time_array[:2], inplace=False))
+
+
 def test_apply_uvflag():
     # load data and insert some flags
     uvd = UVData()
@@ -1379,6 +1471,37 @@ def test_apply_uvflag():
     assert np.all(uvd2.get_flags(9, 10))
 
 
+@pytest.mark.parametrize("uvf_type", ["waterfall", "antenna"])
+def test_apply_uvflag_matches_baseline_type(uvf_type):
+    uvd = UVData()
+    uvd.read(os.path.join(DATA_PATH, "zen.2457698.40355.xx.HH.uvcAA"))
+    rng = np.random.default_rng(0)
+
+    if uvf_type == "waterfall":
+        uvf = UVFlag(uvd, waterfall=True, mode="flag")
+    else:
+        uvc = UVCal()
+        uvc.read_calfits(os.path.join(DATA_PATH, "zen.2457698.40355.xx.gain.calfits"))
+        uvc.select(times=uvc.time_array[:3])
+        uvc.time_array = np.unique(uvd.time_array)
+        uvd.select(frequencies=uvd.freq_array[0, :10])
+        uvc.freq_array = uvd.freq_array
+        uvf = UVFlag(uvc, mode="flag")
+        uvf.polarization_array = uvd.polarization_array
+        # leave out an antenna so its baselines are flagged
+        uvf.select(antenna_nums=uvf.ant_array[1:])
+    uvf.flag_array = rng.random(uvf.flag_array.shape) < 0.2
+
+    uvf_bl = uvf.copy()
+    uvf_bl.to_baseline(uvd)
+
+    uvdf = uvutils.apply_uvflag(uvd, uvf, inplace=False)
+    uvdf_bl = uvutils.apply_uvflag(uvd, uvf_bl, inplace=False)
+    np.testing.assert_array_equal(uvdf.flag_array, uvdf_bl.flag_array)
+    assert np.any(uvdf.flag_array)
+    assert not np.all(uvdf.flag_array)
+
+
 def test_upos_tol_reds():
     # Checks that the u-positive convention in get_antenna_redundancies
     # is enforced to the specificed tolerance.
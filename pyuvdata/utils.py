@@ -6,7 +6,8 @@
 import numpy as np
 import warnings
 import copy
-from scipy.spatial.distance import pdist, squareform
+from scipy.spatial import cKDTree
+from scipy import sparse
 from astropy.time import Time
 from astropy.coordinates import Angle
 from astropy.utils import iers
@@ -399,7 +400,7 @@ def polstr2num(pol, x_orientation=None):
         If the x_orientation not recognized.
 
     """
-    dict_use = copy.deepcopy(POL_STR2NUM_DICT)
+    dict_use = copy.copy(POL_STR2NUM_DICT)
     if x_orientation is not None:
         try:
             rep_dict = _x_orientation_rep_dict(x_orientation)
@@ -455,7 +456,7 @@ def polnum2str(num, x_orientation=None):
         If the x_orientation not recognized.
 
     """
-    dict_use = copy.deepcopy(POL_NUM2STR_DICT)
+    dict_use = copy.copy(POL_NUM2STR_DICT)
     if x_orientation is not None:
         try:
             rep_dict = _x_orientation_rep_dict(x_orientation)
@@ -506,7 +507,7 @@ def jstr2num(jstr, x_orientation=None):
         If the x_orientation not recognized.
 
     """
-    dict_use = copy.deepcopy(JONES_STR2NUM_DICT)
+    dict_use = copy.copy(JONES_STR2NUM_DICT)
     if x_orientation is not None:
         try:
             rep_dict = _x_orientation_rep_dict(x_orientation)
@@ -558,7 +559,7 @@ def jnum2str(jnum, x_orientation=None):
         If the x_orientation not recognized.
 
     """
-    dict_use = copy.deepcopy(JONES_NUM2STR_DICT)
+    dict_use = copy.copy(JONES_NUM2STR_DICT)
     if x_orientation is not None:
         try:
             rep_dict = _x_orientation_rep_dict(x_orientation)
@@ -1170,16 +1171,13 @@ def get_baseline_redundancies(baselines, baseline_vecs, tol=1.0, with_conjugates
     baseline_vecs = copy.copy(baseline_vecs)  # Protect the vectors passed in.
 
     if with_conjugates:
-        conjugates = []
-        for bv in baseline_vecs:
-            uneg = bv[0] < -tol
-            uzer = np.isclose(bv[0], 0.0, atol=tol)
-            vneg = bv[1] < -tol
-            vzer = np.isclose(bv[1], 0.0, atol=tol)
-            wneg = bv[2] < -tol
-            conjugates.append(uneg or (uzer and vneg) or (uzer and vzer and wneg))
-
-        conjugates = np.array(conjugates, dtype=bool)
+        uneg = baseline_vecs[:, 0] < -tol
+        uzer = np.isclose(baseline_vecs[:, 0], 0.0, atol=tol)
+        vneg = baseline_vecs[:, 1] < -tol
+        vzer = np.isclose(baseline_vecs[:, 1], 0.0, atol=tol)
+        wneg = baseline_vecs[:, 2] < -tol
+        conjugates = uneg | (uzer & vneg) | (uzer & vzer & wneg)
+
         baseline_vecs[conjugates] *= -1
         baseline_ind_conj = baselines[conjugates]
         bl_gps, vec_bin_centers, lens = get_baseline_redundancies(
@@ -1187,42 +1185,49 @@ def get_baseline_redundancies(baselines, baseline_vecs, tol=1.0, with_conjugates
         )
         return bl_gps, vec_bin_centers, lens, baseline_ind_conj
 
-    # For each baseline, list all others that are within the tolerance distance.
-    adj_triu_mat = pdist(baseline_vecs) < tol
-    adj = {}  # Adjacency dictionary
-
-    for bi, col in enumerate(squareform(adj_triu_mat)):
-        col[bi] = True
-        adj[baselines[bi]] = baselines[col]
+    # For each baseline, find all others that are within the tolerance distance.
+    # Use a KD-tree to find the candidate pairs (slightly padding the search
+    # radius) and then apply the exact distance cut.
+    tree = cKDTree(baseline_vecs)
+    pairs = tree.query_pairs(tol * (1 + 1e-8), output_type="ndarray")
+    diff = baseline_vecs[pairs[:, 0]] - baseline_vecs[pairs[:, 1]]
+    dist = np.sqrt(diff[:, 0] ** 2 + diff[:, 1] ** 2 + diff[:, 2] ** 2)
+    pairs = pairs[dist < tol]
+
+    # The sparse adjacency matrix (including the diagonal) defines the graph edges.
+    rows = np.concatenate((pairs[:, 0], pairs[:, 1], np.arange(Nbls)))
+    cols = np.concatenate((pairs[:, 1], pairs[:, 0], np.arange(Nbls)))
+    adj = sparse.csr_matrix(
+        (np.ones(rows.size, dtype=np.int64), (rows, cols)), shape=(Nbls, Nbls)
+    )
+    n_adj = np.asarray(adj.sum(axis=1)).ravel()
 
-    # The adjacency list defines a set of graph edges.
-    # For each baseline b0, loop over its adjacency list ai \in adj[b0]
+    # For each baseline b0, loop over its adjacent baselines ai
     #   If adj[b0] is a subset of adj[ai], then ai is in a redundant group with b0
-    bl_gps = []
-    for k in adj.keys():
-        a0 = adj[k]
-        group = [k]
-        for a in a0:
-            if set(a0).issubset(adj[a]) and a not in group:
-                group.append(a)
-        group.sort()
-        bl_gps.append(group)
-
-    # Groups can be different lengths, but we need to take a unique over an axis
-    # to properly identify unique groups
-    # Pad out all the sub-lists to be the same length
-    pad = len(max(bl_gps, key=len))
-    bl_gps = np.array([i + [-1] * (pad - len(i)) for i in bl_gps])
-    # We end up with multiple copies of each redundant group, so remove duplicates
-    bl_gps = np.unique(bl_gps, axis=0).tolist()
-    # remove the dummy pad baselines from each list
-    bl_gps = [[bl for bl in gp if bl != -1] for gp in bl_gps]
+    # adj[b0] is a subset of adj[ai] if the number of baselines adjacent to both
+    # (the matrix product of adj with itself) is the number adjacent to b0.
+    n_common = (adj @ adj).multiply(adj).tocsr()
+    n_common.sort_indices()
+    in_group = n_common.data == np.repeat(n_adj, np.diff(n_common.indptr))
+    group_rows = np.repeat(np.arange(Nbls), np.diff(n_common.indptr))[in_group]
+    group_cols = n_common.indices[in_group]
+
+    # Each group is the sorted list of baseline numbers. We end up with multiple
+    # copies of each redundant group, so remove duplicates
+    group_inds = group_cols[np.lexsort((baselines[group_cols], group_rows))]
+    group_splits = np.cumsum(np.bincount(group_rows, minlength=Nbls))[:-1]
+    unique_groups = {}
+    for inds in np.split(group_inds, group_splits):
+        unique_groups.setdefault(tuple(baselines[inds].tolist()), inds)
+    # sort the groups by their baseline numbers
+    bl_gps = sorted(unique_groups.keys())
 
     n_unique = len(bl_gps)
     vec_bin_centers = np.zeros((n_unique, 3))
     for gi, gp in enumerate(bl_gps):
-        inds = [np.where(i == baselines)[0] for i in gp]
-        vec_bin_centers[gi] = np.mean(baseline_vecs[inds, :], axis=0)
+        inds = unique_groups[gp]
+        vec_bin_centers[gi] = np.mean(baseline_vecs[inds[:, np.newaxis], :], axis=0)
+    bl_gps = [list(gp) for gp in bl_gps]
 
     lens = np.sqrt(np.sum(vec_bin_centers ** 2, axis=1))
     if np.sum([len(bg) for bg in bl_gps]) > Nbls:
@@ -1279,25 +1284,17 @@ def get_antenna_redundancies(
     """
     Nants = antenna_numbers.size
 
-    bls = []
-    bl_vecs = []
-
-    for aj in range(Nants):
-        mini = aj + 1
-        if include_autos:
-            mini = aj
-        for ai in range(mini, Nants):
-            anti, antj = antenna_numbers[ai], antenna_numbers[aj]
-            bidx = antnums_to_baseline(antj, anti, Nants)
-            bv = antenna_positions[ai] - antenna_positions[aj]
-            bl_vecs.append(bv)
-            bls.append(bidx)
-    bls = np.array(bls)
-    bl_vecs = np.array(bl_vecs)
+    if include_autos:
+        aj, ai = np.triu_indices(Nants)
+    else:
+        aj, ai = np.triu_indices(Nants, k=1)
+    bls = antnums_to_baseline(antenna_numbers[aj], antenna_numbers[ai], Nants)
+    bl_vecs = antenna_positions[ai] - antenna_positions[aj]
     gps, vecs, lens, conjs = get_baseline_redundancies(
         bls, bl_vecs, tol=tol, with_conjugates=True
     )
     # Flip the baselines in the groups.
+    conjs = set(conjs.tolist())
     for gi, gp in enumerate(gps):
         for bi, bl in enumerate(gp):
             if bl in conjs:
@@ -1535,6 +1532,180 @@ def collapse(
     return out
 
 
+def _index_in_groups(group_ids):
+    """
+    Get the position of each element within its group.
+
+    Parameters
+    ----------
+    group_ids : array_like of int
+        Group identifier for each element, e.g. baseline numbers.
+
+    Returns
+    -------
+    rank : ndarray of int
+        Position of each element among the elements with the same group id,
+        in order of appearance.
+    counts : ndarray of int
+        Number of elements in the group of each element.
+
+    """
+    group_ids = np.asarray(group_ids)
+    order = np.argsort(group_ids, kind="stable")
+    _, starts, counts = np.unique(
+        group_ids[order], return_index=True, return_counts=True
+    )
+    rank = np.empty(group_ids.size, dtype=int)
+    rank[order] = np.arange(group_ids.size) - np.repeat(starts, counts)
+    group_counts = np.empty(group_ids.size, dtype=int)
+    group_counts[order] = np.repeat(counts, counts)
+
+    return rank, group_counts
+
+
+def _find_indices(values, search_values):
+    """
+    Find the index of each search value in an array of values.
+
+    Values are matched exactly. If a value appears more than once in
+    `values`, the index of the first occurrence is used.
+
+    Parameters
+    ----------
+    values : array_like
+        Values to search in, e.g. times or antenna numbers.
+    search_values : array_like
+        Values to find.
+
+    Returns
+    -------
+    inds : ndarray of int
+        Index into `values` for each search value, set to 0 for values that
+        are not found.
+    found : ndarray of bool
+        Whether each search value was found in `values`.
+
+    """
+    values = np.asarray(values)
+    order = np.argsort(values, kind="stable")
+    inds = np.searchsorted(values, search_values, sorter=order)
+    inds[inds == values.size] = 0
+    inds = order[inds]
+    found = values[inds] == search_values
+
+    return inds, found
+
+
+def _get_blt_keys(time_arrays, baseline_arrays, time_decimals):
+    """
+    Make integer baseline-time keys that can be compared across objects.
+
+    Times are rounded to `time_decimals` decimal places of a day before they
+    are compared, so times that round to the same value get the same key.
+    The keys sort by time and then by baseline.
+
+    Parameters
+    ----------
+    time_arrays : list of array_like of float
+        Time arrays (in JD) to make keys for, e.g. one from each object.
+    baseline_arrays : list of array_like of int
+        Baseline arrays corresponding to the time arrays.
+    time_decimals : int
+        Number of decimal places to round the times to.
+
+    Returns
+    -------
+    list of ndarray of int
+        The keys for each pair of time and baseline arrays.
+
+    """
+    times = np.concatenate(time_arrays)
+    baselines = np.concatenate(baseline_arrays).astype(np.int64)
+
+    # split off the integer day so the fractional part can be rounded exactly
+    day = np.floor(times)
+    day_frac = np.round((times - day) * 10.0 ** time_decimals).astype(np.int64)
+    day = day.astype(np.int64)
+    carry = day_frac // 10 ** time_decimals
+    day += carry
+    day_frac -= carry * 10 ** time_decimals
+
+    # number the unique times in order
+    order = np.lexsort((day_frac, day))
+    new_time = np.ones(times.size, dtype=bool)
+    new_time[1:] = (np.diff(day[order]) != 0) | (np.diff(day_frac[order]) != 0)
+    time_rank = np.empty(times.size, dtype=np.int64)
+    time_rank[order] = np.cumsum(new_time) - 1
+
+    keys = time_rank * (np.max(baselines) + 1) + baselines
+    split_inds = np.cumsum([len(arr) for arr in time_arrays])[:-1]
+
+    return np.split(keys, split_inds)
+
+
+def _inds_to_index(inds):
+    """
+    Convert a list of indices to a slice if they are evenly spaced.
+
+    Parameters
+    ----------
+    inds : array_like of int or None
+        Indices along an axis, None means keep the whole axis.
+
+    Returns
+    -------
+    slice or array of int
+        A slice if the indices are evenly spaced and increasing, otherwise
+        an array of the indices.
+
+    """
+    if inds is None:
+        return slice(None)
+    inds = np.asarray(inds, dtype=np.int64)
+    if inds.size == 1:
+        return slice(inds[0], inds[0] + 1)
+    steps = np.diff(inds)
+    if inds.size > 0 and steps[0] > 0 and np.all(steps == steps[0]):
+        return slice(inds[0], inds[-1] + 1, steps[0])
+    return inds
+
+
+def _get_multi_axis_index(axis_inds, shape):
+    """
+    Build a single index into an array from indices along each axis.
+
+    Evenly spaced indices are converted to slices. If more than one axis
+    needs an index array, all the axes are combined with `np.ix_` so the
+    array is still only indexed once.
+
+    Parameters
+    ----------
+    axis_inds : list of array_like of int or None
+        Indices along each axis of the array, None means the whole axis.
+    shape : tuple of int
+        Shape of the array to index.
+
+    Returns
+    -------
+    tuple
+        Index for getting or setting elements of the array. It only contains
+        slices (so getting elements returns a view) if all the indices are
+        evenly spaced.
+
+    """
+    index = tuple(_inds_to_index(inds) for inds in axis_inds)
+    n_fancy = sum(not isinstance(ind, slice) for ind in index)
+    if n_fancy > 1:
+        index = np.ix_(
+            *[
+                np.arange(shape[axis])[ind] if isinstance(ind, slice) else ind
+                for axis, ind in enumerate(index)
+            ]
+        )
+
+    return index
+
+
 def uvcalibrate(
     uvdata,
     uvcal,
@@ -1544,6 +1715,7 @@ def uvcalibrate(
     Dterm_cal=False,
     delay_convention="minus",
     undo=False,
+    blt_chunk_size=None,
 ):
     """
     Calibrate a UVData object with a UVCal object.
@@ -1572,6 +1744,11 @@ def uvcalibrate(
     undo : bool, optional
         If True, undo the provided calibration. i.e. apply the calibration with
         flipped gain_convention. Flag propagation rules apply the same.
+    blt_chunk_size : int, optional
+        Number of baseline-times to calibrate at once. The gains for all
+        baselines and polarizations in a chunk are computed together, so this
+        sets the size of the temporary arrays. Defaults to calibrating all
+        baseline-times at once.
 
     Returns
     -------
@@ -1579,6 +1756,9 @@ def uvcalibrate(
         Returns if not inplace
 
     """
+    if blt_chunk_size is not None and blt_chunk_size < 1:
+        raise ValueError("blt_chunk_size must be a positive integer.")
+
     if not inplace:
         uvdata = uvdata.copy()
 
@@ -1600,42 +1780,83 @@ def uvcalibrate(
 
     # No D-term calibration
     else:
-        # iterate over keys
-        for key in uvdata.get_antpairpols():
-            # get indices for this key
-            blt_inds = uvdata.antpair2ind(key)
-            pol_ind = np.argmin(
-                np.abs(
-                    uvdata.polarization_array - polstr2num(key[2], uvdata.x_orientation)
+        # map the uvdata antennas and polarizations to gain array indices once
+        ant1_inds, ant1_found = _find_indices(uvcal.ant_array, uvdata.ant_1_array)
+        ant2_inds, ant2_found = _find_indices(uvcal.ant_array, uvdata.ant_2_array)
+
+        jones1_inds = np.full(uvdata.Npols, -1, dtype=int)
+        jones2_inds = np.full(uvdata.Npols, -1, dtype=int)
+        for pol_ind, pol in enumerate(uvdata.get_pols()):
+            if uvcal._has_key(jpol=pol[0]) and uvcal._has_key(jpol=pol[1]):
+                jones1_inds[pol_ind] = uvcal.jpol2ind(pol[0])
+                jones2_inds[pol_ind] = uvcal.jpol2ind(pol[1])
+        jones_present = jones1_inds >= 0
+        ants_present = ant1_found & ant2_found
+
+        # the calibration times are matched to the times of each baseline in
+        # the order they appear on the baseline-time axis
+        if uvcal.Ntimes == 1:
+            time_inds = np.zeros(uvdata.Nblts, dtype=int)
+        else:
+            time_inds, blt_counts = _index_in_groups(uvdata.baseline_array)
+            if np.any(jones_present) and np.any(
+                blt_counts[ants_present] != uvcal.Ntimes
+            ):
+                raise ValueError(
+                    "The number of times for each baseline in uvdata must match "
+                    "the number of times in uvcal (or uvcal must have only one time)."
                 )
-            )
 
-            # try to get gains for each antenna
-            ant1 = (key[0], key[2][0])
-            ant2 = (key[1], key[2][1])
-            if not uvcal._has_key(*ant1) or not uvcal._has_key(*ant2):
-                if flag_missing:
-                    uvdata.flag_array[blt_inds, 0, :, pol_ind] = True
+        # reorder the cal arrays to (Nants_data, Ntimes, Njones, Nfreqs) so that
+        # indexing with per-blt and per-pol index arrays gives (Nblts, Npols, Nfreqs)
+        uvcal_gains = np.moveaxis(uvcal.gain_array[:, 0], 1, 3)
+        uvcal_flags = np.moveaxis(uvcal.flag_array[:, 0], 1, 3)
+
+        mult_gains = uvcal.gain_convention == "multiply"
+        if undo:
+            mult_gains = not mult_gains
+
+        if blt_chunk_size is None:
+            blt_chunk_size = max(uvdata.Nblts, 1)
+        for chunk_start in range(0, uvdata.Nblts, blt_chunk_size):
+            blt_slice = slice(chunk_start, chunk_start + blt_chunk_size)
+            # shape (Nblts_chunk, 1, Npols) to broadcast against the data
+            cal_mask = (
+                ants_present[blt_slice, np.newaxis] & jones_present[np.newaxis, :]
+            )[:, np.newaxis, :]
+            # these are views into the uvdata arrays
+            data_chunk = uvdata.data_array[blt_slice, 0]
+            flag_chunk = uvdata.flag_array[blt_slice, 0]
+
+            if flag_missing:
+                flag_chunk |= ~cal_mask
+
+            if not np.any(cal_mask):
                 continue
-            gain = (
-                uvcal.get_gains(ant1) * np.conj(uvcal.get_gains(ant2))
-            ).T  # tranpose to match uvdata shape
-            flag = (uvcal.get_flags(ant1) | uvcal.get_flags(ant2)).T
+
+            time_chunk = time_inds[blt_slice, np.newaxis]
+            jones1_chunk = np.where(jones_present, jones1_inds, 0)[np.newaxis, :]
+            jones2_chunk = np.where(jones_present, jones2_inds, 0)[np.newaxis, :]
+            ind1 = (ant1_inds[blt_slice, np.newaxis], time_chunk, jones1_chunk)
+            ind2 = (ant2_inds[blt_slice, np.newaxis], time_chunk, jones2_chunk)
+
+            # swap axes to match uvdata shape (Nblts_chunk, Nfreqs, Npols)
+            gain = np.swapaxes(uvcal_gains[ind1] * np.conj(uvcal_gains[ind2]), 1, 2)
+            # gains for missing antennas or polarizations are not applied
+            gain[np.broadcast_to(~cal_mask, gain.shape)] = 1.0
 
             # propagate flags
             if prop_flags:
-                mask = np.isclose(gain, 0.0) | flag
+                flag = np.swapaxes(uvcal_flags[ind1] | uvcal_flags[ind2], 1, 2)
+                mask = (np.isclose(gain, 0.0) | flag) & cal_mask
                 gain[mask] = 1.0
-                uvdata.flag_array[blt_inds, 0, :, pol_ind] += mask
+                flag_chunk |= mask
 
             # apply to data
-            mult_gains = uvcal.gain_convention == "multiply"
-            if undo:
-                mult_gains = not mult_gains
             if mult_gains:
-                uvdata.data_array[blt_inds, 0, :, pol_ind] *= gain
+                data_chunk[...] = np.where(cal_mask, data_chunk * gain, data_chunk)
             else:
-                uvdata.data_array[blt_inds, 0, :, pol_ind] /= gain
+                data_chunk[...] = np.where(cal_mask, data_chunk / gain, data_chunk)
 
     # update attributes
     uvdata.history += "\nCalibrated with pyuvdata.utils.uvcalibrate."
@@ -1686,45 +1907,34 @@ def apply_uvflag(
     if uvf.mode != "flag":
         raise ValueError("UVFlag must be flag mode")
 
-    if not inplace:
-        uvd = uvd.copy()
-
-    # make a deepcopy by default b/c it is generally edited inplace downstream
-    uvf = uvf.copy()
-
-    # convert to baseline type
-    if uvf.type != "baseline":
-        # edits inplace
-        uvf.to_baseline(uvd, force_pol=force_pol)
-
-    else:
-        # make sure polarizations match or force_pol
-        uvd_pols, uvf_pols = (
-            uvd.polarization_array.tolist(),
-            uvf.polarization_array.tolist(),
-        )
-        if set(uvd_pols) != set(uvf_pols):
-            if uvf.Npols == 1 and force_pol:
-                # if uvf is 1pol we can make them match: also edits inplace
-                uvf.polarization_array = uvd.polarization_array
-                uvf.Npols = len(uvf.polarization_array)
-                uvf_pols = uvf.polarization_array.tolist()
-
-            else:
-                raise ValueError("Input uvf and uvd polarizations do not match")
-
-        # make sure polarization ordering is correct: also edits inplace
-        uvf.polarization_array = uvf.polarization_array[
-            [uvd_pols.index(pol) for pol in uvf_pols]
-        ]
+    # make sure polarizations match or force_pol
+    uvd_pols, uvf_pols = (
+        uvd.polarization_array.tolist(),
+        uvf.polarization_array.tolist(),
+    )
+    if uvf.type == "baseline":
+        if set(uvd_pols) != set(uvf_pols) and not (uvf.Npols == 1 and force_pol):
+            raise ValueError("Input uvf and uvd polarizations do not match")
+    elif not (force_pol and len(uvf_pols) == 1) and uvd_pols != uvf_pols:
+        if len(uvf_pols) == 1:
+            raise ValueError(
+                "Polarizations do not match. Try keyword force_pol"
+                + " if you wish to broadcast to all polarizations."
+            )
+        else:
+            raise ValueError("Polarizations could not be made to match.")
 
     # check time and freq shapes match: if Ntimes or Nfreqs is 1, allow
     # implicit broadcasting
     if uvf.Ntimes == 1:
         mismatch_times = False
     elif uvf.Ntimes == uvd.Ntimes:
-        tdiff = np.unique(uvf.time_array) - np.unique(uvd.time_array)
-        mismatch_times = np.any(tdiff > np.max(np.abs(uvf._time_array.tols)))
+        if uvf.type == "baseline":
+            tdiff = np.unique(uvf.time_array) - np.unique(uvd.time_array)
+            mismatch_times = np.any(tdiff > np.max(np.abs(uvf._time_array.tols)))
+        else:
+            # waterfall and antenna flags are matched to the uvd times below
+            mismatch_times = False
     else:
         mismatch_times = True
     if mismatch_times:
@@ -1740,22 +1950,73 @@ def apply_uvflag(
     if mismatch_freqs:
         raise ValueError("UVFlag and UVData have mismatched frequency arrays.")
 
+    if not inplace:
+        uvd = uvd.copy()
+
     # unflag if desired
     if unflag_first:
         uvd.flag_array[:] = False
 
-    # iterate over antpairs and apply flags: TODO need to be able to handle
-    # conjugated antpairs
-    uvf_antpairs = uvf.get_antpairs()
-    for ap in uvd.get_antpairs():
-        uvd_ap_inds = uvd.antpair2ind(ap)
-        if ap not in uvf_antpairs:
-            if flag_missing:
-                uvd.flag_array[uvd_ap_inds] = True
-            continue
-        uvf_ap_inds = uvf.antpair2ind(*ap)
-        # addition of boolean is OR
-        uvd.flag_array[uvd_ap_inds] += uvf.flag_array[uvf_ap_inds]
+    # the flags are gathered onto the uvd baseline-time axis with fancy
+    # indexing, broadcasting any length 1 frequency or polarization axes.
+    if uvf.type == "waterfall":
+        # flags only apply to the uvd times that are in the waterfall
+        time_inds, time_found = _find_indices(np.unique(uvf.time_array), uvd.time_array)
+        uvd.flag_array[time_found] |= uvf.flag_array[time_inds[time_found], np.newaxis]
+
+    elif uvf.type == "antenna":
+        # baseline-times with an antenna or time missing from uvf are flagged
+        ant1_inds, ant1_found = _find_indices(uvf.ant_array, uvd.ant_1_array)
+        ant2_inds, ant2_found = _find_indices(uvf.ant_array, uvd.ant_2_array)
+        time_inds, time_found = _find_indices(uvf.time_array, uvd.time_array)
+        blt_found = ant1_found & ant2_found & time_found
+        uvd.flag_array[~blt_found] = True
+        # put the time axis second so the gathered flags have the uvd shape
+        ant_flags = np.moveaxis(uvf.flag_array, 3, 1)
+        time_inds = time_inds[blt_found]
+        uvd.flag_array[blt_found] |= (
+            ant_flags[ant1_inds[blt_found], time_inds]
+            | ant_flags[ant2_inds[blt_found], time_inds]
+        )
+
+    else:
+        # match antpairs (TODO: need to be able to handle conjugated antpairs)
+        # and then the baseline-times of each antpair in order
+        _, antpair_ids = np.unique(
+            np.concatenate(
+                (
+                    np.stack((uvd.ant_1_array, uvd.ant_2_array), axis=1),
+                    np.stack((uvf.ant_1_array, uvf.ant_2_array), axis=1),
+                )
+            ),
+            axis=0,
+            return_inverse=True,
+        )
+        antpair_ids = antpair_ids.ravel()
+        uvd_ids, uvf_ids = antpair_ids[: uvd.Nblts], antpair_ids[uvd.Nblts :]
+        uvd_rank, uvd_counts = _index_in_groups(uvd_ids)
+
+        uvf_order = np.argsort(uvf_ids, kind="stable")
+        uvf_counts = np.bincount(uvf_ids, minlength=antpair_ids.max() + 1)
+        uvf_starts = np.cumsum(uvf_counts) - uvf_counts
+
+        uvf_blt_counts = uvf_counts[uvd_ids]
+        antpair_found = uvf_blt_counts > 0
+        if np.any(
+            antpair_found & (uvf_blt_counts != 1) & (uvf_blt_counts != uvd_counts)
+        ):
+            raise ValueError(
+                "The number of times for each antpair in uvf must match uvd "
+                "(or uvf must have only one time)."
+            )
+        if flag_missing:
+            uvd.flag_array[~antpair_found] = True
+        # antpairs with a single uvf time are broadcast to all uvd times
+        uvf_offset = np.where(uvf_blt_counts == 1, 0, uvd_rank)
+        uvf_inds = uvf_order[
+            uvf_starts[uvd_ids[antpair_found]] + uvf_offset[antpair_found]
+        ]
+        uvd.flag_array[antpair_found] |= uvf.flag_array[uvf_inds]
 
     uvd.history += "\nFlagged with pyuvdata.utils.apply_uvflags."
 
@@ -353,7 +353,14 @@ class UVBase(object):
                                     )
                         else:
                             # Array
-                            if not isinstance(param.value.item(0), param.expected_type):
+                            if isinstance(param.value, np.ndarray):
+                                first_item = param.value.item(0)
+                            else:
+                                # lazily loaded (e.g. dask) array, only use the
+                                # dtype to avoid reading any data
+                                value_dtype = param.value.dtype
+                                first_item = np.zeros(1, dtype=value_dtype).item()
+                            if not isinstance(first_item, param.expected_type):
                                 raise ValueError(
                                     "UVParameter " + p + " is not the appropriate"
                                     " type. Is: "
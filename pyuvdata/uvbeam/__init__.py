@@ -4,3 +4,4 @@
 
 """Init file for UVBeam."""
 from .uvbeam import *  # noqa
+from .beam_interpolator import *  # noqa
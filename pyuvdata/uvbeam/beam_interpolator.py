@@ -0,0 +1,318 @@
+# -*- mode: python; coding: utf-8 -*-
+# Copyright (c) 2020 Radio Astronomy Software Group
+# Licensed under the 2-clause BSD License
+
+"""Reusable interpolation plans for UVBeam objects."""
+from collections import OrderedDict
+
+import numpy as np
+from scipy import interpolate
+from astropy import units
+from astropy.coordinates import Angle
+
+__all__ = ["BeamInterpolator"]
+
+
+class BeamInterpolator(object):
+    """
+    Interpolate a UVBeam to many sets of positions, reusing precomputed tables.
+
+    For az/za beams the splines for each frequency are fit once and reused on
+    every call. For HEALPix beams the bilinear interpolation weights are
+    calculated once per set of positions and applied to all frequencies,
+    polarizations and vector axes together. The per-frequency splines or beam
+    maps are kept in a least recently used cache so the memory use is bounded.
+
+    The UVBeam should not be modified while the interpolator is in use.
+
+    Parameters
+    ----------
+    uvbeam : UVBeam object
+        Beam to interpolate, the `interpolation_function` and
+        `freq_interp_kind` attributes must be set.
+    polarizations : list of str
+        polarizations to interpolate if beam_type is 'power'.
+        Default is all polarizations in uvbeam.polarization_array.
+    spline_opts : dict
+        Provide options to numpy.RectBivariateSpline. This includes spline
+        order parameters `kx` and `ky`, and smoothing parameter `s`.
+        Only applies for `az_za_simple` interpolation.
+    freq_interp_tol : float
+        Frequency distance tolerance [Hz] of nearest neighbors. Frequencies
+        within the tolerance of a beam frequency use the beam at that frequency,
+        others are interpolated with `uvbeam.freq_interp_kind`. Unlike
+        `UVBeam.interp`, this is decided for each frequency separately.
+    max_cached_freqs : int
+        Maximum number of frequencies to keep splines or beam maps for. The
+        least recently used frequencies are dropped first.
+
+    Raises
+    ------
+    ValueError
+        If the interpolation function or frequency interpolation kind are not
+        set on uvbeam, or if a HEALPix beam does not cover the full sky in
+        order.
+
+    """
+
+    def __init__(
+        self,
+        uvbeam,
+        polarizations=None,
+        spline_opts=None,
+        freq_interp_tol=1.0,
+        max_cached_freqs=16,
+    ):
+        """Set up the interpolation plan."""
+        if uvbeam.interpolation_function is None:
+            raise ValueError("interpolation_function must be set on object first")
+        if uvbeam.freq_interp_kind is None:
+            raise ValueError("freq_interp_kind must be set on object first")
+        if max_cached_freqs < 1:
+            raise ValueError("max_cached_freqs must be a positive integer.")
+
+        self.uvbeam = uvbeam
+        self.freq_interp_tol = freq_interp_tol
+        self.max_cached_freqs = max_cached_freqs
+        if spline_opts is None or not isinstance(spline_opts, dict):
+            spline_opts = {}
+        self.spline_opts = spline_opts
+
+        self.interp_func = uvbeam.interpolation_function_dict[
+            uvbeam.interpolation_function
+        ]["func"]
+        if self.interp_func == "_interp_az_za_rect_spline":
+            if uvbeam.pixel_coordinate_system != "az_za":
+                raise ValueError('pixel_coordinate_system must be "az_za"')
+            # only the grid is needed here so pass a single element of the data
+            self._theta_use, self._phi_use, _ = uvbeam._get_az_za_spline_grid(
+                uvbeam.data_array[:1, :1, :1, :1]
+            )
+        else:
+            try:
+                from astropy_healpix import HEALPix
+            except ImportError as e:  # pragma: no cover
+                raise ImportError(
+                    "astropy_healpix is not installed but is "
+                    "required for healpix functionality. "
+                    'Install "astropy-healpix" using conda or pip.'
+                ) from e
+
+            if uvbeam.pixel_coordinate_system != "healpix":
+                raise ValueError('pixel_coordinate_system must be "healpix"')
+            if not uvbeam.Npixels == 12 * uvbeam.nside ** 2:
+                raise ValueError(
+                    "simple healpix interpolation requires full sky healpix maps."
+                )
+            if not np.max(np.abs(np.diff(uvbeam.pixel_array))) == 1:
+                raise ValueError(
+                    "simple healpix interpolation requires healpix pixels to be "
+                    "in order."
+                )
+            self._hp_obj = HEALPix(nside=uvbeam.nside, order=uvbeam.ordering)
+            self._healpix_weights = None
+
+        self.Npol_feeds, self.pol_inds = uvbeam._get_interp_pol_inds(polarizations)
+        self._freq_cache = OrderedDict()
+
+    def _get_freq_data(self, freq):
+        """
+        Get the beam at a single frequency.
+
+        Parameters
+        ----------
+        freq : float
+            Frequency in Hz.
+
+        Returns
+        -------
+        array_like of float or complex
+            The beam data, shape (Naxes_vec, Nspws, Npol_feeds, Npixels or
+            (Naxis2, Naxis1)).
+
+        """
+        nearest_dist = np.min(np.abs(self.uvbeam.freq_array - freq))
+        if nearest_dist < self.freq_interp_tol:
+            kind = "nearest"
+        else:
+            kind = self.uvbeam.freq_interp_kind
+        freq_data, _ = self.uvbeam._interp_freq(np.array([freq]), kind=kind)
+
+        return freq_data[:, :, self.pol_inds, 0]
+
+    def _get_freq_plan(self, freq):
+        """
+        Get the splines or beam map for a frequency, using the cache if possible.
+
+        Parameters
+        ----------
+        freq : float
+            Frequency in Hz.
+
+        Returns
+        -------
+        dict or array_like of float or complex
+            For az/za beams, a dict of (real, imaginary) splines keyed on
+            (Naxes_vec index, Nspws index, polarization index), the imaginary
+            spline is None for real beams. For HEALPix beams, the beam data
+            at this frequency.
+
+        """
+        if freq in self._freq_cache:
+            self._freq_cache.move_to_end(freq)
+            return self._freq_cache[freq]
+
+        freq_data = self._get_freq_data(freq)
+        if self.interp_func == "_interp_az_za_rect_spline":
+            _, _, data_use = self.uvbeam._get_az_za_spline_grid(
+                freq_data[:, :, :, np.newaxis]
+            )
+            data_use = data_use[:, :, :, 0]
+            plan = {}
+            for index in np.ndindex(data_use.shape[:3]):
+                if np.iscomplexobj(data_use):
+                    # interpolate real and imaginary parts separately
+                    plan[index] = (
+                        interpolate.RectBivariateSpline(
+                            self._theta_use,
+                            self._phi_use,
+                            data_use[index].real,
+                            **self.spline_opts,
+                        ),
+                        interpolate.RectBivariateSpline(
+                            self._theta_use,
+                            self._phi_use,
+                            data_use[index].imag,
+                            **self.spline_opts,
+                        ),
+                    )
+                else:
+                    plan[index] = (
+                        interpolate.RectBivariateSpline(
+                            self._theta_use,
+                            self._phi_use,
+                            data_use[index],
+                            **self.spline_opts,
+                        ),
+                        None,
+                    )
+        else:
+            plan = freq_data
+
+        self._freq_cache[freq] = plan
+        if len(self._freq_cache) > self.max_cached_freqs:
+            self._freq_cache.popitem(last=False)
+
+        return plan
+
+    def _get_healpix_weights(self, az_array, za_array):
+        """
+        Get the bilinear interpolation pixels and weights for a set of positions.
+
+        The weights for the most recent set of positions are kept for reuse.
+
+        Parameters
+        ----------
+        az_array : array of float
+            Azimuth values in radians.
+        za_array : array of float
+            Zenith angle values in radians.
+
+        Returns
+        -------
+        indices : array of int
+            HEALPix pixel indices, shape (4, az_array.size).
+        weights : array of float
+            Bilinear weights, shape (4, az_array.size).
+
+        """
+        key = (az_array.tobytes(), za_array.tobytes())
+        if self._healpix_weights is None or self._healpix_weights[0] != key:
+            lat_array = Angle(np.pi / 2, units.radian) - Angle(za_array, units.radian)
+            lon_array = Angle(az_array, units.radian)
+            indices, weights = self._hp_obj.bilinear_interpolation_weights(
+                lon_array, lat_array
+            )
+            self._healpix_weights = (key, indices, weights)
+
+        return self._healpix_weights[1:]
+
+    def interp(self, az_array, za_array, freq_array=None):
+        """
+        Interpolate the beam to a set of positions and frequencies.
+
+        Parameters
+        ----------
+        az_array : array_like of floats
+            Azimuth values to interpolate to in radians, specifying the azimuth
+            positions for every interpolation point (same length as `za_array`).
+        za_array : array_like of floats
+            Zenith values to interpolate to in radians, specifying the zenith
+            positions for every interpolation point (same length as `az_array`).
+        freq_array : array_like of floats, optional
+            Frequency values to interpolate to. Defaults to the beam frequencies.
+
+        Returns
+        -------
+        interp_data : array_like of float or complex
+            The array of interpolated data values,
+            shape: (Naxes_vec, Nspws, Nfeeds or Npols, freq_array.size,
+            az_array.size)
+        interp_basis_vector : array_like of float
+            The array of interpolated basis vectors,
+            shape: (Naxes_vec, Ncomponents_vec, az_array.size)
+
+        Raises
+        ------
+        ValueError
+            If az_array and za_array are not 1D arrays of the same shape, or if
+            any interpolation location is outside of the beam coverage or any
+            frequency is outside of the beam frequency range.
+
+        """
+        az_array = np.asarray(az_array, dtype=np.float64)
+        za_array = np.asarray(za_array, dtype=np.float64)
+        if az_array.ndim != 1 or az_array.shape != za_array.shape:
+            raise ValueError("az_array and za_array must be 1D and the same shape.")
+        if freq_array is None:
+            freq_array = self.uvbeam.freq_array[0]
+        freq_array = np.atleast_1d(freq_array)
+
+        npoints = az_array.size
+        interp_basis_vector = self.uvbeam._get_interp_basis_vector(npoints)
+
+        if np.iscomplexobj(self.uvbeam.data_array):
+            data_type = np.complex
+        else:
+            data_type = np.float
+        interp_data = np.zeros(
+            (
+                self.uvbeam.Naxes_vec,
+                self.uvbeam.Nspws,
+                self.Npol_feeds,
+                freq_array.size,
+                npoints,
+            ),
+            dtype=data_type,
+        )
+
+        if self.interp_func == "_interp_az_za_rect_spline":
+            self.uvbeam._check_az_za_coverage(
+                az_array, za_array, self._theta_use, self._phi_use
+            )
+            for freq_i, freq in enumerate(freq_array):
+                plan = self._get_freq_plan(freq)
+                for (index0, index1, index2), (real_lut, imag_lut) in plan.items():
+                    values = real_lut(za_array, az_array, grid=False)
+                    if imag_lut is not None:
+                        values = values + 1j * imag_lut(za_array, az_array, grid=False)
+                    interp_data[index0, index1, index2, freq_i] = values
+        else:
+            indices, weights = self._get_healpix_weights(az_array, za_array)
+            for freq_i, freq in enumerate(freq_array):
+                freq_data = self._get_freq_plan(freq)
+                interp_data[:, :, :, freq_i] = np.sum(
+                    freq_data[..., indices] * weights, axis=-2
+                )
+
+        return interp_data, interp_basis_vector
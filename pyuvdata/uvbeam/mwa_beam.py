@@ -2,6 +2,7 @@
 # Copyright (c) 2019 Radio Astronomy Software Group
 # Licensed under the 2-clause BSD License
 """Read in the Sujinto et al. full embedded element MWA Beam."""
+import functools
 import warnings
 
 import numpy as np
@@ -189,6 +190,41 @@ def P1sin_array(nmax, theta):
     return P_sin.transpose(), P1.transpose()
 
 
+@functools.lru_cache(maxsize=8)
+def _P1sin_array_cached(nmax, theta_bytes):
+    """
+    Calculate `P1sin_array` with a cache keyed on nmax and the theta grid.
+
+    The tables for a smaller nmax are the leading nmax ** 2 + 2 * nmax
+    columns of the tables for a larger nmax, so a single call with the
+    largest nmax needed can be sliced for all frequencies and polarizations.
+
+    Parameters
+    ----------
+    nmax : int
+        Maximum n from FEKO Q1mn and Q2mn, n must be >=1
+    theta_bytes : bytes
+        The theta grid in radians as the bytes of a float64 array, so that
+        it can be used as a cache key.
+
+    Returns
+    -------
+    P_sin : array of float
+        Read-only array of P_{n}^{abs(m)}(cos(theta))/sin(theta) with FEKO
+        order M,N. Shape (theta.size, nmax ** 2 + 2 * nmax).
+    P1 : array of float
+        Read-only array of P_{n}^{abs(m)+1}(cos(theta)) with FEKO order M,N.
+        Shape (theta.size, nmax ** 2 + 2 * nmax).
+
+    """
+    theta = np.frombuffer(theta_bytes, dtype=np.float64)
+    P_sin, P1 = P1sin_array(nmax, theta)
+    P_sin.setflags(write=False)
+    P1.setflags(write=False)
+
+    return P_sin, P1
+
+
 class MWABeam(UVBeam):
     """
     Defines an MWA-specific subclass of UVBeam for representing MWA beams.
@@ -404,6 +440,21 @@ class MWABeam(UVBeam):
         phi_arr = np.pi / 2 - phi_arr  # Convert to East through North (FEKO coords)
         phi_arr[phi_arr < 0] += 2 * np.pi  # 360 wrap
 
+        # The theta and phi dependent tables only depend on nmax, so calculate
+        # them once for the largest nmax and slice them for each pol and freq.
+        nmax_all = int(
+            max(
+                np.max(beam_modes[pol][freq]["N"])
+                for pol in pol_names
+                for freq in freqs_hz
+            )
+        )
+        P_sin_all, P1_all = _P1sin_array_cached(
+            nmax_all, np.ascontiguousarray(theta_arr, dtype=np.float64).tobytes()
+        )
+        phi_comp_all = np.exp(1.0j * np.outer(phi_arr, range(-nmax_all, nmax_all + 1)))
+        cos_theta = np.cos(theta_arr)
+
         for pol_i, pol in enumerate(pol_names):
             for freq_i, freq in enumerate(freqs_hz):
                 M = beam_modes[pol][freq]["M"]
@@ -434,12 +485,12 @@ class MWABeam(UVBeam):
                 # T and P are the sky polarisations theta and phi
                 # theta and phi are direction coordinates
 
-                phi_comp = np.ascontiguousarray(
-                    np.exp(1.0j * np.outer(phi_arr, range(-nmax, nmax + 1)))
-                )
+                phi_comp = phi_comp_all[:, nmax_all - nmax : nmax_all + nmax + 1]
 
-                (P_sin, P1) = P1sin_array(nmax, theta_arr)
-                M_u = np.outer(np.cos(theta_arr), np.abs(M))
+                n_modes = nmax ** 2 + 2 * nmax
+                P_sin = P_sin_all[:, :n_modes]
+                P1 = P1_all[:, :n_modes]
+                M_u = np.outer(cos_theta, np.abs(M))
                 phi_const = C_MN * MabsM / (N * (N + 1)) ** 0.5
 
                 emn_T = (
@@ -451,23 +502,18 @@ class MWABeam(UVBeam):
                     * phi_const
                 )
 
-                # Use a matrix multiplication to calculate Emn_P and Emn_T.
-                # Sum results of Emn_P and emn_T for each unique M
-                emn_P_sum = np.zeros(
-                    (len(theta_arr), 2 * nmax + 1), dtype=np.complex128
+                # Sum emn_T and emn_P for each unique M with a matrix product
+                # against a mode to M selection matrix, then sum over M with a
+                # matrix product against the phi terms, doing both sky
+                # polarisations at once.
+                m_select = (M[:, np.newaxis] == np.arange(-nmax, nmax + 1)).astype(
+                    np.complex128
                 )
-                emn_T_sum = np.zeros(
-                    (len(theta_arr), 2 * nmax + 1), dtype=np.complex128
-                )
-                for m in range(-nmax, nmax + 1):
-                    emn_P_sum[:, m + nmax] = np.sum(emn_P[:, M == m], axis=1)
-                    emn_T_sum[:, m + nmax] = np.sum(emn_T[:, M == m], axis=1)
-
-                Sigma_P = np.inner(phi_comp, emn_P_sum)
-                Sigma_T = np.inner(phi_comp, emn_T_sum)
+                emn_sum = np.matmul(np.stack((emn_T, -emn_P)), m_select)
 
-                jones[pol_i, 0, freq_i] = Sigma_T
-                jones[pol_i, 1, freq_i] = -Sigma_P
+                jones[pol_i, :, freq_i] = np.matmul(
+                    phi_comp, np.swapaxes(emn_sum, 1, 2)
+                )
 
         return jones
 
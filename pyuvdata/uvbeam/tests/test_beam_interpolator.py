@@ -0,0 +1,134 @@
+# -*- mode: python; coding: utf-8 -*-
+# Copyright (c) 2020 Radio Astronomy Software Group
+# Licensed under the 2-clause BSD License
+
+"""Tests for the BeamInterpolator object."""
+import os
+
+import numpy as np
+import pytest
+
+from pyuvdata import UVBeam
+from pyuvdata.uvbeam import BeamInterpolator
+from pyuvdata.data import DATA_PATH
+
+filename = os.path.join(DATA_PATH, "mwa_full_EE_test.h5")
+
+
+@pytest.fixture(scope="module")
+def mwa_beam_master():
+    beam = UVBeam()
+    beam.read_mwa_beam(filename, pixels_per_deg=1)
+    beam.interpolation_function = "az_za_simple"
+
+    return beam
+
+
+@pytest.fixture(scope="function")
+def mwa_beam(mwa_beam_master):
+    return mwa_beam_master.copy()
+
+
+@pytest.fixture(scope="module")
+def interp_points():
+    rng = np.random.RandomState(0)
+    az_array = rng.uniform(0, 2 * np.pi, 200)
+    za_array = rng.uniform(0, np.pi / 2, 200)
+
+    return az_array, za_array
+
+
+@pytest.mark.parametrize("beam_type", ["efield", "power"])
+@pytest.mark.parametrize("interp_freqs", [False, True])
+def test_interpolator_matches_interp(mwa_beam, interp_points, beam_type, interp_freqs):
+    beam = mwa_beam
+    polarizations = None
+    if beam_type == "power":
+        beam.efield_to_power()
+        polarizations = ["xx", "yy"]
+    az_array, za_array = interp_points
+    if interp_freqs:
+        freq_array = np.linspace(beam.freq_array.min(), beam.freq_array.max(), 5)
+    else:
+        freq_array = None
+
+    interp_data, interp_basis_vector = beam.interp(
+        az_array=az_array,
+        za_array=za_array,
+        freq_array=freq_array,
+        polarizations=polarizations,
+    )
+
+    beam_interp = BeamInterpolator(beam, polarizations=polarizations)
+    for _ in range(2):
+        interp_data2, interp_basis_vector2 = beam_interp.interp(
+            az_array, za_array, freq_array=freq_array
+        )
+        np.testing.assert_allclose(interp_data2, interp_data)
+        if interp_basis_vector is None:
+            assert interp_basis_vector2 is None
+        else:
+            np.testing.assert_array_equal(interp_basis_vector2, interp_basis_vector)
+
+
+def test_interpolator_freq_cache(mwa_beam, interp_points):
+    az_array, za_array = interp_points
+    beam_interp = BeamInterpolator(mwa_beam, max_cached_freqs=2)
+
+    interp_data, _ = beam_interp.interp(az_array, za_array)
+    assert list(beam_interp._freq_cache.keys()) == list(mwa_beam.freq_array[0, 1:])
+
+    # using a cached frequency makes it the most recently used
+    beam_interp.interp(az_array, za_array, freq_array=mwa_beam.freq_array[0, 1])
+    assert list(beam_interp._freq_cache.keys()) == list(mwa_beam.freq_array[0, [2, 1]])
+
+    # evicted frequencies are recalculated
+    interp_data2, _ = beam_interp.interp(az_array, za_array)
+    np.testing.assert_array_equal(interp_data2, interp_data)
+
+
+def test_interpolator_errors(mwa_beam, interp_points):
+    az_array, za_array = interp_points
+
+    beam = mwa_beam.copy()
+    beam.interpolation_function = None
+    with pytest.raises(ValueError, match="interpolation_function must be set"):
+        BeamInterpolator(beam)
+
+    beam = mwa_beam.copy()
+    beam.freq_interp_kind = None
+    with pytest.raises(ValueError, match="freq_interp_kind must be set"):
+        BeamInterpolator(beam)
+
+    with pytest.raises(ValueError, match="max_cached_freqs must be a positive"):
+        BeamInterpolator(mwa_beam, max_cached_freqs=0)
+
+    beam_interp = BeamInterpolator(mwa_beam)
+    with pytest.raises(ValueError, match="az_array and za_array must be 1D"):
+        beam_interp.interp(az_array, za_array[:-1])
+
+    with pytest.raises(ValueError, match="outside of the UVBeam pixel coverage"):
+        beam_interp.interp(az_array, za_array + np.pi / 2)
+
+    with pytest.raises(ValueError, match="outside of the UVBeam freq_array range"):
+        beam_interp.interp(az_array, za_array, freq_array=np.array([1e6]))
+
+
+def test_interpolator_healpix(cst_efield_2freq_cut_healpix):
+    beam = cst_efield_2freq_cut_healpix
+    rng = np.random.RandomState(0)
+    az_array = rng.uniform(0, 2 * np.pi, 50)
+    za_array = rng.uniform(0, np.pi / 4, 50)
+    freq_array = np.linspace(123e6, 150e6, 4)
+
+    interp_data, interp_basis_vector = beam.interp(
+        az_array=az_array, za_array=za_array, freq_array=freq_array
+    )
+
+    beam_interp = BeamInterpolator(beam)
+    for _ in range(2):
+        interp_data2, interp_basis_vector2 = beam_interp.interp(
+            az_array, za_array, freq_array=freq_array
+        )
+        np.testing.assert_allclose(interp_data2, interp_data)
+        np.testing.assert_array_equal(interp_basis_vector2, interp_basis_vector)
@@ -8,7 +8,7 @@ import numpy as np
 
 from pyuvdata.data import DATA_PATH
 from pyuvdata import UVBeam
-from pyuvdata.uvbeam.mwa_beam import P1sin, P1sin_array
+from pyuvdata.uvbeam.mwa_beam import P1sin, P1sin_array, _P1sin_array_cached
 import pyuvdata.tests as uvtest
 import pyuvdata.utils as uvutils
 
@@ -98,6 +98,28 @@ def test_p1sin_array():
     assert np.allclose(P_sin_orig, P_sin.T)
 
 
+def test_p1sin_array_cached():
+    pixels_per_deg = 5
+    nmax = 10
+    n_theta = np.floor(90 * pixels_per_deg) + 1
+    theta_arr = np.deg2rad(np.arange(0, n_theta) / pixels_per_deg)
+
+    _P1sin_array_cached.cache_clear()
+    P_sin, P1 = _P1sin_array_cached(nmax, theta_arr.tobytes())
+    P_sin2, P1_2 = _P1sin_array_cached(nmax, theta_arr.tobytes())
+    assert P_sin2 is P_sin
+    assert P1_2 is P1
+    assert _P1sin_array_cached.cache_info().hits == 1
+    assert not P_sin.flags.writeable
+
+    # the tables for smaller nmax are the leading columns of the larger tables
+    for nmax_small in [1, 4, nmax]:
+        n_modes = nmax_small ** 2 + 2 * nmax_small
+        P_sin_small, P1_small = P1sin_array(nmax_small, theta_arr)
+        np.testing.assert_array_equal(P_sin[:, :n_modes], P_sin_small)
+        np.testing.assert_array_equal(P1[:, :n_modes], P1_small)
+
+
 def test_bad_amps():
     beam1 = UVBeam()
 
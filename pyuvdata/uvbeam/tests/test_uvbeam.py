@@ -452,6 +452,24 @@ def test_efield_to_power(cst_efield_2freq_cut, cst_power_2freq_cut, tmp_path):
     pytest.raises(ValueError, efield_beam.efield_to_power)
 
 
+@pytest.mark.parametrize("conversion", ["power", "power_basis", "pstokes"])
+def test_efield_conversion_freq_chunks(cst_efield_2freq_cut, conversion):
+    efield_beam = cst_efield_2freq_cut
+    if conversion == "pstokes":
+        convert_func = efield_beam.efield_to_pstokes
+        kwargs = {}
+    else:
+        convert_func = efield_beam.efield_to_power
+        kwargs = {"keep_basis_vector": conversion == "power_basis"}
+
+    full_beam = convert_func(inplace=False, **kwargs)
+    chunked_beam = convert_func(inplace=False, freq_chunk_size=1, **kwargs)
+    assert full_beam == chunked_beam
+
+    with pytest.raises(ValueError, match="freq_chunk_size must be a positive integer"):
+        convert_func(inplace=False, freq_chunk_size=0, **kwargs)
+
+
 def test_freq_interpolation(cst_power_2freq):
     power_beam = cst_power_2freq
 
@@ -778,6 +778,7 @@ class UVBeam(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         inplace=True,
+        freq_chunk_size=None,
     ):
         """
         Convert E-field beam to power beam.
@@ -803,8 +804,14 @@ class UVBeam(UVBase):
             after converting to power.
         check_extra : bool
             Option to check optional parameters as well as required ones.
+        freq_chunk_size : int, optional
+            Number of frequencies to convert at once, which bounds the size of
+            the temporary arrays. Defaults to converting all frequencies at once.
 
         """
+        if freq_chunk_size is not None and freq_chunk_size < 1:
+            raise ValueError("freq_chunk_size must be a positive integer.")
+
         if inplace:
             beam_object = self
         else:
@@ -848,44 +855,35 @@ class UVBeam(UVBase):
             beam_object._data_array.expected_shape(beam_object), dtype=np.complex
         )
 
-        if keep_basis_vector:
-            for pol_i, pair in enumerate(feed_pol_order):
-                power_data[:, :, pol_i] = efield_data[:, :, pair[0]] * np.conj(
-                    efield_data[:, :, pair[1]]
+        if not keep_basis_vector:
+            if efield_naxes_vec != 2:
+                raise ValueError(
+                    "Conversion to power with 3-vector efields "
+                    "is not currently supported because we have "
+                    "no examples to work with."
                 )
+            # The power is sum_ab E_a conj(E_b) sum_c B_ac B_bc, where a and b
+            # are the vector axes and c the basis vector components.
+            basis_product = np.einsum(
+                "ac...,bc...->ab...",
+                beam_object.basis_vector_array,
+                beam_object.basis_vector_array,
+            )
 
-        else:
-            for pol_i, pair in enumerate(feed_pol_order):
-                if efield_naxes_vec == 2:
-                    for comp_i in range(2):
-                        power_data[0, :, pol_i] += (
-                            (
-                                efield_data[0, :, pair[0]]
-                                * np.conj(efield_data[0, :, pair[1]])
-                            )
-                            * beam_object.basis_vector_array[0, comp_i] ** 2
-                            + (
-                                efield_data[1, :, pair[0]]
-                                * np.conj(efield_data[1, :, pair[1]])
-                            )
-                            * beam_object.basis_vector_array[1, comp_i] ** 2
-                            + (
-                                efield_data[0, :, pair[0]]
-                                * np.conj(efield_data[1, :, pair[1]])
-                                + efield_data[1, :, pair[0]]
-                                * np.conj(efield_data[0, :, pair[1]])
-                            )
-                            * (
-                                beam_object.basis_vector_array[0, comp_i]
-                                * beam_object.basis_vector_array[1, comp_i]
-                            )
-                        )
-                else:
-                    raise ValueError(
-                        "Conversion to power with 3-vector efields "
-                        "is not currently supported because we have "
-                        "no examples to work with."
-                    )
+        feed_inds1 = [pair[0] for pair in feed_pol_order]
+        feed_inds2 = [pair[1] for pair in feed_pol_order]
+        if freq_chunk_size is None:
+            freq_chunk_size = beam_object.Nfreqs
+        for freq_start in range(0, beam_object.Nfreqs, freq_chunk_size):
+            freq_slice = slice(freq_start, freq_start + freq_chunk_size)
+            efield1 = efield_data[:, :, feed_inds1, freq_slice]
+            efield2 = np.conj(efield_data[:, :, feed_inds2, freq_slice])
+            if keep_basis_vector:
+                power_data[:, :, :, freq_slice] = efield1 * efield2
+            else:
+                power_data[0, :, :, freq_slice] = np.einsum(
+                    "a...,ab...,b...->...", efield1, basis_product, efield2,
+                )
 
         power_data = np.real_if_close(power_data, tol=10)
 
@@ -985,6 +983,7 @@ class UVBeam(UVBase):
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
+        freq_chunk_size=None,
     ):
         """
         Convert E-field to pseudo-stokes power.
@@ -1008,8 +1007,14 @@ class UVBeam(UVBase):
             after converting to power.
         check_extra : bool
             Option to check optional parameters as well as required ones.
+        freq_chunk_size : int, optional
+            Number of frequencies to convert at once, which bounds the size of
+            the temporary arrays. Defaults to converting all frequencies at once.
 
         """
+        if freq_chunk_size is not None and freq_chunk_size < 1:
+            raise ValueError("freq_chunk_size must be a positive integer.")
+
         if inplace:
             beam_object = self
         else:
@@ -1041,18 +1046,24 @@ class UVBeam(UVBase):
             ]
         )
 
-        for fq_i in range(Nfreqs):
-            jones = np.zeros((_sh[-1], 2, 2), dtype=np.complex)
-            pol_strings = ["pI", "pQ", "pU", "pV"]
-            jones[:, 0, 0] = efield_data[0, 0, 0, fq_i, :]
-            jones[:, 0, 1] = efield_data[0, 0, 1, fq_i, :]
-            jones[:, 1, 0] = efield_data[1, 0, 0, fq_i, :]
-            jones[:, 1, 1] = efield_data[1, 0, 1, fq_i, :]
-
-            for pol_i in range(len(pol_strings)):
-                power_data[:, :, pol_i, fq_i, :] = self._construct_mueller(
-                    jones, pol_i, pol_i
-                )
+        # The jones matrices are indexed by (Naxes_vec, Nfeeds), the Mueller
+        # components for all pseudo-stokes pols are calculated together.
+        jones = efield_data[:2, 0, :2]
+        pauli_mats = np.array(
+            [self._stokes_matrix(pol_i) for pol_i in range(len(pol_strings))]
+        )
+        if freq_chunk_size is None:
+            freq_chunk_size = Nfreqs
+        for freq_start in range(0, Nfreqs, freq_chunk_size):
+            freq_slice = slice(freq_start, freq_start + freq_chunk_size)
+            mueller = 0.5 * np.einsum(
+                "kab,bc...,kcd,ad...->k...",
+                pauli_mats,
+                jones[:, :, freq_slice],
+                pauli_mats,
+                np.conj(jones[:, :, freq_slice]),
+            )
+            power_data[0, 0, :, freq_slice] = np.abs(mueller)
 
         if self.pixel_coordinate_system != "healpix":
             power_data = power_data.reshape(power_data.shape[:-1] + (Naxes2, Naxes1))
@@ -1158,6 +1169,184 @@ class UVBeam(UVBase):
 
         return tuple(interp_arrays)
 
+    def _get_interp_pol_inds(self, polarizations=None):
+        """
+        Get the polarization or feed indices to interpolate.
+
+        Parameters
+        ----------
+        polarizations : list of str
+            polarizations to interpolate if beam_type is 'power'.
+            Default is all polarizations in self.polarization_array.
+
+        Returns
+        -------
+        Npol_feeds : int
+            Number of polarizations (for power beams) or feeds (for E-field
+            beams) to interpolate.
+        pol_inds : array of int
+            Indices into the polarization/feed axis of the data_array.
+
+        """
+        # Npols is only defined for power beams.  For E-field beams need Nfeeds.
+        if self.beam_type == "power":
+            # get requested polarization indices
+            if polarizations is None:
+                Npol_feeds = self.Npols
+                pol_inds = np.arange(Npol_feeds)
+            else:
+                pols = [
+                    uvutils.polstr2num(p, x_orientation=self.x_orientation)
+                    for p in polarizations
+                ]
+                pol_inds = []
+                for pol in pols:
+                    if pol not in self.polarization_array:
+                        raise ValueError(
+                            f"Requested polarization {pol} not found "
+                            "in self.polarization_array"
+                        )
+                    pol_inds.append(np.where(self.polarization_array == pol)[0][0])
+                pol_inds = np.asarray(pol_inds)
+                Npol_feeds = len(pol_inds)
+        else:
+            Npol_feeds = self.Nfeeds
+            pol_inds = np.arange(Npol_feeds)
+
+        return Npol_feeds, pol_inds
+
+    def _get_interp_basis_vector(self, npoints):
+        """
+        Get the basis vectors at the interpolation points.
+
+        Parameters
+        ----------
+        npoints : int
+            Number of interpolation points.
+
+        Returns
+        -------
+        interp_basis_vector : array_like of float
+            The array of interpolated basis vectors,
+            shape: (Naxes_vec, Ncomponents_vec, npoints), or None if there is
+            no basis_vector_array on the object.
+
+        """
+        if self.basis_vector_array is None:
+            return None
+
+        if np.any(self.basis_vector_array[0, 1, :] > 0) or np.any(
+            self.basis_vector_array[1, 0, :] > 0
+        ):
+            # Input basis vectors are not aligned to the native theta/phi
+            # coordinate system
+            raise NotImplementedError(
+                "interpolation for input basis "
+                "vectors that are not aligned to the "
+                "native theta/phi coordinate system "
+                "is not yet supported"
+            )
+
+        # The basis vector array comes in defined at the rectangular grid.
+        # Redefine it for the interpolation points
+        interp_basis_vector = np.zeros([self.Naxes_vec, self.Ncomponents_vec, npoints])
+        interp_basis_vector[0, 0, :] = np.ones(npoints)  # theta hat
+        interp_basis_vector[1, 1, :] = np.ones(npoints)  # phi hat
+
+        return interp_basis_vector
+
+    def _get_az_za_spline_grid(self, input_data_array):
+        """
+        Get the grid and data to fit az/za splines to.
+
+        If the azimuth axis wraps around, it is extended in each direction to
+        improve the interpolation near the branch cut.
+
+        Parameters
+        ----------
+        input_data_array : array_like of float or complex
+            Data array to fit, shape (Naxes_vec, Nspws, Nfeeds or Npols, Nfreqs,
+            Naxes2, Naxes1).
+
+        Returns
+        -------
+        theta_use : array of float
+            Zenith angle grid values, shape (Naxes2,).
+        phi_use : array of float
+            Azimuth grid values, shape (Naxes1 + extension,).
+        data_use : array_like of float or complex
+            Data array on the extended grid.
+
+        """
+        axis1_diff = np.diff(self.axis1_array)[0]
+        phi_length = np.abs(self.axis1_array[0] - self.axis1_array[-1]) + axis1_diff
+
+        theta_use = self.axis2_array
+        phi_use = self.axis1_array
+        data_use = input_data_array
+        if np.isclose(phi_length, 2 * np.pi, atol=axis1_diff):
+            # phi wraps around, extend array in each direction to improve interpolation
+            extend_length = 3
+            phi_use = np.concatenate(
+                (
+                    np.flip(phi_use[:extend_length] * (-1) - axis1_diff),
+                    phi_use,
+                    phi_use[-1 * extend_length :] + extend_length * axis1_diff,
+                )
+            )
+
+            low_slice = input_data_array[:, :, :, :, :, :extend_length]
+            high_slice = input_data_array[:, :, :, :, :, -1 * extend_length :]
+
+            data_use = np.concatenate((high_slice, input_data_array, low_slice), axis=5)
+
+        return theta_use, phi_use, data_use
+
+    def _check_az_za_coverage(self, az_array, za_array, theta_use, phi_use):
+        """
+        Check that interpolation locations are covered by the az/za grid.
+
+        Parameters
+        ----------
+        az_array : array_like of floats
+            Azimuth values to interpolate to in radians.
+        za_array : array_like of floats
+            Zenith values to interpolate to in radians.
+        theta_use : array of float
+            Zenith angle grid values.
+        phi_use : array of float
+            Azimuth grid values.
+
+        Raises
+        ------
+        ValueError
+            If any location is further than twice the grid spacing from all
+            grid points.
+
+        """
+        axis1_diff = np.diff(self.axis1_array)[0]
+        axis2_diff = np.diff(self.axis2_array)[0]
+        max_axis_diff = np.max([axis1_diff, axis2_diff])
+
+        def _nearest_dist(grid, values):
+            grid = np.sort(grid)
+            inds = np.searchsorted(grid, values)
+            lower = grid[np.clip(inds - 1, 0, grid.size - 1)]
+            upper = grid[np.clip(inds, 0, grid.size - 1)]
+            return np.minimum(np.abs(values - lower), np.abs(values - upper))
+
+        # the grid is rectangular, so the distance to the nearest grid point
+        # combines the nearest distances along each axis
+        pix_dists = np.sqrt(
+            _nearest_dist(theta_use, za_array) ** 2.0
+            + _nearest_dist(phi_use, az_array) ** 2.0
+        )
+        if np.any(pix_dists > (max_axis_diff * 2.0)):
+            raise ValueError(
+                "at least one interpolation location "
+                "is outside of the UVBeam pixel coverage."
+            )
+
     def _interp_az_za_rect_spline(
         self,
         az_array,
@@ -1230,13 +1419,7 @@ class UVBeam(UVBase):
 
         npoints = az_array.size
 
-        axis1_diff = np.diff(self.axis1_array)[0]
-        axis2_diff = np.diff(self.axis2_array)[0]
-        max_axis_diff = np.max([axis1_diff, axis2_diff])
-
-        phi_length = np.abs(self.axis1_array[0] - self.axis1_array[-1]) + axis1_diff
-
-        phi_vals, theta_vals = np.meshgrid(self.axis1_array, self.axis2_array)
+        theta_use, phi_use, data_use = self._get_az_za_spline_grid(input_data_array)
 
         assert input_data_array.shape[3] == input_nfreqs
 
@@ -1245,53 +1428,7 @@ class UVBeam(UVBase):
         else:
             data_type = np.float
 
-        if np.isclose(phi_length, 2 * np.pi, atol=axis1_diff):
-            # phi wraps around, extend array in each direction to improve interpolation
-            extend_length = 3
-            phi_use = np.concatenate(
-                (
-                    np.flip(phi_vals[:, :extend_length] * (-1) - axis1_diff, axis=1),
-                    phi_vals,
-                    phi_vals[:, -1 * extend_length :] + extend_length * axis1_diff,
-                ),
-                axis=1,
-            )
-            theta_use = np.concatenate(
-                (
-                    theta_vals[:, :extend_length],
-                    theta_vals,
-                    theta_vals[:, -1 * extend_length :],
-                ),
-                axis=1,
-            )
-
-            low_slice = input_data_array[:, :, :, :, :, :extend_length]
-            high_slice = input_data_array[:, :, :, :, :, -1 * extend_length :]
-
-            data_use = np.concatenate((high_slice, input_data_array, low_slice), axis=5)
-
-        if self.basis_vector_array is not None:
-            if np.any(self.basis_vector_array[0, 1, :] > 0) or np.any(
-                self.basis_vector_array[1, 0, :] > 0
-            ):
-                # Input basis vectors are not aligned to the native theta/phi
-                # coordinate system
-                raise NotImplementedError(
-                    "interpolation for input basis "
-                    "vectors that are not aligned to the "
-                    "native theta/phi coordinate system "
-                    "is not yet supported"
-                )
-            else:
-                # The basis vector array comes in defined at the rectangular grid.
-                # Redefine it for the interpolation points
-                interp_basis_vector = np.zeros(
-                    [self.Naxes_vec, self.Ncomponents_vec, npoints]
-                )
-                interp_basis_vector[0, 0, :] = np.ones(npoints)  # theta hat
-                interp_basis_vector[1, 1, :] = np.ones(npoints)  # phi hat
-        else:
-            interp_basis_vector = None
+        interp_basis_vector = self._get_interp_basis_vector(npoints)
 
         def get_lambda(real_lut, imag_lut=None):
             # Returns function objects for interpolation reuse
@@ -1302,35 +1439,13 @@ class UVBeam(UVBase):
                     real_lut(za, az, grid=False) + 1j * imag_lut(za, az, grid=False)
                 )
 
-        # Npols is only defined for power beams.  For E-field beams need Nfeeds.
-        if self.beam_type == "power":
-            # get requested polarization indices
-            if polarizations is None:
-                Npol_feeds = self.Npols
-                pol_inds = np.arange(Npol_feeds)
-            else:
-                pols = [
-                    uvutils.polstr2num(p, x_orientation=self.x_orientation)
-                    for p in polarizations
-                ]
-                pol_inds = []
-                for pol in pols:
-                    if pol not in self.polarization_array:
-                        raise ValueError(
-                            "Requested polarization {} not found "
-                            "in self.polarization_array".format(pol)
-                        )
-                    pol_inds.append(np.where(self.polarization_array == pol)[0][0])
-                pol_inds = np.asarray(pol_inds)
-                Npol_feeds = len(pol_inds)
-
-        else:
-            Npol_feeds = self.Nfeeds
-            pol_inds = np.arange(Npol_feeds)
+        Npol_feeds, pol_inds = self._get_interp_pol_inds(polarizations)
 
         data_shape = (self.Naxes_vec, self.Nspws, Npol_feeds, input_nfreqs, npoints)
         interp_data = np.zeros(data_shape, dtype=data_type)
 
+        self._check_az_za_coverage(az_array, za_array, theta_use, phi_use)
+
         if spline_opts is None or not isinstance(spline_opts, dict):
             spline_opts = {}
         if reuse_spline and not hasattr(self, "saved_interp_functions"):
@@ -1352,39 +1467,28 @@ class UVBeam(UVBase):
                             if np.iscomplexobj(data_use):
                                 # interpolate real and imaginary parts separately
                                 real_lut = interpolate.RectBivariateSpline(
-                                    theta_use[:, 0],
-                                    phi_use[0, :],
+                                    theta_use,
+                                    phi_use,
                                     data_use[index0, index1, index2, index3, :].real,
                                     **spline_opts,
                                 )
                                 imag_lut = interpolate.RectBivariateSpline(
-                                    theta_use[:, 0],
-                                    phi_use[0, :],
+                                    theta_use,
+                                    phi_use,
                                     data_use[index0, index1, index2, index3, :].imag,
                                     **spline_opts,
                                 )
                                 lut = get_lambda(real_lut, imag_lut)
                             else:
                                 lut = interpolate.RectBivariateSpline(
-                                    theta_use[:, 0],
-                                    phi_use[0, :],
+                                    theta_use,
+                                    phi_use,
                                     data_use[index0, index1, index2, index3, :],
                                     **spline_opts,
                                 )
                                 lut = get_lambda(lut)
                             if reuse_spline:
                                 self.saved_interp_functions[key] = lut
-                        if index0 == 0 and index1 == 0 and index2 == 0 and index3 == 0:
-                            for point_i in range(npoints):
-                                pix_dists = np.sqrt(
-                                    (theta_use - za_array[point_i]) ** 2.0
-                                    + (phi_use - az_array[point_i]) ** 2.0
-                                )
-                                if np.min(pix_dists) > (max_axis_diff * 2.0):
-                                    raise ValueError(
-                                        "at least one interpolation location "
-                                        "is outside of the UVBeam pixel coverage."
-                                    )
                         interp_data[index0, index1, pol_return_ind, index3, :] = lut(
                             za_array, az_array
                         )
@@ -1476,30 +1580,7 @@ class UVBeam(UVBase):
 
         npoints = az_array.size
 
-        # Npols is only defined for power beams.  For E-field beams need Nfeeds.
-        if self.beam_type == "power":
-            # get requested polarization indices
-            if polarizations is None:
-                Npol_feeds = self.Npols
-                pol_inds = np.arange(Npol_feeds)
-            else:
-                pols = [
-                    uvutils.polstr2num(p, x_orientation=self.x_orientation)
-                    for p in polarizations
-                ]
-                pol_inds = []
-                for pol in pols:
-                    if pol not in self.polarization_array:
-                        raise ValueError(
-                            f"Requested polarization {pol} not found "
-                            "in self.polarization_array"
-                        )
-                    pol_inds.append(np.where(self.polarization_array == pol)[0][0])
-                pol_inds = np.asarray(pol_inds)
-                Npol_feeds = len(pol_inds)
-        else:
-            Npol_feeds = self.Nfeeds
-            pol_inds = np.arange(Npol_feeds)
+        Npol_feeds, pol_inds = self._get_interp_pol_inds(polarizations)
 
         if np.iscomplexobj(input_data_array):
             data_type = np.complex
@@ -1510,28 +1591,7 @@ class UVBeam(UVBase):
             dtype=data_type,
         )
 
-        if self.basis_vector_array is not None:
-            if np.any(self.basis_vector_array[0, 1, :] > 0) or np.any(
-                self.basis_vector_array[1, 0, :] > 0
-            ):
-                """ Input basis vectors are not aligned to the native theta/phi
-                coordinate system """
-                raise NotImplementedError(
-                    "interpolation for input basis "
-                    "vectors that are not aligned to the "
-                    "native theta/phi coordinate system "
-                    "is not yet supported"
-                )
-            else:
-                """ The basis vector array comes in defined at the rectangular grid.
-                Redefine it for the interpolation points """
-                interp_basis_vector = np.zeros(
-                    [self.Naxes_vec, self.Ncomponents_vec, npoints]
-                )
-                interp_basis_vector[0, 0, :] = np.ones(npoints)  # theta hat
-                interp_basis_vector[1, 1, :] = np.ones(npoints)  # phi hat
-        else:
-            interp_basis_vector = None
+        interp_basis_vector = self._get_interp_basis_vector(npoints)
 
         hp_obj = HEALPix(nside=self.nside, order=self.ordering)
         lat_array = Angle(np.pi / 2, units.radian) - Angle(za_array, units.radian)
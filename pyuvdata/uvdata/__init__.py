@@ -4,3 +4,4 @@
 
 """Init file for UVData."""
 from .uvdata import *  # noqa
+from .selection_plan import *  # noqa
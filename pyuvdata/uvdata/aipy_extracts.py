@@ -621,6 +621,31 @@ class UV(_miriad.UV):
             except IOError:
                 break
 
+    def read_all(self, track_vars=(), size_hint=1024):
+        """
+        Read all the remaining data records into arrays in a single call.
+
+        The records are read in C into preallocated arrays rather than one
+        at a time through `read`.
+
+        Parameters
+        ----------
+        track_vars : list of str
+            Variables to report the values of whenever they change.
+        size_hint : int
+            Expected number of records, used for the initial size of the arrays.
+
+        Returns
+        -------
+        dict
+            Arrays with one row per record: "uvw", "time", "ant_i", "ant_j"
+            (0-indexed), "pol", "ra", "dec", "inttime", "data", "flags" (True
+            for flagged) and "cnt" (if present in the file). Under "updates" is
+            a dict keyed on the track_vars, with a list of (record index, value)
+            tuples for each change in value.
+        """
+        return self.bulk_read(self.nchan, self.vartable, list(track_vars), size_hint)
+
     def write(self, preamble, data, flags=None):
         """
         Write the next data record.
@@ -647,6 +672,92 @@ class UV(_miriad.UV):
 
         self.raw_write(preamble, data.astype(np.complex64), flags.astype(np.int32))
 
+    def write_all(
+        self,
+        uvw,
+        time,
+        ant_i,
+        ant_j,
+        pols,
+        lst,
+        inttime,
+        ra,
+        dec,
+        data,
+        flags,
+        cnt,
+        chunk_size=4096,
+    ):
+        """
+        Write many data records in as few calls as possible.
+
+        One record is written per row and polarization. The per-record
+        variables (lst, inttime, ra, dec, pol and cnt) are only updated in the
+        file when their values change.
+
+        Parameters
+        ----------
+        uvw : array_like of float
+            u, v, w in ns for each row, shape (Nrows, 3).
+        time : array_like of float
+            Julian date of each row, shape (Nrows,).
+        ant_i, ant_j : array_like of int
+            Antenna pair (0-indexed) of each row, shape (Nrows,).
+        pols : array_like of int
+            Polarization numbers, shape (Npols,).
+        lst, inttime, ra, dec : array_like of float
+            Values of these variables for each row, shape (Nrows,).
+        data : array_like of complex
+            Spectra, shape (Nrows, Npols, Nchan).
+        flags : array_like of bool
+            Flags (True for flagged), shape (Nrows, Npols, Nchan).
+        cnt : array_like of float
+            Values of the cnt variable, shape (Nrows, Npols, Nchan).
+        chunk_size : int
+            Number of rows to convert to the types and layout needed by
+            Miriad at once, this bounds the size of the temporary arrays.
+
+        Raises
+        ------
+        ValueError
+            If any of the per-record variables has already been added with a
+            different type than the one written here ("i" for pol and "d" for
+            the others).
+        """
+        var_types = {
+            "pol": "i",
+            "lst": "d",
+            "cnt": "d",
+            "ra": "d",
+            "dec": "d",
+            "inttime": "d",
+        }
+        for name, var_type in var_types.items():
+            if self.vartable.setdefault(name, var_type) != var_type:
+                raise ValueError(
+                    f"The {name} variable has type {self.vartable[name]} but "
+                    f"write_all writes it as type {var_type}."
+                )
+
+        pols = np.ascontiguousarray(pols, dtype=np.intc)
+        nrows = len(time)
+        for start in range(0, nrows, chunk_size):
+            rows = slice(start, min(start + chunk_size, nrows))
+            self.bulk_write(
+                np.ascontiguousarray(uvw[rows], dtype=np.float64),
+                np.ascontiguousarray(time[rows], dtype=np.float64),
+                np.ascontiguousarray(ant_i[rows], dtype=np.intc),
+                np.ascontiguousarray(ant_j[rows], dtype=np.intc),
+                pols,
+                np.ascontiguousarray(lst[rows], dtype=np.float64),
+                np.ascontiguousarray(inttime[rows], dtype=np.float64),
+                np.ascontiguousarray(ra[rows], dtype=np.float64),
+                np.ascontiguousarray(dec[rows], dtype=np.float64),
+                np.ascontiguousarray(data[rows], dtype=np.complex64),
+                np.ascontiguousarray(np.logical_not(flags[rows]), dtype=np.intc),
+                np.ascontiguousarray(cnt[rows], dtype=np.float64),
+            )
+
     def init_from_uv(self, uv, override={}, exclude=[]):
         """
         Initialize header items and variables from another UV.
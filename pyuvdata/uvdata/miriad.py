@@ -319,74 +319,39 @@ class Miriad(UVData):
         if n_selects > 0:
             self.history += history_update_string
 
-        data_accumulator = {}
-        pol_list = []
-        for (uvw, t, (i, j)), d, f in uv.all(raw=True):
-            # control for the case of only a single spw not showing up in
-            # the dimension
-            # Note that the (i, j) tuple is calculated from a baseline number in
-            # _miriad (see miriad_wrap.h). The i, j values are also adjusted by _miriad
-            # to start at 0 rather than 1.
-            if len(d.shape) == 1:
-                d.shape = (1,) + d.shape
-                self.Nspws = d.shape[0]
-                self.spw_array = np.arange(self.Nspws)
-            else:
-                raise ValueError(
-                    "Sorry.  Files with more than one spectral "
-                    "window (spw) are not yet supported. A great "
-                    "project for the interested student!"
-                )
-            try:
-                cnt = uv["cnt"]
-            except (KeyError):
-                cnt = np.ones(d.shape, dtype=np.float)
-            ra = uv["ra"]
-            dec = uv["dec"]
-            # NOTE: Using our lst calculator, which uses astropy,
-            # instead of _miriad values which come from pyephem.
-            # The differences are of order 5 seconds.
-            # To use the values from the file you'd want: lst = uv['lst']
-            inttime = uv["inttime"]
-            source = uv["source"]
-            if source != _source:
-                raise ValueError(
-                    "This appears to be a multi source file, which is not supported."
-                )
-            else:
-                _source = source
-
-            # check extra variables for changes compared with initial value
-            for extra_variable in list(check_variables.keys()):
-                if type(check_variables[extra_variable]) == str:
-                    if uv[extra_variable] != check_variables[extra_variable]:
-                        check_variables.pop(extra_variable)
-                else:
-                    if not np.allclose(
-                        uv[extra_variable], check_variables[extra_variable]
-                    ):
-                        check_variables.pop(extra_variable)
-
-            try:
-                data_accumulator[uv["pol"]].append(
-                    [uvw, t, i, j, d, f, cnt, ra, dec, inttime]
-                )
-            except (KeyError):
-                data_accumulator[uv["pol"]] = [
-                    [uvw, t, i, j, d, f, cnt, ra, dec, inttime]
-                ]
-                pol_list.append(uv["pol"])
-                # NB: flag types in miriad are usually ints
-
-        if len(list(data_accumulator.keys())) == 0:
+        # read all the records into arrays in a single pass. The source and the
+        # extra variables are only reported when they change.
+        records = uv.read_all(track_vars=["source"] + list(check_variables.keys()))
+        if records["time"].size == 0:
             raise ValueError(
                 "No data is present, probably as a result of "
                 "select on read that excludes all the data"
             )
 
-        for pol, data in data_accumulator.items():
-            data_accumulator[pol] = np.array(data)
+        # the records are single spectra, multiple spws are not supported.
+        self.Nspws = 1
+        self.spw_array = np.arange(self.Nspws)
+
+        for _, source in records["updates"].pop("source"):
+            if source != _source:
+                raise ValueError(
+                    "This appears to be a multi source file, which is not supported."
+                )
 
+        # check extra variables for changes compared with initial value
+        for extra_variable, changes in records["updates"].items():
+            for _, value in changes:
+                if isinstance(check_variables[extra_variable], str):
+                    changed = value != check_variables[extra_variable]
+                else:
+                    changed = not np.allclose(value, check_variables[extra_variable])
+                if changed:
+                    check_variables.pop(extra_variable)
+                    break
+
+        # polarizations in the order they first appear
+        pol_vals, pol_first = np.unique(records["pol"], return_index=True)
+        pol_list = pol_vals[np.argsort(pol_first)]
         self.polarization_array = np.array(pol_list)
         if polarizations is None:
             # A select on read would make the header npols not match the pols
@@ -398,64 +363,37 @@ class Miriad(UVData):
                     )
                 )
         self.Npols = len(pol_list)
+        pol_sorter = np.argsort(self.polarization_array)
+        rec_pol_inds = pol_sorter[
+            np.searchsorted(self.polarization_array, records["pol"], sorter=pol_sorter)
+        ]
 
-        # makes a data_array (and flag_array) of zeroes to be filled in by
-        #   data values
-        # any missing data will have zeros
-
-        # use set to get the unique list of all times ever listed in the file
-        # iterate over polarizations and all spectra (bls and times) in two
-        # nested loops, then flatten into a single vector, then set
-        # then list again.
-
-        times = list(
-            set(np.concatenate([[k[1] for k in d] for d in data_accumulator.values()]))
-        )
-        times = np.sort(times)
-
-        ant_i_unique = list(
-            set(np.concatenate([[k[2] for k in d] for d in data_accumulator.values()]))
-        )
-        ant_j_unique = list(
-            set(np.concatenate([[k[3] for k in d] for d in data_accumulator.values()]))
+        # group the records into baseline-times (the time, antenna pair and
+        # integration time) using integer keys. The keys sort by time, then
+        # antenna 1, antenna 2 and integration time.
+        times, rec_time_inds = np.unique(records["time"], return_inverse=True)
+        inttimes, rec_inttime_inds = np.unique(records["inttime"], return_inverse=True)
+        ant_i = records["ant_i"].astype(np.int64)
+        ant_j = records["ant_j"].astype(np.int64)
+        sorted_unique_ants = np.union1d(ant_i, ant_j).tolist()
+        nant_keys = sorted_unique_ants[-1] + 1
+        rec_keys = (
+            (rec_time_inds * nant_keys + ant_i) * nant_keys + ant_j
+        ) * inttimes.size + rec_inttime_inds
+        _, blt_first, rec_blt_inds = np.unique(
+            rec_keys, return_index=True, return_inverse=True
         )
 
-        sorted_unique_ants = sorted(set(ant_i_unique + ant_j_unique))
-        ant_i_unique = np.array(ant_i_unique)
-        ant_j_unique = np.array(ant_j_unique)
-
-        # Determine maximum digits needed to distinguish different values
-        if sorted_unique_ants[-1] > 0:
-            ndig_ant = np.ceil(np.log10(sorted_unique_ants[-1])).astype(int) + 1
-        else:
-            ndig_ant = 1
-        # Be excessive in precision because we use the floating point values as
-        # dictionary keys later
-        prec_t = -2 * np.floor(np.log10(self._time_array.tols[-1])).astype(int)
-        ndig_t = np.ceil(np.log10(times[-1])).astype(int) + prec_t + 2
-        blts = []
-        for d in data_accumulator.values():
-            for k in d:
-                blt = [
-                    "{1:.{0}f}".format(prec_t, k[1]).zfill(ndig_t),
-                    str(k[2]).zfill(ndig_ant),
-                    str(k[3]).zfill(ndig_ant),
-                    str(k[9]).zfill(ndig_t),
-                ]
-                blt = "_".join(blt)
-                blts.append(blt)
-        unique_blts = np.unique(np.array(blts))
-
-        reverse_inds = dict(zip(unique_blts, range(len(unique_blts))))
         self.Nants_data = len(sorted_unique_ants)
 
         # load antennas and antenna positions using sorted unique ants list
         self._load_antpos(uv, sorted_unique_ants=sorted_unique_ants)
 
-        # form up a grid which indexes time and baselines along the 'long'
-        # axis of the visdata array
-        tij_grid = np.array([list(map(float, x.split("_"))) for x in unique_blts])
-        t_grid, ant_i_grid, ant_j_grid, int_grid = tij_grid.T
+        # the time, antennas and integration time along the baseline-time axis
+        t_grid = records["time"][blt_first]
+        ant_i_grid = ant_i[blt_first]
+        ant_j_grid = ant_j[blt_first]
+        int_grid = records["inttime"][blt_first]
         # set the data sizes
         if (
             antenna_nums is None
@@ -538,69 +476,42 @@ class Miriad(UVData):
         # Currently does not actually support Nspws>1!
         self.freq_array = np.tile(self.freq_array, (self.Nspws, 1))
 
+        self.data_array[rec_blt_inds, 0, :, rec_pol_inds] = records["data"]
+        self.flag_array[rec_blt_inds, 0, :, rec_pol_inds] = records["flags"]
+        if "cnt" in records:
+            self.nsample_array[rec_blt_inds, 0, :, rec_pol_inds] = records["cnt"]
+
         # Temporary arrays to hold polarization axis, which will be collapsed
         ra_pol_list = np.zeros((self.Nblts, self.Npols))
         dec_pol_list = np.zeros((self.Nblts, self.Npols))
         uvw_pol_list = np.zeros((self.Nblts, 3, self.Npols))
         c_ns = const.c.to("m/ns").value
-        for pol, data in data_accumulator.items():
-            pol_ind = self._pol_to_ind(pol)
-            for ind, d in enumerate(data):
-                blt = [
-                    "{1:.{0}f}".format(prec_t, d[1]).zfill(ndig_t),
-                    str(d[2]).zfill(ndig_ant),
-                    str(d[3]).zfill(ndig_ant),
-                    str(d[9]).zfill(ndig_t),
-                ]
-                blt = "_".join(blt)
-                blt_index = reverse_inds[blt]
-
-                self.data_array[blt_index, :, :, pol_ind] = d[4]
-                self.flag_array[blt_index, :, :, pol_ind] = d[5]
-                self.nsample_array[blt_index, :, :, pol_ind] = d[6]
-
-                # because there are uvws/ra/dec for each pol, and one pol may not
-                # have that visibility, we collapse along the polarization
-                # axis but avoid any missing visbilities
-                uvw = d[0] * c_ns
-                uvw.shape = (1, 3)
-                uvw_pol_list[blt_index, :, pol_ind] = uvw
-                ra_pol_list[blt_index, pol_ind] = d[7]
-                dec_pol_list[blt_index, pol_ind] = d[8]
-
-        # Collapse pol axis for ra_list, dec_list, and uvw_list
-        ra_list = np.zeros(self.Nblts)
-        dec_list = np.zeros(self.Nblts)
-        for blt_index in range(self.Nblts):
-            test = ~np.all(self.flag_array[blt_index, :, :, :], axis=(0, 1))
-            good_pol = np.where(test)[0]
-            if len(good_pol) == 1:
-                # Only one good pol, use it
-                self.uvw_array[blt_index, :] = uvw_pol_list[blt_index, :, good_pol]
-                ra_list[blt_index] = ra_pol_list[blt_index, good_pol]
-                dec_list[blt_index] = dec_pol_list[blt_index, good_pol]
-            elif len(good_pol) > 1:
-                # Multiple good pols, check for consistency. pyuvdata does not
-                # support pol-dependent uvw, ra, or dec.
-                if np.any(np.diff(uvw_pol_list[blt_index, :, good_pol], axis=0)):
-                    raise ValueError("uvw values are different by polarization.")
-                else:
-                    self.uvw_array[blt_index, :] = uvw_pol_list[
-                        blt_index, :, good_pol[0]
-                    ]
-                if np.any(np.diff(ra_pol_list[blt_index, good_pol])):
-                    raise ValueError("ra values are different by polarization.")
-                else:
-                    ra_list[blt_index] = ra_pol_list[blt_index, good_pol[0]]
-                if np.any(np.diff(dec_pol_list[blt_index, good_pol])):
-                    raise ValueError("dec values are different by polarization.")
-                else:
-                    dec_list[blt_index] = dec_pol_list[blt_index, good_pol[0]]
-            else:
-                # No good pols for this blt. Fill with first one.
-                self.uvw_array[blt_index, :] = uvw_pol_list[blt_index, :, 0]
-                ra_list[blt_index] = ra_pol_list[blt_index, 0]
-                dec_list[blt_index] = dec_pol_list[blt_index, 0]
+        uvw_pol_list[rec_blt_inds, :, rec_pol_inds] = records["uvw"] * c_ns
+        ra_pol_list[rec_blt_inds, rec_pol_inds] = records["ra"]
+        dec_pol_list[rec_blt_inds, rec_pol_inds] = records["dec"]
+        del records
+
+        # because there are uvws/ra/dec for each pol, and one pol may not
+        # have that visibility, we collapse along the polarization
+        # axis but avoid any missing visbilities. Use the first pol with
+        # unflagged data (or the first pol if they are all flagged).
+        good_pol = ~np.all(self.flag_array, axis=(1, 2))
+        use_pol = np.where(np.any(good_pol, axis=1), np.argmax(good_pol, axis=1), 0)
+        blt_range = np.arange(self.Nblts)
+        self.uvw_array = uvw_pol_list[blt_range, :, use_pol]
+        ra_list = ra_pol_list[blt_range, use_pol]
+        dec_list = dec_pol_list[blt_range, use_pol]
+
+        # pyuvdata does not support pol-dependent uvw, ra, or dec.
+        if np.any(
+            good_pol[:, np.newaxis, :]
+            & (uvw_pol_list != self.uvw_array[:, :, np.newaxis])
+        ):
+            raise ValueError("uvw values are different by polarization.")
+        if np.any(good_pol & (ra_pol_list != ra_list[:, np.newaxis])):
+            raise ValueError("ra values are different by polarization.")
+        if np.any(good_pol & (dec_pol_list != dec_list[:, np.newaxis])):
+            raise ValueError("dec values are different by polarization.")
 
         # get unflagged blts
         blt_good = np.where(~np.all(self.flag_array, axis=(1, 2, 3)))
@@ -987,42 +898,44 @@ class Miriad(UVData):
         uv.add_var("inttime", "d")
 
         # write data
-        c_ns = const.c.to("m/ns").value
-        for viscnt, blt in enumerate(self.data_array):
-            uvw = (self.uvw_array[viscnt] / c_ns).astype(np.double)
-            t = miriad_time_array[viscnt]
-            i = self.ant_1_array[viscnt]
-            j = self.ant_2_array[viscnt]
-
-            uv["lst"] = miriad_lsts[viscnt].astype(np.double)
-            uv["inttime"] = self.integration_time[viscnt].astype(np.double)
-            if self.phase_type == "phased":
-                uv["ra"] = self.phase_center_ra
-                uv["dec"] = self.phase_center_dec
-            elif self.phase_type == "drift":
-                uv["ra"] = miriad_lsts[viscnt].astype(np.double)
-                uv["dec"] = self.telescope_location_lat_lon_alt[0].astype(np.double)
-            else:
-                raise ValueError(
-                    "The phasing type of the data is unknown. "
-                    'Set the phase_type to "drift" or "phased" to '
-                    "reflect the phasing status of the data"
-                )
-
-            # NOTE only writing spw 0, not supporting multiple spws for write
-            for polcnt, pol in enumerate(self.polarization_array):
-                uv["pol"] = pol.astype(np.int)
-                uv["cnt"] = self.nsample_array[viscnt, 0, :, polcnt].astype(np.double)
+        if self.phase_type == "phased":
+            ra = np.full(self.Nblts, self.phase_center_ra, dtype=np.double)
+            dec = np.full(self.Nblts, self.phase_center_dec, dtype=np.double)
+        elif self.phase_type == "drift":
+            ra = miriad_lsts
+            dec = np.full(
+                self.Nblts, self.telescope_location_lat_lon_alt[0], dtype=np.double
+            )
+        else:
+            raise ValueError(
+                "The phasing type of the data is unknown. "
+                'Set the phase_type to "drift" or "phased" to '
+                "reflect the phasing status of the data"
+            )
 
-                data = self.data_array[viscnt, 0, :, polcnt]
-                flags = self.flag_array[viscnt, 0, :, polcnt]
-                assert j >= i, (
-                    "Miriad requires ant1<ant2 which should be "
-                    "guaranteed by prior conjugate_bls call"
-                )
-                preamble = (uvw, t, (i, j))
+        assert np.all(self.ant_2_array >= self.ant_1_array), (
+            "Miriad requires ant1<ant2 which should be "
+            "guaranteed by prior conjugate_bls call"
+        )
 
-                uv.write(preamble, data, flags)
+        # NOTE only writing spw 0, not supporting multiple spws for write
+        # The data-like arrays are passed as (Nblts, Npols, Nfreqs) views, they
+        # are copied to the types and layout Miriad needs in chunks of blts.
+        c_ns = const.c.to("m/ns").value
+        uv.write_all(
+            self.uvw_array / c_ns,
+            miriad_time_array,
+            self.ant_1_array,
+            self.ant_2_array,
+            self.polarization_array,
+            miriad_lsts,
+            self.integration_time,
+            ra,
+            dec,
+            self.data_array[:, 0].transpose(0, 2, 1),
+            self.flag_array[:, 0].transpose(0, 2, 1),
+            self.nsample_array[:, 0].transpose(0, 2, 1),
+        )
 
         # close out now that we're done
         uv.close()
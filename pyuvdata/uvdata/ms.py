@@ -18,6 +18,39 @@ from .. import utils as uvutils
 __all__ = ["MS"]
 
 
+def _get_cell_slice(inds, axis_len):
+    """
+    Get the slice of a data cell axis to read for a set of indices.
+
+    Parameters
+    ----------
+    inds : array_like of int or None
+        Indices along the cell axis, None means read the whole axis.
+    axis_len : int
+        Length of the cell axis.
+
+    Returns
+    -------
+    blc : int
+        First index to read.
+    trc : int
+        Last index to read (inclusive).
+    inc : int
+        Stride of the read.
+    index : slice or array of int
+        Index to apply to the read axis to get the requested indices. Indices
+        that are not evenly spaced are read as the range they span and then
+        indexed in memory.
+
+    """
+    if inds is None:
+        return 0, int(axis_len) - 1, 1, slice(None)
+    index = uvutils._inds_to_index(inds)
+    if isinstance(index, slice):
+        return int(index.start), int(index.stop) - 1, int(index.step or 1), slice(None)
+    return int(index.min()), int(index.max()), 1, index - index.min()
+
+
 """
 This dictionary defines the mapping between CASA polarization numbers and
 AIPS polarization numbers
@@ -132,22 +165,172 @@ class MS(UVData):
     def write_ms(self):
         """Write ms: Not yet supported."""
 
+    def _get_data(
+        self, tb_main, data_column, blt_inds, freq_inds, pol_inds, blt_chunk_size,
+    ):
+        """
+        Read the data, flags and weights for the selected rows of the main table.
+
+        The rows are read in chunks and only the selected channels and
+        polarizations of each cell are read from the table.
+        """
+        if blt_chunk_size is None:
+            # bound the visibilities read at once to about 64 MiB
+            blt_chunk_size = max(1, 2 ** 26 // (8 * self.Nfreqs * self.Npols))
+        elif blt_chunk_size < 1:
+            raise ValueError("blt_chunk_size must be a positive integer.")
+
+        if blt_inds is not None:
+            blt_inds = np.asarray(blt_inds)
+        freq_blc, freq_trc, freq_inc, freq_index = _get_cell_slice(
+            freq_inds, self.Nfreqs
+        )
+        pol_blc, pol_trc, pol_inc, pol_index = _get_cell_slice(pol_inds, self.Npols)
+        # the data cells are (Nfreqs, Npols)
+        cell_blc = [freq_blc, pol_blc]
+        cell_trc = [freq_trc, pol_trc]
+        cell_inc = [freq_inc, pol_inc]
+        # 'WEIGHT_SPECTRUM' is optional - some files may not have per-channel values
+        weight_spectrum = "WEIGHT_SPECTRUM" in tb_main.colnames()
+
+        for start in range(0, self.Nblts, blt_chunk_size):
+            out_inds = slice(start, min(start + blt_chunk_size, self.Nblts))
+            if blt_inds is None:
+                row_index = out_inds
+            else:
+                row_index = uvutils._inds_to_index(blt_inds[out_inds])
+            if isinstance(row_index, slice):
+                # evenly spaced rows can be read straight from the main table
+                tb_rows = tb_main
+                row_range = range(row_index.start, row_index.stop, row_index.step or 1)
+                row_kwargs = {
+                    "startrow": int(row_range.start),
+                    "nrow": len(row_range),
+                    "rowincr": int(row_range.step),
+                }
+            else:
+                # otherwise make a reference table of just the rows in this chunk
+                tb_rows = tb_main.selectrows(row_index.tolist())
+                row_kwargs = {}
+
+            # FITS uvw direction convention is opposite ours and Miriad's.
+            # CASA's convention is unclear: the docs contradict themselves,
+            # but empirically it appears to match uvfits
+            # So conjugate the visibilities and flip the uvws:
+            data = tb_rows.getcolslice(
+                data_column, cell_blc, cell_trc, cell_inc, **row_kwargs
+            )[:, freq_index][:, :, pol_index]
+            flags = tb_rows.getcolslice(
+                "FLAG", cell_blc, cell_trc, cell_inc, **row_kwargs
+            )[:, freq_index][:, :, pol_index]
+            if weight_spectrum:
+                weights = tb_rows.getcolslice(
+                    "WEIGHT_SPECTRUM", cell_blc, cell_trc, cell_inc, **row_kwargs
+                )[:, freq_index][:, :, pol_index]
+            else:
+                # Propagate the weights in frequency
+                weights = tb_rows.getcolslice(
+                    "WEIGHT", [pol_blc], [pol_trc], [pol_inc], **row_kwargs
+                )[:, pol_index][:, np.newaxis, :]
+            if tb_rows is not tb_main:
+                tb_rows.close()
+
+            if start == 0:
+                # CASA stores data in complex array with dimension NbltsxNfreqsxNpols
+                shape = (self.Nblts, self.Nspws, self.Nfreqs, self.Npols)
+                self.data_array = np.empty(shape, dtype=data.dtype)
+                self.flag_array = np.empty(shape, dtype=np.bool_)
+                self.nsample_array = np.empty(shape, dtype=weights.dtype)
+            np.conjugate(data, out=self.data_array[out_inds, 0])
+            self.flag_array[out_inds, 0] = flags
+            self.nsample_array[out_inds, 0] = weights
+
     def read_ms(
         self,
         filepath,
+        antenna_nums=None,
+        antenna_names=None,
+        ant_str=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        polarizations=None,
+        blt_inds=None,
+        keep_all_metadata=True,
         data_column="DATA",
         pol_order="AIPS",
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
+        blt_chunk_size=None,
     ):
         """
         Read in a casa measurement set.
 
+        Supports reading only selected portions of the data, the selection is
+        made on the metadata columns and only the selected rows, channels and
+        polarizations of the data columns are read from the table.
+
         Parameters
         ----------
         filepath : str
             The measurement set root directory to read from.
+        antenna_nums : array_like of int, optional
+            The antennas numbers to include when reading data into the object
+            (antenna positions and names for the removed antennas will be retained
+            unless `keep_all_metadata` is False). This cannot be provided if
+            `antenna_names` is also provided.
+        antenna_names : array_like of str, optional
+            The antennas names to include when reading data into the object
+            (antenna positions and names for the removed antennas will be retained
+            unless `keep_all_metadata` is False). This cannot be provided if
+            `antenna_nums` is also provided.
+        bls : list of tuple, optional
+            A list of antenna number tuples (e.g. [(0, 1), (3, 2)]) or a list of
+            baseline 3-tuples (e.g. [(0, 1, 'xx'), (2, 3, 'yy')]) specifying baselines
+            to include when reading data into the object. For length-2 tuples,
+            the ordering of the numbers within the tuple does not matter. For
+            length-3 tuples, the polarization string is in the order of the two
+            antennas. If length-3 tuples are provided, `polarizations` must be
+            None.
+        ant_str : str, optional
+            A string containing information about what antenna numbers
+            and polarizations to include when reading data into the object.
+            Can be 'auto', 'cross', 'all', or combinations of antenna numbers
+            and polarizations (e.g. '1', '1_2', '1x_2y').  See tutorial for more
+            examples of valid strings and the behavior of different forms for ant_str.
+            If '1x_2y,2y_3y' is passed, both polarizations 'xy' and 'yy' will
+            be kept for both baselines (1, 2) and (2, 3) to return a valid
+            pyuvdata object.
+            An ant_str cannot be passed in addition to any of `antenna_nums`,
+            `antenna_names`, `bls` args or the `polarizations` parameters,
+            if it is a ValueError will be raised.
+        frequencies : array_like of float, optional
+            The frequencies to include when reading data into the object, each
+            value passed here should exist in the freq_array.
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to include when reading data into the
+            object.
+        times : array_like of float, optional
+            The times to include when reading data into the object, each value
+            passed here should exist in the time_array in the file.
+            Cannot be used with `time_range`.
+        time_range : array_like of float, optional
+            The time range in Julian Date to include when reading data into
+            the object, must be length 2. Some of the times in the file should
+            fall between the first and last elements.
+            Cannot be used with `times`.
+        polarizations : array_like of int, optional
+            The polarizations numbers to include when reading data into the
+            object, each value passed here should exist in the polarization_array.
+        blt_inds : array_like of int, optional
+            The baseline-time indices to include when reading data into the
+            object. This is not commonly used.
+        keep_all_metadata : bool
+            Option to keep all the metadata associated with antennas, even those
+            that do not have data associated with them after the select option.
         data_column : str
             name of CASA data column to read into data_array. Options are:
             'DATA', 'MODEL', or 'CORRECTED_DATA'
@@ -165,6 +348,11 @@ class MS(UVData):
             Option to check acceptable range of the values of parameters after
             reading in the file (the default is True, meaning the acceptable
             range check will be done).
+        blt_chunk_size : int
+            Number of baseline-times (rows) to read from the table at once, the
+            data are written into the final arrays one chunk at a time to bound
+            the size of the temporary arrays. Defaults to the number of
+            baseline-times in about 64 MiB of visibilities.
 
         Raises
         ------
@@ -175,6 +363,10 @@ class MS(UVData):
             If the data are have multiple subarrays or are multi source or have
             multiple spectral windows.
             If the data have multiple data description ID values.
+            If incompatible select keywords are set (e.g. `ant_str` with other
+            antenna selectors, `times` and `time_range`) or select keywords
+            exclude all data or if keywords are set to the wrong type.
+            If `blt_chunk_size` is less than 1.
 
         """
         try:
@@ -245,20 +437,10 @@ class MS(UVData):
             )
 
         self.Ntimes = int(len(times_unique))
-        # FITS uvw direction convention is opposite ours and Miriad's.
-        # CASA's convention is unclear: the docs contradict themselves,
-        # but empirically it appears to match uvfits
-        # So conjugate the visibilities and flip the uvws:
-        data_array = np.conj(tb.getcol(data_column))
-        self.Nblts = int(data_array.shape[0])
-        flag_array = tb.getcol("FLAG")
-        # CASA stores data in complex array with dimension NbltsxNfreqsxNpols
-        if len(data_array.shape) == 3:
-            data_array = np.expand_dims(data_array, axis=1)
-            flag_array = np.expand_dims(flag_array, axis=1)
-        self.data_array = data_array
-        self.flag_array = flag_array
-        self.Npols = int(data_array.shape[-1])
+        self.Nblts = int(tb.nrows())
+        # CASA stores flags in a boolean array with dimension NbltsxNfreqsxNpols,
+        # only read the first cell here, the data are read after the select.
+        self.Npols = int(tb.getcell("FLAG", 0).shape[-1])
         # FITS uvw direction convention is opposite ours and Miriad's.
         # CASA's convention is unclear: the docs contradict themselves,
         # but empirically it appears to match uvfits
@@ -407,21 +589,41 @@ class MS(UVData):
         _, self.history = self._ms_hist_to_string(
             tables.table(filepath + "/HISTORY", ack=False)
         )
-        # CASA weights column keeps track of number of data points averaged.
 
         if not uvutils._check_history_version(self.history, self.pyuvdata_version_str):
             self.history += self.pyuvdata_version_str
-        # 'WEIGHT_SPECTRUM' is optional - some files may not have per-channel values
-        if "WEIGHT_SPECTRUM" in tb.colnames():
-            self.nsample_array = tb.getcol("WEIGHT_SPECTRUM")
+
+        # figure out what data to read in
+        blt_inds, freq_inds, pol_inds, history_update_string = self._select_preprocess(
+            antenna_nums,
+            antenna_names,
+            ant_str,
+            bls,
+            frequencies,
+            freq_chans,
+            times,
+            time_range,
+            polarizations,
+            blt_inds,
+        )
+        if all(
+            inds is None or len(inds) == axis_len
+            for inds, axis_len in zip(
+                [blt_inds, freq_inds, pol_inds], [self.Nblts, self.Nfreqs, self.Npols]
+            )
+        ):
+            # no select, read in all the data
+            blt_inds, freq_inds, pol_inds = None, None, None
         else:
-            self.nsample_array = tb.getcol("WEIGHT")
-            # Propagate the weights in frequency
-            self.nsample_array = np.stack(
-                [self.nsample_array for chan in range(self.Nfreqs)], axis=1
+            # do select operations on everything except data_array, flag_array
+            # and nsample_array
+            self._select_metadata(
+                blt_inds, freq_inds, pol_inds, history_update_string, keep_all_metadata
             )
-        if len(self.nsample_array.shape) == 3:
-            self.nsample_array = np.expand_dims(self.nsample_array, axis=1)
+
+        # CASA weights column keeps track of number of data points averaged.
+        self._get_data(tb, data_column, blt_inds, freq_inds, pol_inds, blt_chunk_size)
+
         self.object_name = tb_field.getcol("NAME")[0]
         tb_field.close()
         tb.close()
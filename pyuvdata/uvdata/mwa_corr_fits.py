@@ -3,6 +3,9 @@
 # Licensed under the 2-clause BSD License
 
 """Class for reading MWA correlator FITS files."""
+import concurrent.futures
+import functools
+
 import numpy as np
 import warnings
 from astropy.io import fits
@@ -56,12 +59,11 @@ class MWACorrFITS(UVData):
                 cable_array.append(float(i[3:]))
             else:
                 cable_array.append(float(i) * v_factor)
+        cable_array = np.asarray(cable_array)
         # build array of differences
-        cable_len_diffs = np.zeros((self.Nblts, 1))
-        for j in range(self.Nblts):
-            cable_len_diffs[j] = (
-                cable_array[self.ant_2_array[j]] - cable_array[self.ant_1_array[j]]
-            )
+        cable_len_diffs = (
+            cable_array[self.ant_2_array] - cable_array[self.ant_1_array]
+        ).reshape(self.Nblts, 1)
         self.data_array *= np.exp(
             -1j
             * 2
@@ -69,7 +71,144 @@ class MWACorrFITS(UVData):
             * cable_len_diffs
             / const.c.to("m/s").value
             * self.freq_array.reshape(1, self.Nfreqs)
-        )[:, :, None]
+        )[:, None, :, None]
+
+    def _read_fits_file(
+        self,
+        filename,
+        time_array,
+        file_nums_to_index,
+        num_fine_chans,
+        int_time,
+        freq_inds,
+        map_inds,
+        conj,
+    ):
+        """
+        Read one gpubox file directly into the data-like arrays.
+
+        Each HDU is scattered into its final baseline-time, frequency and
+        polarization position so no full size intermediate arrays are created.
+        Files without any of the frequencies to read are skipped, as are HDUs
+        for times that are not being read.
+
+        Parameters
+        ----------
+        filename : str
+            The gpubox file to read.
+        time_array : ndarray of float
+            Unix time at the center of each integration to read.
+        file_nums_to_index : dict
+            Mapping from gpubox file numbers to coarse channel indices.
+        num_fine_chans : int
+            Number of fine channels in each coarse channel.
+        int_time : float
+            Integration time in seconds.
+        freq_inds : ndarray of int
+            Indices of the frequencies to read in the frequency axis of all
+            the submitted coarse channels, sorted.
+        map_inds : ndarray of int
+            Index of the real part of each baseline and polarization to read in
+            a row of the HDU data, shape (Nbls, Npols).
+        conj : ndarray of bool
+            Whether each baseline and polarization needs to be conjugated,
+            shape (Nbls, Npols).
+
+        """
+        # get the file number from the file name
+        file_num = int(filename.split("_")[-2][-2:])
+        # map file number to frequency index
+        freq_ind = file_nums_to_index[file_num] * num_fine_chans
+        # find the frequencies to read from this file
+        file_freqs = np.nonzero(
+            (freq_inds >= freq_ind) & (freq_inds < freq_ind + num_fine_chans)
+        )[0]
+        if file_freqs.size == 0:
+            return
+        freq_slice = slice(file_freqs[0], file_freqs[-1] + 1)
+        # fine channel (row) indices in the HDU data
+        chan_inds = (freq_inds[file_freqs] - freq_ind)[:, np.newaxis, np.newaxis]
+        n_bls = map_inds.shape[0]
+        imag_sign = np.where(conj, -1, 1)[:, np.newaxis, :]
+        with fits.open(
+            filename, memmap=True, do_not_scale_image_data=False
+        ) as hdu_list:
+            for hdu in hdu_list[1:]:
+                time = hdu.header["TIME"] + hdu.header["MILLITIM"] / 1000.0
+                time_ind = np.nonzero(time_array == time + int_time / 2.0)[0]
+                if time_ind.size == 0:
+                    continue
+                time_ind = time_ind[0]
+                blt_slice = slice(time_ind * n_bls, (time_ind + 1) * n_bls)
+                # the HDU data have shape (Nfreqs, Nbls * Npols * 2) with the real
+                # and imaginary parts interleaved. Index them into
+                # (Nfreqs, Nbls, Npols) and move the frequency axis so the
+                # values can be set directly in a view of the data_array.
+                hdu_data = hdu.data
+                data = self.data_array[blt_slice, 0, freq_slice, :]
+                data.real = np.moveaxis(hdu_data[chan_inds, map_inds], 0, 1)
+                np.multiply(
+                    np.moveaxis(hdu_data[chan_inds, map_inds + 1], 0, 1),
+                    imag_sign,
+                    out=data.imag,
+                )
+                self.nsample_array[blt_slice, 0, freq_slice, :] = 1.0
+                self.flag_array[blt_slice, 0, freq_slice, :] = False
+                del hdu_data, data
+
+    def _get_flag_init_masks(
+        self, num_fine_chan, edge_width, start_flag, end_flag, flag_dc_offset,
+    ):
+        """
+        Get the frequencies and times to flag in the routine flagging.
+
+        See `flag_init` for details of the parameters and errors raised. The
+        object's frequency axis must be made of whole coarse channels and its
+        time axis must span the observation.
+
+        Returns
+        -------
+        freq_flags : ndarray of bool
+            Frequencies to flag, shape (Nfreqs,).
+        time_flags : ndarray of bool
+            Unique times to flag, shape (Ntimes,).
+
+        """
+        if (edge_width % self.channel_width) > 0:
+            raise ValueError(
+                "The edge_width must be an integer multiple of the "
+                "channel_width of the data or zero."
+            )
+        if (start_flag % self.integration_time[0]) > 0:
+            raise ValueError(
+                "The start_flag must be an integer multiple of the "
+                "integration_time of the data or zero."
+            )
+        if (end_flag % self.integration_time[0]) > 0:
+            raise ValueError(
+                "The end_flag must be an integer multiple of the "
+                "integration_time of the data or zero."
+            )
+
+        num_ch_flag = int(edge_width / self.channel_width)
+        num_start_flag = int(start_flag / self.integration_time[0])
+        num_end_flag = int(end_flag / self.integration_time[0])
+
+        # position of each channel in its coarse channel
+        fine_chans = np.arange(self.Nfreqs) % num_fine_chan
+        # flag the edges of each coarse channel
+        freq_flags = (fine_chans < num_ch_flag) | (
+            fine_chans >= num_fine_chan - num_ch_flag
+        )
+        if flag_dc_offset:
+            freq_flags |= fine_chans == num_fine_chan // 2
+
+        time_inds = np.arange(self.Ntimes)
+        time_flags = (time_inds < num_start_flag) | (
+            time_inds >= self.Ntimes - num_end_flag
+        )
+
+        return freq_flags, time_flags
 
     def flag_init(
         self,
@@ -110,51 +249,12 @@ class MWACorrFITS(UVData):
             (0 also acceptable).
 
         """
-        if (edge_width % self.channel_width) > 0:
-            raise ValueError(
-                "The edge_width must be an integer multiple of the "
-                "channel_width of the data or zero."
-            )
-        if (start_flag % self.integration_time[0]) > 0:
-            raise ValueError(
-                "The start_flag must be an integer multiple of the "
-                "integration_time of the data or zero."
-            )
-        if (end_flag % self.integration_time[0]) > 0:
-            raise ValueError(
-                "The end_flag must be an integer multiple of the "
-                "integration_time of the data or zero."
-            )
-
-        num_ch_flag = int(edge_width / self.channel_width)
-        num_start_flag = int(start_flag / self.integration_time[0])
-        num_end_flag = int(end_flag / self.integration_time[0])
-
-        if num_ch_flag > 0:
-            edge_inds = []
-            for ch_count in range(num_ch_flag):
-                # count up from the left
-                left_chans = list(range(ch_count, self.Nfreqs, num_fine_chan))
-                # count down from the right
-                right_chans = list(range(self.Nfreqs - 1 - ch_count, 0, -num_fine_chan))
-                edge_inds = edge_inds + left_chans + right_chans
-
-            self.flag_array[:, :, edge_inds, :] = True
-
-        if flag_dc_offset:
-            center_inds = list(range(num_fine_chan // 2, self.Nfreqs, num_fine_chan))
-
-            self.flag_array[:, :, center_inds, :] = True
-
-        if (num_start_flag > 0) or (num_end_flag > 0):
-            shape = self.flag_array.shape
-            reshape = [self.Ntimes, self.Nbls, self.Nspws, self.Nfreqs, self.Npols]
-            self.flag_array = np.reshape(self.flag_array, reshape)
-            if num_start_flag > 0:
-                self.flag_array[:num_start_flag, :, :, :, :] = True
-            if num_end_flag > 0:
-                self.flag_array[-num_end_flag:, :, :, :, :] = True
-            self.flag_array = np.reshape(self.flag_array, shape)
+        freq_flags, time_flags = self._get_flag_init_masks(
+            num_fine_chan, edge_width, start_flag, end_flag, flag_dc_offset
+        )
+        self.flag_array[:, :, freq_flags, :] = True
+        # the data are ordered by time then baseline
+        self.flag_array[np.repeat(time_flags, self.Nbls)] = True
 
     def read_mwa_corr_fits(
         self,
@@ -170,10 +270,19 @@ class MWACorrFITS(UVData):
         start_flag=2.0,
         end_flag=2.0,
         flag_dc_offset=True,
+        n_workers=1,
+        antenna_nums=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        keep_all_metadata=True,
     ):
         """
         Read in MWA correlator gpu box files.
 
+        The antenna, frequency and time selections are applied while reading,
+        so only the selected parts of the gpubox files are read into memory.
+
         Parameters
         ----------
         filelist : list of str
@@ -224,6 +333,26 @@ class MWACorrFITS(UVData):
         flag_dc_offset: bool
             Only used if flag_init is True. Set to True to flag the center fine
             channel of each coarse channel.
+        n_workers : int
+            Number of gpubox files to read concurrently using a thread pool.
+        antenna_nums : array_like of int, optional
+            The antennas numbers to include when reading data into the object
+            (antenna positions and names for the removed antennas will be retained
+            unless `keep_all_metadata` is False).
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to include when reading data into the
+            object. Gpubox files for coarse channels that contain none of these
+            frequency channels are not read.
+        times : array_like of float, optional
+            The times to include when reading data into the object, each value
+            passed here should exist in the time_array.
+        time_range : array_like of float, optional
+            The time range in Julian Date to include when reading data into
+            the object, must be length 2. Some of the times in the object should
+            fall between the first and last elements. Cannot be used with `times`.
+        keep_all_metadata : bool
+            Option to keep all the metadata associated with antennas, even those
+            that do not have data associated with them after the select option.
 
         Raises
         ------
@@ -550,49 +679,11 @@ class MWACorrFITS(UVData):
                 * 1000
             )
 
-        # read data into an array with dimensions (time, uv, baselines*pols)
-        self.data_array = np.zeros(
-            (self.Ntimes, self.Nfreqs, self.Nbls * self.Npols), dtype=np.complex128
-        )
-        self.nsample_array = np.zeros(
-            (self.Ntimes, self.Nfreqs, self.Nbls * self.Npols), dtype=np.float32
-        )
-        self.flag_array = np.full(
-            (self.Ntimes, self.Nfreqs, self.Nbls * self.Npols), True
-        )
-
-        # read data files
-        for file in file_dict["data"]:
-            # get the file number from the file name
-            file_num = int(file.split("_")[-2][-2:])
-            # map file number to frequency index
-            freq_ind = file_nums_to_index[file_num] * num_fine_chans
-            with fits.open(
-                file, memmap=False, do_not_scale_image_data=False
-            ) as hdu_list:
-                # count number of times
-                end_list = len(hdu_list)
-                for i in range(1, end_list):
-                    time = (
-                        hdu_list[i].header["TIME"]
-                        + hdu_list[i].header["MILLITIM"] / 1000.0
-                        + int_time / 2.0
-                    )
-                    time_ind = np.where(time_array == time)[0][0]
-                    # dump data into matrix
-                    # and take data from real to complex numbers
-                    self.data_array[
-                        time_ind, freq_ind : freq_ind + num_fine_chans, :
-                    ] = (hdu_list[i].data[:, 0::2] + 1j * hdu_list[i].data[:, 1::2])
-                    self.nsample_array[
-                        time_ind, freq_ind : freq_ind + num_fine_chans, :
-                    ] = 1.0
-                    self.flag_array[
-                        time_ind, freq_ind : freq_ind + num_fine_chans, :
-                    ] = False
-
-        # polarizations are ordered yy, yx, xy, xx
-        self.polarization_array = np.array([-6, -8, -7, -5])
+        # polarizations are ordered yy, yx, xy, xx in the files. The data are
+        # put directly into AIPS order (xx, yy, xy, yx) as they are read.
+        corr_pols = np.array([-6, -8, -7, -5])
+        pol_order = np.argsort(np.abs(corr_pols))
+        self.polarization_array = corr_pols[pol_order]
 
         # build mapper from antenna numbers and polarizations to pfb inputs
         corr_ants_to_pfb_inputs = {}
@@ -615,70 +706,101 @@ class MWACorrFITS(UVData):
         map_inds, conj = _corr_fits.generate_map(
             corr_ants_to_pfb_inputs, pfb_inputs_to_outputs, map_inds, conj,
         )
-        # reorder data
-        self.data_array = self.data_array[:, :, map_inds]
-        self.nsample_array = self.nsample_array[:, :, map_inds]
-        self.flag_array = self.flag_array[:, :, map_inds]
-        # conjugate data
-        self.data_array[:, :, conj] = np.conj(self.data_array[:, :, conj])
-        # reshape data
-        self.data_array = self.data_array.reshape(
-            (self.Ntimes, self.Nfreqs, self.Nbls, self.Npols)
+        # reshape to (Nbls, Npols) in the final polarization order and convert
+        # to indices of the real parts in the interleaved file data
+        map_inds = 2 * map_inds.reshape(self.Nbls, self.Npols)[:, pol_order]
+        conj = conj.reshape(self.Nbls, self.Npols)[:, pol_order]
+
+        # get the routine flags for the whole observation before any selection
+        if flag_init:
+            freq_flags, time_flags = self._get_flag_init_masks(
+                num_fine_chans, edge_width, start_flag, end_flag, flag_dc_offset
+            )
+
+        # apply any selection to the metadata. The selected baseline-times
+        # always form a regular grid of times and baselines.
+        blt_inds, freq_inds, _, history_update_string = self._select_preprocess(
+            antenna_nums,
+            None,
+            None,
+            None,
+            None,
+            freq_chans,
+            times,
+            time_range,
+            None,
+            None,
         )
-        self.nsample_array = self.nsample_array.reshape(
-            (self.Ntimes, self.Nfreqs, self.Nbls, self.Npols)
+        if blt_inds is not None:
+            blt_inds = np.asarray(blt_inds)
+            time_inds = np.unique(blt_inds // self.Nbls)
+            bl_inds = np.unique(blt_inds % self.Nbls)
+            time_array = time_array[time_inds]
+            map_inds = map_inds[bl_inds]
+            conj = conj[bl_inds]
+        else:
+            time_inds = np.arange(self.Ntimes)
+        if blt_inds is not None or freq_inds is not None:
+            self._select_metadata(
+                blt_inds, freq_inds, None, history_update_string, keep_all_metadata
+            )
+        if freq_inds is not None:
+            freq_inds = np.asarray(freq_inds)
+        else:
+            freq_inds = np.arange(self.Nfreqs)
+
+        # read the data files directly into the final arrays
+        self.data_array = np.zeros(
+            (self.Nblts, self.Nspws, self.Nfreqs, self.Npols), dtype=np.complex128
         )
-        self.flag_array = self.flag_array.reshape(
-            (self.Ntimes, self.Nfreqs, self.Nbls, self.Npols)
+        self.nsample_array = np.zeros(
+            (self.Nblts, self.Nspws, self.Nfreqs, self.Npols), dtype=np.float32
         )
-        self.data_array = np.swapaxes(self.data_array, 1, 2)
-        self.nsample_array = np.swapaxes(self.nsample_array, 1, 2)
-        self.flag_array = np.swapaxes(self.flag_array, 1, 2)
-
-        # generage baseline flags for flagged ants
-        bad_ant_inds = []
-        for ant1 in range(128):
-            for ant2 in range(ant1, 128):
-                if ant1 in flagged_ants or ant2 in flagged_ants:
-                    bad_ant_inds.append(int(128 * ant1 - ant1 * (ant1 + 1) / 2 + ant2))
-        self.flag_array[:, bad_ant_inds, :, :] = True
-
-        # combine baseline and time axes
-        self.data_array = self.data_array.reshape((self.Nblts, self.Nfreqs, self.Npols))
-        self.flag_array = self.flag_array.reshape((self.Nblts, self.Nfreqs, self.Npols))
-        self.nsample_array = self.nsample_array.reshape(
-            (self.Nblts, self.Nfreqs, self.Npols)
+        self.flag_array = np.full(
+            (self.Nblts, self.Nspws, self.Nfreqs, self.Npols), True
         )
 
+        read_file = functools.partial(
+            self._read_fits_file,
+            time_array=time_array,
+            file_nums_to_index=file_nums_to_index,
+            num_fine_chans=num_fine_chans,
+            int_time=int_time,
+            freq_inds=freq_inds,
+            map_inds=map_inds,
+            conj=conj,
+        )
+        if n_workers > 1 and len(file_dict["data"]) > 1:
+            # files cover separate parts of the arrays so can be read in parallel
+            with concurrent.futures.ThreadPoolExecutor(max_workers=n_workers) as pool:
+                list(pool.map(read_file, file_dict["data"]))
+        else:
+            for file in file_dict["data"]:
+                read_file(file)
+
+        # generate baseline flags for flagged ants
+        bad_ant_blts = np.isin(self.ant_1_array, flagged_ants) | np.isin(
+            self.ant_2_array, flagged_ants
+        )
+        self.flag_array[bad_ant_blts] = True
+
         # cable delay corrections
         if correct_cable_len:
             self.correct_cable_length(cable_lens)
 
-        # add spectral window index
-        self.data_array = self.data_array[:, np.newaxis, :, :]
-        self.flag_array = self.flag_array[:, np.newaxis, :, :]
-        self.nsample_array = self.nsample_array[:, np.newaxis, :, :]
-
         # because of an annoying discrepancy between file conventions, in order
         # to be consistent with the uvw vector direction, all the data must
         # be conjugated
-        self.data_array = np.conj(self.data_array)
-
-        # reorder polarizations
-        self.reorder_pols()
+        np.conj(self.data_array, out=self.data_array)
 
         # phasing
         if phase_to_pointing_center:
             self.phase(ra_rad, dec_rad)
 
         if flag_init:
-            self.flag_init(
-                num_fine_chans,
-                edge_width=edge_width,
-                start_flag=start_flag,
-                end_flag=end_flag,
-                flag_dc_offset=flag_dc_offset,
-            )
+            self.flag_array[:, :, freq_flags[freq_inds], :] = True
+            # the data are ordered by time then baseline
+            self.flag_array[np.repeat(time_flags[time_inds], self.Nbls)] = True
 
         if use_cotter_flags:
             raise NotImplementedError(
@@ -0,0 +1,216 @@
+# -*- mode: python; coding: utf-8 -*-
+# Copyright (c) 2020 Radio Astronomy Software Group
+# Licensed under the 2-clause BSD License
+
+"""Reusable selection plans for UVData objects."""
+import concurrent.futures
+
+import numpy as np
+
+from .. import utils as uvutils
+
+__all__ = ["SelectionPlan"]
+
+
+class SelectionPlan(object):
+    """
+    A selection on a UVData object that can be applied to many objects.
+
+    The baseline-time, frequency and polarization indices are calculated once
+    (see `UVData.get_selection_plan`) and can then be applied to any UVData
+    object with the same layout, for example a set of files with the same
+    baselines, frequencies and polarizations. Evenly spaced indices are
+    applied as slices and the data-like arrays are indexed in a single pass
+    each, in parallel threads.
+
+    Parameters
+    ----------
+    blt_inds : list of int
+        Baseline-time indices to keep. Can be None (to keep everything).
+    freq_inds : list of int
+        Frequency indices to keep. Can be None (to keep everything).
+    pol_inds : list of int
+        Polarization indices to keep. Can be None (to keep everything).
+    history_update_string : str
+        String to append to the end of the history.
+    layout : dict
+        Metadata the plan depends on, keyed on UVData attribute name. Objects
+        the plan is applied to must match these values.
+
+    """
+
+    def __init__(self, blt_inds, freq_inds, pol_inds, history_update_string, layout):
+        """Set up the selection plan."""
+        self.blt_inds = blt_inds
+        self.freq_inds = freq_inds
+        self.pol_inds = pol_inds
+        self.history_update_string = history_update_string
+        self.layout = layout
+        self._axis_inds = (blt_inds, None, freq_inds, pol_inds)
+
+    def check_compatible(self, uv):
+        """
+        Check that the plan can be applied to a UVData object.
+
+        Parameters
+        ----------
+        uv : UVData object
+            Object to check against the layout of the plan.
+
+        Raises
+        ------
+        ValueError
+            If the object does not match the layout the plan was made from.
+
+        """
+        for attr, value in self.layout.items():
+            this_value = getattr(uv, attr)
+            if isinstance(value, np.ndarray):
+                uvparam = getattr(uv, "_" + attr)
+                if this_value.shape != value.shape:
+                    match = False
+                elif uvparam.tols is not None and np.issubdtype(
+                    value.dtype, np.floating
+                ):
+                    match = np.allclose(
+                        this_value, value, rtol=uvparam.tols[0], atol=uvparam.tols[1]
+                    )
+                else:
+                    match = np.array_equal(this_value, value)
+            else:
+                match = this_value == value
+            if not match:
+                raise ValueError(
+                    "The {attr} on this object does not match the object the "
+                    "selection plan was made from.".format(attr=attr)
+                )
+
+    def _select_array(self, array):
+        """
+        Apply the plan to a data-like array.
+
+        Parameters
+        ----------
+        array : ndarray
+            Array with shape (Nblts, Nspws, Nfreqs, Npols).
+
+        Returns
+        -------
+        ndarray
+            New array with just the selected elements.
+
+        """
+        if not isinstance(array, np.ndarray):
+            # lazily loaded (e.g. dask) arrays only support fancy indexing
+            # along one axis at a time
+            for axis, inds in enumerate(self._axis_inds):
+                if inds is not None:
+                    index = uvutils._inds_to_index(inds)
+                    array = array[(slice(None),) * axis + (index,)]
+            return array
+
+        index = uvutils._get_multi_axis_index(self._axis_inds, array.shape)
+        selected = array[index]
+        if all(isinstance(ind, slice) for ind in index):
+            # make a copy rather than keeping a view on the full array
+            selected = selected.copy()
+        return selected
+
+    def apply(
+        self,
+        uv,
+        inplace=True,
+        n_workers=3,
+        keep_all_metadata=True,
+        run_check=True,
+        check_extra=True,
+        run_check_acceptability=True,
+    ):
+        """
+        Apply the selection to a UVData object.
+
+        Parameters
+        ----------
+        uv : UVData object
+            Object to select on, it must have the same layout as the object the
+            plan was made from.
+        inplace : bool
+            Option to perform the select directly on uv or return a new UVData
+            object with just the selected data.
+        n_workers : int
+            Number of threads to use to index the data-like arrays. Set to 1 to
+            index them one after the other.
+        keep_all_metadata : bool
+            Option to keep all the metadata associated with antennas, even those
+            that do do not have data associated with them after the select option.
+        run_check : bool
+            Option to check for the existence and proper shapes of parameters
+            after downselecting data on this object.
+        check_extra : bool
+            Option to check optional parameters as well as required ones.
+        run_check_acceptability : bool
+            Option to check acceptable range of the values of parameters after
+            downselecting data on this object.
+
+        Returns
+        -------
+        UVData object or None
+            None is returned if inplace is True, otherwise a new UVData object
+            with just the selected data is returned
+
+        Raises
+        ------
+        ValueError
+            If the object does not match the layout the plan was made from.
+
+        """
+        self.check_compatible(uv)
+        if n_workers < 1:
+            raise ValueError("n_workers must be a positive integer.")
+
+        if inplace:
+            uv_object = uv
+        else:
+            uv_object = uv.copy()
+
+        # do select operations on everything except data_array, flag_array
+        # and nsample_array
+        uv_object._select_metadata(
+            self.blt_inds,
+            self.freq_inds,
+            self.pol_inds,
+            self.history_update_string,
+            keep_all_metadata,
+        )
+
+        if not uv_object.metadata_only and any(
+            inds is not None for inds in (self.blt_inds, self.freq_inds, self.pol_inds)
+        ):
+            data_params = [
+                param_name
+                for param_name, param in zip(
+                    uv_object._data_params, uv_object.data_like_parameters
+                )
+                if param is not None
+            ]
+            arrays = [getattr(uv_object, param_name) for param_name in data_params]
+            if n_workers > 1 and len(arrays) > 1:
+                # numpy releases the GIL while copying so the arrays can be
+                # indexed in parallel
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=n_workers
+                ) as pool:
+                    selected = list(pool.map(self._select_array, arrays))
+            else:
+                selected = [self._select_array(array) for array in arrays]
+            for param_name, array in zip(data_params, selected):
+                setattr(uv_object, param_name, array)
+
+        # check if object is uv_object-consistent
+        if run_check:
+            uv_object.check(
+                check_extra=check_extra, run_check_acceptability=run_check_acceptability
+            )
+
+        if not inplace:
+            return uv_object
@@ -6,6 +6,7 @@ cimport cython
 cimport numpy
 cimport libcpp.complex
 from libc.string cimport strcmp
+from libcpp.vector cimport vector
 
 DEF PREAMBLE_SIZE=5
 
@@ -103,6 +104,24 @@ cdef inline void CHK_IO(int i) except *:
   if (i != 0):
     raise IOError("IO failed.")
 
+# read a numeric uv variable as doubles, whatever its type in the file.
+# fbuf and ibuf are scratch buffers of at least n elements.
+cdef int _getvr_double(int tno, const char *name, char var_type, double *out, int n, float *fbuf, int *ibuf) except -1:
+  cdef int k
+  if var_type == b"d":
+    uvgetvr_c(tno, H_DBLE, name, <char *>out, n)
+  elif var_type == b"r":
+    uvgetvr_c(tno, H_REAL, name, <char *>fbuf, n)
+    for k in range(n):
+      out[k] = fbuf[k]
+  elif var_type == b"i":
+    uvgetvr_c(tno, H_INT, name, <char *>ibuf, n)
+    for k in range(n):
+      out[k] = ibuf[k]
+  else:
+    raise ValueError(f"unsupported type for UV variable {name.decode()}: {chr(var_type)}")
+  return 0
+
 class MiriadError(RuntimeError):
   pass
 
@@ -446,6 +465,135 @@ cdef class UV:
 
     return (uvw, preamble[3], (i, j)), data, flags, nread
 
+  cpdef bulk_read(self, int n2read, dict vartable, list track_vars, int size_hint=1024) except +raise_miriad_error:
+    # Read all the remaining records into arrays, with one row per record.
+    # The preamble, data, flags and the per-record variables (pol, ra, dec,
+    # inttime and cnt if present) are copied in C into preallocated arrays
+    # that are doubled in size when they fill up. The values of the variables
+    # in track_vars are only returned when they change (as a list of
+    # (record index, value) tuples per variable).
+    cdef int nread, nrec = 0, capacity = max(size_hint, 1), length, updated, k
+    cdef int ntrack = len(track_vars)
+    cdef double preamble[PREAMBLE_SIZE]
+    cdef char var_type
+    cdef bint has_cnt = "cnt" in vartable
+    cdef char pol_type = ord(vartable["pol"][0])
+    cdef char ra_type = ord(vartable["ra"][0])
+    cdef char dec_type = ord(vartable["dec"][0])
+    cdef char inttime_type = ord(vartable["inttime"][0])
+    cdef char cnt_type = ord(vartable["cnt"][0]) if has_cnt else ord("d")
+    cdef double value
+    cdef numpy.ndarray[int, ndim=1] int_flags = np.zeros((n2read,), dtype=np.intc)
+    cdef numpy.ndarray[numpy.float32_t, ndim=1] fbuf = np.zeros((n2read,), dtype=np.float32)
+    cdef numpy.ndarray[int, ndim=1] ibuf = np.zeros((n2read,), dtype=np.intc)
+    cdef vector[char *] track_names
+    cdef vector[int] pending = vector[int](ntrack, 0)
+
+    cdef double[:, ::1] uvw_v, cnt_v
+    cdef double[::1] time_v, ra_v, dec_v, inttime_v, pol_v
+    cdef int[::1] ant_i_v, ant_j_v
+    cdef float complex[:, ::1] data_v
+    cdef numpy.uint8_t[:, ::1] flag_v
+
+    encoded_names = [name.encode() for name in track_vars]
+    for name in encoded_names:
+      track_names.push_back(<char *>name)
+    updates = {name: [] for name in track_vars}
+
+    arrays = {
+      "uvw": np.zeros((capacity, 3), dtype=np.float64),
+      "time": np.zeros((capacity,), dtype=np.float64),
+      "ant_i": np.zeros((capacity,), dtype=np.intc),
+      "ant_j": np.zeros((capacity,), dtype=np.intc),
+      "pol": np.zeros((capacity,), dtype=np.float64),
+      "ra": np.zeros((capacity,), dtype=np.float64),
+      "dec": np.zeros((capacity,), dtype=np.float64),
+      "inttime": np.zeros((capacity,), dtype=np.float64),
+      "data": np.zeros((capacity, n2read), dtype=np.complex64),
+      "flags": np.zeros((capacity, n2read), dtype=np.bool_),
+    }
+    if has_cnt:
+      arrays["cnt"] = np.zeros((capacity, n2read), dtype=np.float64)
+
+    while True:
+      if nrec == capacity:
+        # double the size of the arrays
+        for key, arr in arrays.items():
+          new_arr = np.zeros((2 * capacity,) + arr.shape[1:], dtype=arr.dtype)
+          new_arr[:capacity] = arr
+          arrays[key] = new_arr
+        capacity *= 2
+
+      if nrec == 0 or capacity == 2 * nrec:
+        # get views on the current arrays
+        uvw_v = arrays["uvw"]
+        time_v = arrays["time"]
+        ant_i_v = arrays["ant_i"]
+        ant_j_v = arrays["ant_j"]
+        pol_v = arrays["pol"]
+        ra_v = arrays["ra"]
+        dec_v = arrays["dec"]
+        inttime_v = arrays["inttime"]
+        data_v = arrays["data"]
+        flag_v = arrays["flags"].view(np.uint8)
+        if has_cnt:
+          cnt_v = arrays["cnt"]
+
+      while True:
+        uvread_c(self.tno, preamble, <float *>&data_v[nrec, 0], <int *>&int_flags[0], n2read, &nread)
+
+        # note variable updates in records skipped by decimation too
+        for k in range(ntrack):
+          uvprobvr_c(self.tno, track_names[k], &var_type, &length, &updated)
+          if updated:
+            pending[k] = 1
+
+        if (preamble[3] != self.curtime):
+          self.intcnt += 1
+          self.curtime = preamble[3]
+
+        if ((self.intcnt - self.decphase) % self.decimate == 0 or nread == 0):
+          break
+
+      if nread == 0:
+        break
+
+      uvw_v[nrec, 0] = preamble[0]
+      uvw_v[nrec, 1] = preamble[1]
+      uvw_v[nrec, 2] = preamble[2]
+      time_v[nrec] = preamble[3]
+      ant_i_v[nrec] = GETI(<int>preamble[4])
+      ant_j_v[nrec] = GETJ(<int>preamble[4])
+      for k in range(n2read):
+        flag_v[nrec, k] = int_flags[k] == 0
+
+      _getvr_double(self.tno, b"pol", pol_type, &pol_v[nrec], 1, &fbuf[0], &ibuf[0])
+      _getvr_double(self.tno, b"ra", ra_type, &ra_v[nrec], 1, &fbuf[0], &ibuf[0])
+      _getvr_double(self.tno, b"dec", dec_type, &dec_v[nrec], 1, &fbuf[0], &ibuf[0])
+      _getvr_double(
+        self.tno, b"inttime", inttime_type, &inttime_v[nrec], 1, &fbuf[0], &ibuf[0]
+      )
+      if has_cnt:
+        uvprobvr_c(self.tno, b"cnt", &var_type, &length, &updated)
+        if length != n2read:
+          raise ValueError(f"cnt has {length} channels but the data has {n2read}")
+        _getvr_double(self.tno, b"cnt", cnt_type, &cnt_v[nrec, 0], n2read, &fbuf[0], &ibuf[0])
+
+      for k in range(ntrack):
+        if pending[k]:
+          updates[track_vars[k]].append(
+            (nrec, self._rdvr(track_vars[k], vartable[track_vars[k]]))
+          )
+          pending[k] = 0
+
+      nrec += 1
+
+    records = {key: arr[:nrec] for key, arr in arrays.items()}
+    records["pol"] = records["pol"].astype(np.int64)
+    records["updates"] = updates
+
+    return records
+
   cpdef raw_write(self, object input_preamble, numpy.ndarray[dtype=DTYPE_c, ndim=1] data, numpy.ndarray[dtype=int, ndim=1] flags):
     cdef int nread
     cdef double preamble[PREAMBLE_SIZE]
@@ -465,6 +613,82 @@ cdef class UV:
 
     return
 
+  cpdef bulk_write(
+    self,
+    double[:, ::1] uvw,
+    double[::1] time,
+    int[::1] ant_i,
+    int[::1] ant_j,
+    int[::1] pols,
+    double[::1] lst,
+    double[::1] inttime,
+    double[::1] ra,
+    double[::1] dec,
+    float complex[:, :, ::1] data,
+    int[:, :, ::1] flags,
+    double[:, :, ::1] cnt,
+  ) except +raise_miriad_error:
+    # Write one record per baseline-time and polarization, with the data,
+    # flags (non-zero for good data, per the Miriad convention) and cnt
+    # arrays shaped (Nrecs, Npols, Nchan). The per-record variables (lst,
+    # inttime, ra, dec, pol and cnt) are only passed to Miriad when they
+    # differ from the previous record, the first record of each call always
+    # writes them.
+    cdef int nrec = uvw.shape[0], npol = pols.shape[0], nchan = data.shape[2]
+    cdef int rec, p, k
+    cdef bint first, cnt_changed
+    cdef double preamble[PREAMBLE_SIZE]
+
+    if (
+      time.shape[0] != nrec or ant_i.shape[0] != nrec or ant_j.shape[0] != nrec
+      or lst.shape[0] != nrec or inttime.shape[0] != nrec or ra.shape[0] != nrec
+      or dec.shape[0] != nrec
+    ):
+      raise ValueError("All the per record arrays must have the same length.")
+    if uvw.shape[1] != 3:
+      raise ValueError(f"uvw must have shape (Nrecs, 3) but got {uvw.shape[1]}")
+    for arr in (data, flags, cnt):
+      if arr.shape[0] != nrec or arr.shape[1] != npol or arr.shape[2] != nchan:
+        raise ValueError("data, flags and cnt must have shape (Nrecs, Npols, Nchan).")
+
+    for rec in range(nrec):
+      first = rec == 0
+      if first or lst[rec] != lst[rec - 1]:
+        uvputvr_c(self.tno, H_DBLE, b"lst", <char *>&lst[rec], 1)
+      if first or inttime[rec] != inttime[rec - 1]:
+        uvputvr_c(self.tno, H_DBLE, b"inttime", <char *>&inttime[rec], 1)
+      if first or ra[rec] != ra[rec - 1]:
+        uvputvr_c(self.tno, H_DBLE, b"ra", <char *>&ra[rec], 1)
+      if first or dec[rec] != dec[rec - 1]:
+        uvputvr_c(self.tno, H_DBLE, b"dec", <char *>&dec[rec], 1)
+
+      preamble[0] = uvw[rec, 0]
+      preamble[1] = uvw[rec, 1]
+      preamble[2] = uvw[rec, 2]
+      preamble[3] = time[rec]
+      preamble[4] = MKBL(ant_i[rec], ant_j[rec])
+
+      for p in range(npol):
+        if first or npol > 1:
+          uvputvr_c(self.tno, H_INT, b"pol", <char *>&pols[p], 1)
+
+        cnt_changed = first
+        if not cnt_changed:
+          for k in range(nchan):
+            if p > 0:
+              cnt_changed = cnt[rec, p, k] != cnt[rec, p - 1, k]
+            else:
+              cnt_changed = cnt[rec, 0, k] != cnt[rec - 1, npol - 1, k]
+            if cnt_changed:
+              break
+        if cnt_changed:
+          uvputvr_c(self.tno, H_DBLE, b"cnt", <char *>&cnt[rec, p, 0], nchan)
+
+        uvwrite_c(self.tno, preamble, <float *>&data[rec, p, 0], &flags[rec, p, 0], nchan)
+        first = False
+
+    return
+
   cpdef copyvr(self, UV uv):
     uvcopyvr_c(uv.tno, self.tno)
     return
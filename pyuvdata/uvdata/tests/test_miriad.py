@@ -836,6 +836,83 @@ def test_miriad_and_aipy_reads(uv_in_paper):
     uv_aipy.close()
 
 
+def test_aipy_read_all():
+    testfile = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAA")
+    uv = aipy_extracts.UV(testfile)
+    pols, uvws, times, ants, data, flags = [], [], [], [], [], []
+    for (uvw, t, (i, j)), d, f in uv.all(raw=True):
+        pols.append(uv["pol"])
+        uvws.append(uvw)
+        times.append(t)
+        ants.append((i, j))
+        data.append(d)
+        flags.append(f)
+    uv.close()
+
+    # use a small size hint to exercise growing the arrays
+    uv = aipy_extracts.UV(testfile)
+    records = uv.read_all(track_vars=["pol"], size_hint=3)
+    uv.close()
+
+    assert records["time"].size == len(times)
+    assert np.array_equal(records["time"], times)
+    assert np.array_equal(records["uvw"], uvws)
+    assert np.array_equal(np.stack([records["ant_i"], records["ant_j"]], 1), ants)
+    assert np.array_equal(records["pol"], pols)
+    assert np.array_equal(records["data"], data)
+    assert np.array_equal(records["flags"], flags)
+    update_recs = [rec for rec, _ in records["updates"]["pol"]]
+    assert update_recs[0] == 0
+    assert np.all(np.diff(np.asarray(pols)[update_recs]) != 0)
+
+
+def test_aipy_write_all(tmp_path):
+    testfile = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAA")
+    write_file = str(tmp_path / "outtest_miriad.uv")
+    uv = aipy_extracts.UV(testfile)
+    records = uv.read_all()
+    uv.rewind()
+    uv_out = aipy_extracts.UV(write_file, status="new")
+    # the per-record variables have other types in this file
+    uv_out.init_from_uv(uv, exclude=["pol", "lst", "cnt", "ra", "dec", "inttime"])
+    uv.close()
+    nrecs = records["time"].size
+    pols = np.unique(records["pol"])
+    assert pols.size == 1
+
+    lst = np.linspace(0, 1, nrecs)
+    write_args = [
+        records["uvw"],
+        records["time"],
+        records["ant_i"],
+        records["ant_j"],
+        pols,
+        lst,
+        records["inttime"],
+        records["ra"],
+        records["dec"],
+        records["data"][:, np.newaxis],
+        records["flags"][:, np.newaxis],
+        np.ones(records["data"].shape + (1,)).transpose(0, 2, 1),
+    ]
+    uv_out.add_var("inttime", "r")
+    with pytest.raises(ValueError, match="The inttime variable has type r"):
+        uv_out.write_all(*write_args)
+    uv_out.add_var("inttime", "d")
+
+    # use a small chunk size so there are several calls to bulk_write
+    uv_out.write_all(*write_args, chunk_size=7)
+    uv_out.close()
+
+    uv_out = aipy_extracts.UV(write_file)
+    records_out = uv_out.read_all(track_vars=["lst"])
+    uv_out.close()
+    for key in ["uvw", "time", "ant_i", "ant_j", "pol", "data", "flags"]:
+        assert np.array_equal(records_out[key], records[key])
+    assert np.array_equal(records_out["cnt"], np.ones(records["data"].shape))
+    assert np.array_equal([value for _, value in records_out["updates"]["lst"]], lst)
+
+
 def test_miriad_telescope_locations():
     testfile = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAA")
     # test load_telescope_coords w/ blank Miriad
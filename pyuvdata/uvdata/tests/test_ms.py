@@ -26,17 +26,56 @@ def test_cotter_ms():
 
     # check that a select on read works
     uvobj2 = UVData()
-    uvtest.checkWarnings(
-        uvobj2.read,
-        [testfile],
-        {"freq_chans": np.arange(2)},
-        message="Warning: select on read keyword set",
-    )
+    uvobj2.read(testfile, freq_chans=np.arange(2))
     uvobj.select(freq_chans=np.arange(2))
     assert uvobj == uvobj2
     del uvobj
 
 
+@pytest.mark.parametrize("blt_chunk_size", [None, 1, 7])
+@pytest.mark.parametrize(
+    "select_kwargs",
+    [
+        {"antenna_nums": "first_ants"},
+        {"times": "every_other_time"},
+        {"freq_chans": [0, 2, 3, 9]},
+        {"freq_chans": np.arange(1, 10, 4), "polarizations": "last_pols"},
+        {"bls": "first_bls", "polarizations": "first_pol"},
+        {"blt_inds": [0, 1, 5, 30, 31]},
+    ],
+)
+def test_read_ms_select_on_read(select_kwargs, blt_chunk_size):
+    """Test that select on read matches reading everything and then selecting."""
+    uv_full = UVData()
+    testfile = os.path.join(DATA_PATH, "1102865728_small.ms")
+    uv_full.read(testfile)
+
+    select_kwargs = dict(select_kwargs)
+    if select_kwargs.get("antenna_nums") == "first_ants":
+        select_kwargs["antenna_nums"] = np.unique(uv_full.ant_1_array)[:3]
+    if select_kwargs.get("times") == "every_other_time":
+        select_kwargs["times"] = np.unique(uv_full.time_array)[::2]
+    if select_kwargs.get("bls") == "first_bls":
+        select_kwargs["bls"] = uv_full.get_antpairs()[:4]
+    if select_kwargs.get("polarizations") == "first_pol":
+        select_kwargs["polarizations"] = uv_full.polarization_array[:1]
+    elif select_kwargs.get("polarizations") == "last_pols":
+        select_kwargs["polarizations"] = uv_full.polarization_array[-2:]
+
+    uv_select = UVData()
+    uv_select.read_ms(testfile, blt_chunk_size=blt_chunk_size, **select_kwargs)
+    uv_full.select(**select_kwargs)
+    assert uv_select == uv_full
+
+
+def test_read_ms_blt_chunk_size_error():
+    """Test an error is raised for a blt_chunk_size less than 1."""
+    uvobj = UVData()
+    testfile = os.path.join(DATA_PATH, "1102865728_small.ms")
+    with pytest.raises(ValueError, match="blt_chunk_size must be a positive integer."):
+        uvobj.read_ms(testfile, blt_chunk_size=0)
+
+
 def test_read_nrao():
     """Test reading in a CASA tutorial ms file."""
     uvobj = UVData()
@@ -130,7 +130,26 @@ def test_select_on_read():
             "time_range": [np.min(mwa_uv.time_array), np.mean(mwa_uv.time_array)],
         },
         message=[
-            'Warning: select on read keyword set, but file_type is "mwa_corr_fits"',
+            "telescope_location is not set. Using known values for MWA.",
+            "some coarse channel files were not submitted",
+        ],
+        nwarnings=2,
+    )
+    assert mwa_uv == mwa_uv2
+
+    # polarization selection is done after reading
+    mwa_uv.select(polarizations=["xx"])
+    uvtest.checkWarnings(
+        mwa_uv2.read,
+        func_args=[filelist[0:2]],
+        func_kwargs={
+            "correct_cable_len": True,
+            "time_range": [np.min(mwa_uv.time_array), np.mean(mwa_uv.time_array)],
+            "polarizations": ["xx"],
+        },
+        message=[
+            "Warning: a select on read keyword is set that is not supported by "
+            "read_mwa_corr_fits.",
             "telescope_location is not set. Using known values for MWA.",
             "some coarse channel files were not submitted",
         ],
@@ -139,6 +158,33 @@ def test_select_on_read():
     assert mwa_uv == mwa_uv2
 
 
+@pytest.mark.filterwarnings("ignore:telescope_location is not set. ")
+@pytest.mark.filterwarnings("ignore:coarse channels are not contiguous")
+@pytest.mark.filterwarnings("ignore:some coarse channel files were not submitted")
+@pytest.mark.parametrize(
+    "select_kwargs",
+    [
+        {"antenna_nums": [18, 31, 66, 95]},
+        {"freq_chans": np.arange(2, 7)},
+        {"freq_chans": np.arange(4, 12)},
+        {"times_index": [1, 2]},
+        {"antenna_nums": [18, 31, 66, 95], "freq_chans": [0, 9, 15], "times_index": 0},
+    ],
+)
+def test_partial_read(flag_file_init, select_kwargs):
+    """Test reading part of the data matches reading everything then selecting."""
+    mwa_uv = UVData()
+    mwa_uv.read(flag_file_init, correct_cable_len=True, edge_width=0)
+    if "times_index" in select_kwargs:
+        times_index = select_kwargs.pop("times_index")
+        select_kwargs["times"] = np.unique(mwa_uv.time_array)[times_index]
+    mwa_uv.select(**select_kwargs)
+
+    mwa_uv2 = UVData()
+    mwa_uv2.read(flag_file_init, correct_cable_len=True, edge_width=0, **select_kwargs)
+    assert mwa_uv == mwa_uv2
+
+
 @pytest.mark.filterwarnings("ignore:telescope_location is not set. ")
 @pytest.mark.filterwarnings("ignore:some coarse channel files were not submitted")
 def test_read_mwa_read_cotter():
@@ -314,6 +360,18 @@ def test_multiple_coarse():
     assert mwa_uv1 == mwa_uv2
 
 
+@pytest.mark.filterwarnings("ignore:telescope_location is not set. ")
+@pytest.mark.filterwarnings("ignore:coarse channels are not contiguous")
+@pytest.mark.filterwarnings("ignore:some coarse channel files were not submitted")
+def test_read_mwa_parallel(flag_file_init):
+    """Test reading the gpubox files concurrently matches reading them in turn."""
+    mwa_uv1 = UVData()
+    mwa_uv2 = UVData()
+    mwa_uv1.read(flag_file_init, correct_cable_len=True, flag_init=False)
+    mwa_uv2.read(flag_file_init, correct_cable_len=True, flag_init=False, n_workers=2)
+    assert mwa_uv1 == mwa_uv2
+
+
 @pytest.mark.filterwarnings("ignore:telescope_location is not set. ")
 @pytest.mark.filterwarnings("ignore:some coarse channel files were not submitted")
 def test_ppds(tmp_path):
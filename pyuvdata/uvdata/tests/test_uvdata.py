@@ -7,6 +7,7 @@ import pytest
 import os
 import copy
 import itertools
+import concurrent.futures
 import h5py
 
 import numpy as np
@@ -705,6 +706,25 @@ def test_phase_unphase_hera_antpos(uv1_2_set_uvws):
     assert uv_raw_new == uv_phase
 
 
+@pytest.mark.parametrize("use_ant_pos", [True, False])
+def test_phase_unphase_hera_per_time(uv1_2_set_uvws, use_ant_pos):
+    uv_phase, uv_raw = uv1_2_set_uvws
+    # check that phasing all times at once matches phasing each time separately
+    uv_phase.phase(Angle("23h").rad, Angle("15d").rad, use_ant_pos=use_ant_pos)
+
+    for time in np.unique(uv_raw.time_array):
+        blt_inds = np.nonzero(uv_raw.time_array == time)[0]
+        uv_time = uv_raw.select(blt_inds=blt_inds, inplace=False)
+        uv_time.phase(Angle("23h").rad, Angle("15d").rad, use_ant_pos=use_ant_pos)
+        np.testing.assert_allclose(uv_phase.uvw_array[blt_inds], uv_time.uvw_array)
+        np.testing.assert_allclose(uv_phase.data_array[blt_inds], uv_time.data_array)
+
+        uv_time.unphase_to_drift(use_ant_pos=use_ant_pos)
+        uv_unphase = uv_phase.select(blt_inds=blt_inds, inplace=False)
+        uv_unphase.unphase_to_drift(use_ant_pos=use_ant_pos)
+        np.testing.assert_allclose(uv_unphase.uvw_array, uv_time.uvw_array)
+
+
 def test_phase_unphase_hera_zenith_timestamp(uv1_2_set_uvws):
     uv_phase, uv_raw = uv1_2_set_uvws
     # check that phasing to zenith with one timestamp has small changes
@@ -1712,6 +1732,65 @@ def test_select_not_inplace():
     assert uv1 == uv_object
 
 
+@pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
+@pytest.mark.parametrize("n_workers", [1, 3])
+@pytest.mark.parametrize(
+    "select_kwargs",
+    [
+        {"antenna_nums": [2, 6, 11, 20]},
+        {"freq_chans": np.arange(10, 20), "polarizations": [-1, -2]},
+        {"freq_chans": [1, 3, 4, 9], "polarizations": [-1, -3]},
+        {"antenna_nums": [2, 6, 11, 20], "freq_chans": [1, 3, 4, 9]},
+    ],
+)
+def test_selection_plan(select_kwargs, n_workers):
+    uv_object = UVData()
+    testfile = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.uvfits")
+    uv_object.read_uvfits(testfile)
+
+    plan = uv_object.get_selection_plan(**select_kwargs)
+    uv1 = uv_object.select(inplace=False, **select_kwargs)
+
+    # apply to an object with the same layout but different data
+    uv2 = uv_object.copy()
+    uv2.data_array *= 2
+    uv2 = plan.apply(uv2, inplace=False, n_workers=n_workers)
+    uv2.data_array /= 2
+    assert uv1 == uv2
+
+    plan.apply(uv_object, n_workers=n_workers)
+    assert uv1 == uv_object
+
+
+@pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
+def test_selection_plan_errors():
+    uv_object = UVData()
+    testfile = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.uvfits")
+    uv_object.read_uvfits(testfile)
+
+    plan = uv_object.get_selection_plan(antenna_nums=[2, 6, 11, 20], freq_chans=[1])
+    with pytest.raises(ValueError, match="n_workers must be a positive integer"):
+        plan.apply(uv_object, n_workers=0)
+
+    uv2 = uv_object.select(freq_chans=np.arange(32), inplace=False)
+    with pytest.raises(ValueError, match="The Nfreqs on this object does not match"):
+        plan.apply(uv2)
+
+    uv2 = uv_object.copy()
+    uv2.conjugate_bls(convention="ant2<ant1")
+    with pytest.raises(
+        ValueError, match="The baseline_array on this object does not match"
+    ):
+        plan.apply(uv2)
+
+    uv2 = uv_object.copy()
+    uv2.freq_array += 1e6
+    with pytest.raises(
+        ValueError, match="The freq_array on this object does not match"
+    ):
+        plan.apply(uv2)
+
+
 @pytest.mark.parametrize("metadata_only", [True, False])
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
 def test_conjugate_bls(metadata_only):
@@ -3128,6 +3207,41 @@ def test_fast_concat():
     assert uv2.Nbls == uv_auto.Nbls + uv_cross.Nbls
 
 
+@pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
+@pytest.mark.parametrize(
+    "axis,select_kwargs",
+    [
+        ("freq", [{"freq_chans": np.arange(i * 16, (i + 1) * 16)} for i in range(4)]),
+        ("polarization", [{"polarizations": [pol]} for pol in [-1, -2, -3, -4]]),
+        ("blt", [{"blt_inds": np.arange(i * 340, (i + 1) * 340)} for i in range(3)]),
+    ],
+)
+def test_fast_concat_list(axis, select_kwargs):
+    """Test concatenating a list of objects in one call."""
+    uv_full = UVData()
+    testfile = os.path.join(DATA_PATH, "day2_TDEM0003_10s_norx_1src_1spw.uvfits")
+    uv_full.read_uvfits(testfile)
+    if axis == "blt":
+        uv_full.select(blt_inds=np.arange(3 * 340))
+
+    uv_list = [uv_full.select(inplace=False, **kwargs) for kwargs in select_kwargs]
+
+    # concatenating the list should match concatenating the objects one at a time
+    uv_pairwise = uv_list[0].copy()
+    for uv in uv_list[1:]:
+        uv_pairwise.fast_concat(uv, axis, inplace=True)
+    uv_out = uv_list[0].fast_concat(uv_list[1:], axis)
+    assert uv_out.history.count("Combined data along") == 1
+
+    uv_out.history = uv_full.history
+    uv_pairwise.history = uv_full.history
+    assert uv_out == uv_pairwise
+    assert uv_out == uv_full
+
+    # check that the input was not modified
+    assert uv_list[0] == uv_full.select(inplace=False, **select_kwargs[0])
+
+
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
 def test_fast_concat_errors():
     uv_full = UVData()
@@ -3142,6 +3256,7 @@ def test_fast_concat_errors():
 
     cal = UVCal()
     pytest.raises(ValueError, uv1.fast_concat, cal, "freq", inplace=True)
+    pytest.raises(ValueError, uv1.fast_concat, [uv2, cal], "freq", inplace=True)
 
 
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
@@ -3679,6 +3794,36 @@ def test_antpair2ind():
     pytest.raises(ValueError, uv.antpair2ind, 0, 1, "foo")
 
 
+def test_antpair2ind_cache():
+    # Test the cached baseline to baseline-time index mapping is kept up to date
+    uv = UVData()
+    testfile = os.path.join(DATA_PATH, "zen.2458661.23480.HH.uvh5")
+    uv.read(testfile)
+
+    for ant1, ant2 in uv.get_antpairs():
+        inds = np.where((uv.ant_1_array == ant1) & (uv.ant_2_array == ant2))[0]
+        np.testing.assert_array_equal(uv.antpair2ind(ant1, ant2), inds)
+        bl = uv.antnums_to_baseline(ant1, ant2)
+        np.testing.assert_array_equal(uv._key2inds(bl)[0], inds)
+
+    ant1, ant2 = [ap for ap in uv.get_antpairs() if ap[0] < ap[1]][0]
+    # modifying the returned indices should not affect the cache
+    inds = uv.antpair2ind(ant1, ant2)
+    inds[:] = 0
+    assert not np.array_equal(uv.antpair2ind(ant1, ant2), inds)
+
+    # setting new baseline arrays should update the mapping
+    uv.select(blt_inds=np.arange(uv.Nblts)[::-1], inplace=True)
+    inds = np.where((uv.ant_1_array == ant1) & (uv.ant_2_array == ant2))[0]
+    np.testing.assert_array_equal(uv.antpair2ind(ant1, ant2), inds)
+
+    # as should conjugating baselines in place
+    uv.conjugate_bls(convention="ant2<ant1")
+    assert uv.antpair2ind(ant1, ant2).size == 0
+    np.testing.assert_array_equal(uv.antpair2ind(ant2, ant1), inds)
+    np.testing.assert_array_equal(uv._key2inds((ant1, ant2))[1], inds)
+
+
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
 def test_get_times():
     # Test function for easy access to times, to work in conjunction with get_data
@@ -4886,6 +5031,30 @@ def test_overlapping_data_add(tmp_path):
     return
 
 
+@pytest.mark.parametrize("axis", ["frequency", "polarization"])
+def test_add_different_blt_order(axis):
+    uv_full = UVData()
+    testfile = os.path.join(DATA_PATH, "zen.2458661.23480.HH.uvh5")
+    uv_full.read(testfile)
+    uv_full.data_array += np.random.RandomState(0).normal(size=uv_full.Nblts)[
+        :, np.newaxis, np.newaxis, np.newaxis
+    ]
+
+    if axis == "frequency":
+        uv1 = uv_full.select(freq_chans=[0, 1], inplace=False)
+        uv2 = uv_full.select(freq_chans=[2, 3], inplace=False)
+    else:
+        uv1 = uv_full.select(polarizations=[-5], inplace=False)
+        uv2 = uv_full.select(polarizations=[-6], inplace=False)
+    # the data are matched on time and baseline, not on blt index
+    uv2.reorder_blts(order="baseline")
+    uv1 += uv2
+    assert uv1.nsample_array.dtype == uv_full.nsample_array.dtype
+
+    uv1.history = uv_full.history
+    assert uv1 == uv_full
+
+
 @pytest.mark.filterwarnings("ignore:Altitude is not present in Miriad file")
 def test_lsts_from_time_with_only_unique():
     """
@@ -5382,6 +5551,33 @@ def test_downsample_in_time_partial_flags(resample_in_time_file):
     assert uv_object == uv_object2
 
 
+@pytest.mark.filterwarnings("ignore:The xyz array in ENU_from_ECEF")
+@pytest.mark.filterwarnings("ignore:The enu array in ECEF_from_ENU")
+@pytest.mark.parametrize("summing_correlator_mode", [False, True])
+def test_downsample_in_time_nan_flagged(resample_in_time_file, summing_correlator_mode):
+    """Test that non-finite values in flagged samples do not propagate"""
+    uv_object = resample_in_time_file
+    uv_object.phase_to_time(Time(uv_object.time_array[0], format="jd"))
+    uv_object.reorder_blts(order="baseline", minor_order="time")
+    original_int_time = np.amax(uv_object.integration_time)
+    init_wf = uv_object.get_data(0, 1)
+
+    # flag the first time and set its data to NaN
+    first_time_inds = np.nonzero(uv_object.time_array == uv_object.time_array[0])
+    uv_object.data_array[first_time_inds] = np.nan
+    uv_object.flag_array[first_time_inds] = True
+
+    uv_object.downsample_in_time(
+        min_int_time=original_int_time * 2.0,
+        blt_order="baseline",
+        minor_order="time",
+        summing_correlator_mode=summing_correlator_mode,
+    )
+    assert np.all(np.isfinite(uv_object.data_array))
+    out_wf = uv_object.get_data(0, 1)
+    assert np.isclose(init_wf[1, 0, 0], out_wf[0, 0, 0])
+
+
 @pytest.mark.filterwarnings("ignore:The xyz array in ENU_from_ECEF")
 @pytest.mark.filterwarnings("ignore:The enu array in ECEF_from_ENU")
 def test_downsample_in_time_totally_flagged(resample_in_time_file):
@@ -6473,6 +6669,54 @@ def test_resample_in_time_only_upsample(bda_test_file):
     return
 
 
+@pytest.mark.filterwarnings("ignore:Telescope mock-HERA is not in known_telescopes")
+@pytest.mark.filterwarnings("ignore:There is a gap in the times of baseline")
+@pytest.mark.filterwarnings("ignore:The time difference between integrations")
+@pytest.mark.parametrize("keep_ragged", [True, False])
+@pytest.mark.parametrize("summing_correlator_mode", [True, False])
+def test_downsample_in_time_per_baseline(
+    bda_test_file, keep_ragged, summing_correlator_mode
+):
+    """Test downsampling all baselines together matches doing them one at a time."""
+    uv_object = bda_test_file
+    # flag some of the data, including all the inputs to some outputs
+    uv_object.flag_array[::3, :, ::2] = True
+    uv_object.flag_array[:, :, 2] = True
+    uv_object.nsample_array[::5] = 0.5
+    min_int_time = 4 * np.amin(uv_object.integration_time)
+
+    uv_list = []
+    for bl in np.unique(uv_object.baseline_array):
+        uv_bl = uv_object.select(bls=[uv_object.baseline_to_antnums(bl)], inplace=False)
+        if np.all(uv_bl.integration_time >= min_int_time):
+            continue
+        uv_bl.downsample_in_time(
+            min_int_time=min_int_time,
+            keep_ragged=keep_ragged,
+            summing_correlator_mode=summing_correlator_mode,
+            allow_drift=True,
+        )
+        uv_list.append(uv_bl)
+
+    uv_object.downsample_in_time(
+        min_int_time=min_int_time,
+        keep_ragged=keep_ragged,
+        summing_correlator_mode=summing_correlator_mode,
+        allow_drift=True,
+    )
+
+    for uv_bl in uv_list:
+        key = uv_bl.baseline_to_antnums(uv_bl.baseline_array[0])
+        assert np.array_equal(uv_object.get_times(key), uv_bl.time_array)
+        assert np.array_equal(
+            uv_object.integration_time[uv_object.antpair2ind(key)],
+            uv_bl.integration_time,
+        )
+        assert np.array_equal(uv_object.get_data(key), uv_bl.get_data(key))
+        assert np.array_equal(uv_object.get_flags(key), uv_bl.get_flags(key))
+        assert np.array_equal(uv_object.get_nsamples(key), uv_bl.get_nsamples(key))
+
+
 @pytest.mark.filterwarnings("ignore:There is a gap in the times of baseline")
 def test_downsample_in_time_mwa():
     """
@@ -7104,6 +7348,101 @@ def test_multifile_read_check_long_list(tmp_path):
     return
 
 
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("axis", [None, "blt"])
+def test_multifile_read_parallel(tmp_path, executor, axis):
+    """Test reading multiple files concurrently gives the same result as serially."""
+    uv = UVData()
+    uvh5_file = os.path.join(DATA_PATH, "zen.2458661.23480.HH.uvh5")
+    uv.read(uvh5_file)
+    fileList = []
+    for i in range(0, 4):
+        uv2 = uv.select(
+            times=np.unique(uv.time_array)[i * 5 : i * 5 + 4], inplace=False
+        )
+        fname = str(tmp_path / f"minifile_{i}.uvh5")
+        fileList.append(fname)
+        uv2.write_uvh5(fname)
+
+    uvTrue = UVData()
+    uvTrue.read(fileList, axis=axis)
+    uvTest = UVData()
+    uvTest.read(fileList, axis=axis, n_workers=3, executor=executor)
+    assert uvTest == uvTrue
+
+    # corrupt a file in the middle of the list
+    with h5py.File(fileList[2], "r+") as h5f:
+        del h5f["Header/ant_1_array"]
+    uvTest = UVData()
+    with pytest.warns(UserWarning, match="Failed to read") as cm:
+        uvTest.read(
+            fileList, axis=axis, skip_bad_files=True, n_workers=3, executor=executor
+        )
+    uvTrue = UVData()
+    uvTrue.read([fileList[0], fileList[1], fileList[3]], axis=axis)
+    assert len([w for w in cm if "Failed to read" in str(w.message)]) == 1
+    assert uvTest == uvTrue
+
+    uvTest = UVData()
+    with pytest.raises(KeyError, match="ant_1_array"):
+        with pytest.warns(UserWarning, match="Failed to read"):
+            uvTest.read(fileList, axis=axis, n_workers=3, executor=executor)
+
+    return
+
+
+def test_multifile_read_parallel_errors():
+    uv = UVData()
+    uvh5_file = os.path.join(DATA_PATH, "zen.2458661.23480.HH.uvh5")
+    with pytest.raises(ValueError, match="executor must be one of"):
+        uv.read([uvh5_file, uvh5_file], n_workers=2, executor="foo")
+    with pytest.raises(ValueError, match="n_workers must be a positive integer"):
+        uv.read([uvh5_file, uvh5_file], n_workers=0)
+
+
+def test_multifile_read_parallel_bounded(tmp_path, monkeypatch):
+    """Test that at most n_workers files are read ahead of the combining."""
+    uv = UVData()
+    uvfits_file = os.path.join(DATA_PATH, "zen.2456865.60537.xy.uvcRREAAM.uvfits")
+    uv.read(uvfits_file)
+    fileList = []
+    for i in range(0, 6):
+        uv2 = uv.select(times=np.unique(uv.time_array)[i : i + 1], inplace=False)
+        fname = str(tmp_path / f"minifile_{i}.uvfits")
+        fileList.append(fname)
+        uv2.write_uvfits(fname)
+
+    # count the files that have been submitted but not yet combined
+    n_workers = 2
+    n_outstanding = [0]
+    max_outstanding = [0]
+    orig_submit = concurrent.futures.ThreadPoolExecutor.submit
+
+    def counting_submit(pool, *args, **kwargs):
+        future = orig_submit(pool, *args, **kwargs)
+        n_outstanding[0] += 1
+        max_outstanding[0] = max(max_outstanding[0], n_outstanding[0])
+        orig_result = future.result
+
+        def result(*args, **kwargs):
+            n_outstanding[0] -= 1
+            return orig_result(*args, **kwargs)
+
+        future.result = result
+        return future
+
+    uvTrue = UVData()
+    uvTrue.read(fileList, axis="blt")
+    monkeypatch.setattr(
+        concurrent.futures.ThreadPoolExecutor, "submit", counting_submit
+    )
+    uvTest = UVData()
+    uvTest.read(fileList, axis="blt", n_workers=n_workers)
+    assert max_outstanding[0] == n_workers
+    assert n_outstanding[0] == 0
+    assert uvTest == uvTrue
+
+
 def test_deprecation_warnings_set_phased():
     """
     Test the deprecation warnings in set_phased et al.
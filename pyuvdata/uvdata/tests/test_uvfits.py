@@ -650,6 +650,74 @@ def test_select_read(tmp_path):
     assert uvfits_uv == uvfits_uv2
 
 
+@pytest.mark.filterwarnings("ignore:Required Antenna frame keyword")
+@pytest.mark.filterwarnings("ignore:telescope_location is not set")
+@pytest.mark.parametrize(
+    "filename", ["1133866760.uvfits", "zen.2456865.60537.xy.uvcRREAAM.uvfits"]
+)
+@pytest.mark.parametrize("blt_chunk_size", [None, 1, 7])
+@pytest.mark.parametrize(
+    "select_kwargs",
+    [
+        {},
+        {"blt_inds": np.arange(3, 250, 3)},
+        {"blt_inds": [250, 4, 17, 100, 5, 6]},
+        {"freq_chans": [0, 2, 4]},
+        {"freq_chans": [6, 1, 2]},
+        {"blt_inds": [250, 4, 17, 100, 5, 6], "freq_chans": [6, 1, 2]},
+        {"polarizations": [-5]},
+    ],
+)
+def test_read_blt_chunks(filename, blt_chunk_size, select_kwargs):
+    uvfits_file = os.path.join(DATA_PATH, filename)
+    uv_full = UVData()
+    uv_full.read(uvfits_file)
+    # copy so the parametrized dict shared between tests is not modified
+    select_kwargs = dict(select_kwargs)
+    if uv_full.Npols == 1:
+        select_kwargs.pop("polarizations", None)
+
+    uv_chunked = UVData()
+    uv_chunked.read_uvfits(uvfits_file, blt_chunk_size=blt_chunk_size, **select_kwargs)
+    if len(select_kwargs) > 0:
+        uv_full.select(**select_kwargs)
+
+    assert uv_chunked == uv_full
+    assert uv_chunked.data_array.dtype == uv_full.data_array.dtype
+    assert uv_chunked.nsample_array.dtype == uv_full.nsample_array.dtype
+
+
+def test_read_blt_chunks_error():
+    uvfits_file = os.path.join(DATA_PATH, "1133866760.uvfits")
+    uv = UVData()
+    with pytest.raises(ValueError, match="blt_chunk_size must be a positive integer"):
+        uv.read_uvfits(uvfits_file, blt_chunk_size=0)
+
+
+@pytest.mark.parametrize("blt_chunk_size", [1, 7, 10000])
+def test_write_blt_chunks(blt_chunk_size, tmp_path):
+    uvfits_file = os.path.join(DATA_PATH, "1133866760.uvfits")
+    uv_in = UVData()
+    uv_in.read(uvfits_file)
+    # flag some data to check the signs of the weights
+    uv_in.flag_array[::3] = True
+
+    write_file = str(tmp_path / "outtest.uvfits")
+    write_file_chunks = str(tmp_path / "outtest_chunks.uvfits")
+    uv_in.write_uvfits(write_file)
+    uv_in.write_uvfits(write_file_chunks, blt_chunk_size=blt_chunk_size)
+
+    with open(write_file, "rb") as file1, open(write_file_chunks, "rb") as file2:
+        assert file1.read() == file2.read()
+
+    uv_out = UVData()
+    uv_out.read(write_file_chunks)
+    assert uv_in == uv_out
+
+    with pytest.raises(ValueError, match="blt_chunk_size must be a positive integer"):
+        uv_in.write_uvfits(write_file, blt_chunk_size=0)
+
+
 @pytest.mark.filterwarnings("ignore:Telescope EVLA is not")
 def test_read_uvfits_write_miriad(tmp_path):
     """
@@ -1651,6 +1651,51 @@ def test_uvh5_write_ints(uv_uvh5, tmp_path):
     return
 
 
+@pytest.mark.parametrize("background_write", [False, True])
+@pytest.mark.parametrize("data_write_dtype", [None, "c8", uvh5._hera_corr_dtype])
+def test_uvh5_write_blt_chunks(uv_uvh5, tmp_path, data_write_dtype, background_write):
+    """
+    Test writing the data in chunks along the blt axis.
+    """
+    uv_in = uv_uvh5
+    testfile = str(tmp_path / "outtest.uvh5")
+    testfile_chunked = str(tmp_path / "outtest_chunked.uvh5")
+    uv_in.write_uvh5(testfile, data_write_dtype=data_write_dtype)
+    # use a chunk size that doesn't evenly divide Nblts
+    uv_in.write_uvh5(
+        testfile_chunked,
+        data_write_dtype=data_write_dtype,
+        blt_chunk_size=uv_in.Nblts // 3 + 1,
+        background_write=background_write,
+    )
+
+    # the datasets on disk should be identical
+    with h5py.File(testfile, "r") as h5f, h5py.File(testfile_chunked, "r") as h5f2:
+        for dset in ["visdata", "flags", "nsamples"]:
+            assert h5f["Data"][dset].dtype == h5f2["Data"][dset].dtype
+            assert np.array_equal(h5f["Data"][dset][()], h5f2["Data"][dset][()])
+
+    uv_out = UVData()
+    uv_out.read(testfile_chunked)
+    if data_write_dtype == "c8":
+        uv_in.data_array = uv_in.data_array.astype(np.complex64)
+    assert uv_in == uv_out
+
+    return
+
+
+def test_uvh5_write_blt_chunks_error(uv_uvh5, tmp_path):
+    """
+    Test an error is raised for a bad blt_chunk_size.
+    """
+    testfile = str(tmp_path / "outtest.uvh5")
+    with pytest.raises(ValueError, match="blt_chunk_size must be a positive integer"):
+        uv_uvh5.write_uvh5(testfile, blt_chunk_size=0)
+    assert not os.path.exists(testfile)
+
+    return
+
+
 def test_uvh5_partial_read_ints_antennas():
     """
     Test reading in only some antennas from disk with integer data type.
@@ -2577,3 +2622,77 @@ def test_read_slicing(uv_uvfits):
     slices[1] = 0
     data = uvh5._index_dset(dset, slices)
     assert data.shape == tuple(shape)
+
+
+def test_uvh5_read_lazy():
+    """Test lazily loading the data-like arrays with dask."""
+    da = pytest.importorskip("dask.array")
+    uvh5_filename = os.path.join(DATA_PATH, "zen.2458116.30448.HH.uvh5")
+    uv_in = UVData()
+    uv_in.read(uvh5_filename)
+    uv_lazy = UVData()
+    uv_lazy.read(uvh5_filename, lazy=True)
+
+    for param in ["data_array", "flag_array", "nsample_array"]:
+        assert isinstance(getattr(uv_lazy, param), da.Array)
+
+    # get_data only reads the requested section
+    for key in uv_in.get_antpairpols():
+        data = uv_lazy.get_data(key)
+        assert isinstance(data, np.ndarray)
+        assert np.array_equal(data, uv_in.get_data(key))
+    key = uv_in.get_antpairpols()[1]
+    assert np.array_equal(
+        uv_lazy.get_flags(key[1], key[0], key[2]),
+        uv_in.get_flags(key[1], key[0], key[2]),
+    )
+
+    # select keeps the arrays lazy
+    uv_lazy.select(times=np.unique(uv_lazy.time_array)[0])
+    assert isinstance(uv_lazy.data_array, da.Array)
+    uv_in.select(times=np.unique(uv_in.time_array)[0])
+    for param in ["data_array", "flag_array", "nsample_array"]:
+        setattr(uv_lazy, param, getattr(uv_lazy, param).compute())
+    assert uv_lazy == uv_in
+
+    return
+
+
+def test_uvh5_partial_read_lazy():
+    """Test select on read with lazily loaded data-like arrays."""
+    pytest.importorskip("dask.array")
+    uvh5_filename = os.path.join(DATA_PATH, "zen.2458116.30448.HH.uvh5")
+    uv_in = UVData()
+    uv_in.read(uvh5_filename, read_data=False)
+    bls_to_keep = uv_in.get_antpairs()[:3]
+    chans_to_keep = np.arange(0, 60, 3)
+
+    uv_in.read(uvh5_filename, bls=bls_to_keep, freq_chans=chans_to_keep)
+    uv_lazy = UVData()
+    uv_lazy.read(uvh5_filename, bls=bls_to_keep, freq_chans=chans_to_keep, lazy=True)
+    for param in ["data_array", "flag_array", "nsample_array"]:
+        setattr(uv_lazy, param, getattr(uv_lazy, param).compute())
+    assert uv_lazy == uv_in
+
+    return
+
+
+def test_uvh5_frequency_average_lazy():
+    """Test that frequency averaging lazily loaded arrays matches in-memory arrays."""
+    da = pytest.importorskip("dask.array")
+    uvh5_filename = os.path.join(DATA_PATH, "zen.2458661.23480.HH.uvh5")
+    uv_in = UVData()
+    uv_in.read(uvh5_filename)
+    uv_lazy = UVData()
+    uv_lazy.read(uvh5_filename, lazy=True)
+
+    for uv_obj in [uv_in, uv_lazy]:
+        uv_obj.flag_array[:, :, 1:2] = True
+        uv_obj.frequency_average(2)
+
+    assert isinstance(uv_lazy.data_array, da.Array)
+    for param in ["data_array", "flag_array", "nsample_array"]:
+        setattr(uv_lazy, param, getattr(uv_lazy, param).compute())
+    assert uv_lazy == uv_in
+
+    return
@@ -6,6 +6,9 @@
 import os
 import copy
 import re
+import itertools
+import collections
+import concurrent.futures
 import numpy as np
 import warnings
 from astropy import constants as const
@@ -984,6 +987,55 @@ class UVData(UVBase):
             ant1, ant2, self.Nants_telescope, attempt256=attempt256
         )
 
+    def _get_blt_inds_cache(self):
+        """
+        Get the cached mapping from baselines to baseline-time indices.
+
+        The mapping is built on first use and rebuilt whenever any of
+        `baseline_array`, `ant_1_array` or `ant_2_array` has been replaced.
+        Methods that modify these arrays in place must call
+        `_clear_blt_inds_cache`.
+
+        Returns
+        -------
+        bl_dict : dict
+            Mapping from baseline number to an ndarray of int (sorted) of the
+            indices of that baseline along the baseline-time axis.
+        antpair_dict : dict
+            Mapping from antenna pair tuples to the same index arrays.
+
+        """
+        arrays = (self.baseline_array, self.ant_1_array, self.ant_2_array)
+        cache = getattr(self, "_blt_inds_cache", None)
+        if cache is not None and all(
+            arr is cached_arr for arr, cached_arr in zip(arrays, cache[0])
+        ):
+            return cache[1], cache[2]
+
+        # a stable sort keeps the indices for each baseline in increasing order
+        blt_order = np.argsort(self.baseline_array, kind="stable")
+        unique_bls, bl_start = np.unique(
+            self.baseline_array[blt_order], return_index=True
+        )
+        blt_inds_list = np.split(blt_order, bl_start[1:])
+        bl_dict = {}
+        antpair_dict = {}
+        for bl, ant1, ant2, blt_inds in zip(
+            unique_bls.tolist(),
+            self.ant_1_array[blt_order[bl_start]].tolist(),
+            self.ant_2_array[blt_order[bl_start]].tolist(),
+            blt_inds_list,
+        ):
+            bl_dict[bl] = blt_inds
+            antpair_dict[(ant1, ant2)] = blt_inds
+        self._blt_inds_cache = (arrays, bl_dict, antpair_dict)
+
+        return bl_dict, antpair_dict
+
+    def _clear_blt_inds_cache(self):
+        """Clear the cached mapping from baselines to baseline-time indices."""
+        self._blt_inds_cache = None
+
     def antpair2ind(self, ant1, ant2=None, ordered=True):
         """
         Get indices along the baseline-time axis for a given antenna pair.
@@ -1028,11 +1080,13 @@ class UVData(UVBase):
             ordered = True
 
         # get indices
-        inds = np.where((self.ant_1_array == ant1) & (self.ant_2_array == ant2))[0]
+        antpair_dict = self._get_blt_inds_cache()[1]
+        empty = np.array([], dtype=np.int64)
+        inds = np.array(antpair_dict.get((ant1, ant2), empty), dtype=np.int64)
         if ordered:
             return inds
         else:
-            ind2 = np.where((self.ant_1_array == ant2) & (self.ant_2_array == ant1))[0]
+            ind2 = antpair_dict.get((ant2, ant1), empty)
             inds = np.asarray(np.append(inds, ind2), dtype=np.int64)
             return inds
 
@@ -1105,11 +1159,11 @@ class UVData(UVBase):
                     )
             else:
                 # Larger number, assume it is a baseline number
-                inv_bl = self.antnums_to_baseline(
-                    self.baseline_to_antnums(key)[1], self.baseline_to_antnums(key)[0]
-                )
-                blt_ind1 = np.where(self.baseline_array == key)[0]
-                blt_ind2 = np.where(self.baseline_array == inv_bl)[0]
+                bl_dict, antpair_dict = self._get_blt_inds_cache()
+                ant1, ant2 = self.baseline_to_antnums(key)
+                empty = np.array([], dtype=np.int64)
+                blt_ind1 = bl_dict.get(key, empty)
+                blt_ind2 = antpair_dict.get((ant2, ant1), empty)
                 if len(blt_ind1) + len(blt_ind2) == 0:
                     raise KeyError("Baseline {bl} not found in data.".format(bl=key))
                 if len(blt_ind1) > 0:
@@ -1133,8 +1187,10 @@ class UVData(UVBase):
                 pol_ind = (pol_ind1, pol_ind2)
         elif len(key) == 2:
             # Key is an antenna pair
-            blt_ind1 = self.antpair2ind(key[0], key[1])
-            blt_ind2 = self.antpair2ind(key[1], key[0])
+            antpair_dict = self._get_blt_inds_cache()[1]
+            empty = np.array([], dtype=np.int64)
+            blt_ind1 = antpair_dict.get((key[0], key[1]), empty)
+            blt_ind2 = antpair_dict.get((key[1], key[0]), empty)
             if len(blt_ind1) + len(blt_ind2) == 0:
                 raise KeyError("Antenna pair {pair} not found in data".format(pair=key))
             if len(blt_ind1) > 0:
@@ -1158,8 +1214,10 @@ class UVData(UVBase):
             pol_ind = (pol_ind1, pol_ind2)
         elif len(key) == 3:
             # Key is an antenna pair + pol
-            blt_ind1 = self.antpair2ind(key[0], key[1])
-            blt_ind2 = self.antpair2ind(key[1], key[0])
+            antpair_dict = self._get_blt_inds_cache()[1]
+            empty = np.array([], dtype=np.int64)
+            blt_ind1 = antpair_dict.get((key[0], key[1]), empty)
+            blt_ind2 = antpair_dict.get((key[1], key[0]), empty)
             if len(blt_ind1) + len(blt_ind2) == 0:
                 raise KeyError(
                     "Antenna pair {pair} not found in "
@@ -1311,6 +1369,10 @@ class UVData(UVBase):
                     out[0][:, :, :, indp[0]], out[1][:, :, :, indp[1]], axis=0
                 )
 
+        if not isinstance(out, np.ndarray):
+            # lazily loaded (e.g. dask) arrays: only read the requested section
+            out = np.asarray(out)
+
         if squeeze == "full":
             out = np.squeeze(out)
         elif squeeze == "default":
@@ -1801,6 +1863,7 @@ class UVData(UVBase):
             self.baseline_array[index_array] = self.antnums_to_baseline(
                 self.ant_1_array[index_array], self.ant_2_array[index_array]
             )
+            self._clear_blt_inds_cache()
             self.Nbls = np.unique(self.baseline_array).size
 
     def reorder_pols(
@@ -2130,6 +2193,37 @@ class UVData(UVBase):
 
         return
 
+    def _get_frame_telescope_location(self, times, phase_frame):
+        """
+        Get the telescope location in a celestial frame at a set of times.
+
+        Parameters
+        ----------
+        times : ndarray of float
+            Julian dates to calculate the telescope location at.
+        phase_frame : str
+            The astropy frame to transform to. Either 'icrs' or 'gcrs'.
+
+        Returns
+        -------
+        SkyCoord
+            The telescope location at each time in `phase_frame` with a
+            cartesian representation, shape (Ntimes,).
+
+        """
+        n_times = np.asarray(times).size
+        itrs_telescope_location = SkyCoord(
+            x=np.full(n_times, self.telescope_location[0]) * units.m,
+            y=np.full(n_times, self.telescope_location[1]) * units.m,
+            z=np.full(n_times, self.telescope_location[2]) * units.m,
+            frame="itrs",
+            obstime=Time(times, format="jd"),
+        )
+        frame_telescope_location = itrs_telescope_location.transform_to(phase_frame)
+        frame_telescope_location.representation_type = "cartesian"
+
+        return frame_telescope_location
+
     def unphase_to_drift(self, phase_frame=None, use_ant_pos=False):
         """
         Convert from a phased dataset to a drift dataset.
@@ -2200,68 +2294,55 @@ class UVData(UVBase):
             phs = np.exp(-1j * 2 * np.pi * (-1) * w_lambda[:, None, :, None])
             self.data_array *= phs
 
-        unique_times, unique_inds = np.unique(self.time_array, return_index=True)
-        for ind, jd in enumerate(unique_times):
-            inds = np.where(self.time_array == jd)[0]
-
-            obs_time = Time(jd, format="jd")
-
-            itrs_telescope_location = SkyCoord(
-                x=self.telescope_location[0] * units.m,
-                y=self.telescope_location[1] * units.m,
-                z=self.telescope_location[2] * units.m,
-                frame="itrs",
-                obstime=obs_time,
+        if use_ant_pos:
+            # the drift uvws do not depend on time, so only need to calculate
+            # the antenna uvws once
+            ant_uvw = uvutils.phase_uvw(
+                self.telescope_location_lat_lon_alt[1],
+                self.telescope_location_lat_lon_alt[0],
+                self.antenna_positions,
+            )
+            # the first argument of searchsorted must be sorted so find the sort
+            # indices to help with indexing without changing the object.
+            ant_sort = np.argsort(self.antenna_numbers)
+            ant1_index = ant_sort[
+                np.searchsorted(self.antenna_numbers[ant_sort], self.ant_1_array)
+            ]
+            ant2_index = ant_sort[
+                np.searchsorted(self.antenna_numbers[ant_sort], self.ant_2_array)
+            ]
+            self.uvw_array = ant_uvw[ant2_index, :] - ant_uvw[ant1_index, :]
+        else:
+            # do the frame transformations for all times at once rather than
+            # looping over the unique times.
+            unique_times, unique_inverse = np.unique(
+                self.time_array, return_inverse=True
+            )
+            frame_telescope_location = self._get_frame_telescope_location(
+                unique_times, phase_frame
             )
-            frame_telescope_location = itrs_telescope_location.transform_to(phase_frame)
             itrs_lat_lon_alt = self.telescope_location_lat_lon_alt
 
-            if use_ant_pos:
-                ant_uvw = uvutils.phase_uvw(
-                    self.telescope_location_lat_lon_alt[1],
-                    self.telescope_location_lat_lon_alt[0],
-                    self.antenna_positions,
-                )
-
-                for bl_ind in inds:
-                    ant1_index = np.where(
-                        self.antenna_numbers == self.ant_1_array[bl_ind]
-                    )[0][0]
-                    ant2_index = np.where(
-                        self.antenna_numbers == self.ant_2_array[bl_ind]
-                    )[0][0]
-                    self.uvw_array[bl_ind, :] = (
-                        ant_uvw[ant2_index, :] - ant_uvw[ant1_index, :]
-                    )
-
-            else:
-                uvws_use = self.uvw_array[inds, :]
-
-                uvw_rel_positions = uvutils.unphase_uvw(
-                    frame_phase_center.ra.rad, frame_phase_center.dec.rad, uvws_use
-                )
+            uvw_rel_positions = uvutils.unphase_uvw(
+                frame_phase_center.ra.rad, frame_phase_center.dec.rad, self.uvw_array
+            )
 
-                # astropy 2 vs 3 use a different keyword name
-                rep_keyword = "representation_type"
-                setattr(frame_telescope_location, rep_keyword, "cartesian")
-
-                rep_dict = {}
-                rep_dict[rep_keyword] = "cartesian"
-                frame_uvw_coord = SkyCoord(
-                    x=uvw_rel_positions[:, 0] * units.m + frame_telescope_location.x,
-                    y=uvw_rel_positions[:, 1] * units.m + frame_telescope_location.y,
-                    z=uvw_rel_positions[:, 2] * units.m + frame_telescope_location.z,
-                    frame=phase_frame,
-                    obstime=obs_time,
-                    **rep_dict
-                )
+            frame_telescope_xyz = frame_telescope_location.cartesian[unique_inverse]
+            frame_uvw_coord = SkyCoord(
+                x=uvw_rel_positions[:, 0] * units.m + frame_telescope_xyz.x,
+                y=uvw_rel_positions[:, 1] * units.m + frame_telescope_xyz.y,
+                z=uvw_rel_positions[:, 2] * units.m + frame_telescope_xyz.z,
+                frame=phase_frame,
+                obstime=Time(self.time_array, format="jd"),
+                representation_type="cartesian",
+            )
 
-                itrs_uvw_coord = frame_uvw_coord.transform_to("itrs")
+            itrs_uvw_coord = frame_uvw_coord.transform_to("itrs")
 
-                # now convert them to ENU, which is the space uvws are in
-                self.uvw_array[inds, :] = uvutils.ENU_from_ECEF(
-                    itrs_uvw_coord.cartesian.get_xyz().value.T, *itrs_lat_lon_alt
-                )
+            # now convert them to ENU, which is the space uvws are in
+            self.uvw_array = uvutils.ENU_from_ECEF(
+                itrs_uvw_coord.cartesian.get_xyz().value.T, *itrs_lat_lon_alt
+            )
 
         # remove phase center
         self.phase_center_frame = None
@@ -2382,90 +2463,84 @@ class UVData(UVBase):
         # add in the telescope location for ICRS
         self.uvw_array = np.float64(self.uvw_array)
 
-        unique_times, unique_inds = np.unique(self.time_array, return_index=True)
-        for ind, jd in enumerate(unique_times):
-            inds = np.where(self.time_array == jd)[0]
-
-            obs_time = Time(jd, format="jd")
-
-            itrs_telescope_location = SkyCoord(
-                x=self.telescope_location[0] * units.m,
-                y=self.telescope_location[1] * units.m,
-                z=self.telescope_location[2] * units.m,
+        # do the frame transformations for all times at once rather than
+        # looping over the unique times.
+        unique_times, unique_inverse = np.unique(self.time_array, return_inverse=True)
+        frame_telescope_location = self._get_frame_telescope_location(
+            unique_times, phase_frame
+        )
+        itrs_lat_lon_alt = self.telescope_location_lat_lon_alt
+
+        if use_ant_pos:
+            # This promotion is REQUIRED to get the right answer when we
+            # add in the telescope location for ICRS
+            ecef_ant_pos = np.float64(self.antenna_positions) + self.telescope_location
+
+            # transform the antenna positions for every unique time in one go,
+            # the positions are ordered as (Ntimes, Nants_telescope)
+            n_ants = self.antenna_positions.shape[0]
+            time_index = np.repeat(np.arange(unique_times.size), n_ants)
+            ecef_ant_pos = np.tile(ecef_ant_pos, (unique_times.size, 1))
+            itrs_ant_coord = SkyCoord(
+                x=ecef_ant_pos[:, 0] * units.m,
+                y=ecef_ant_pos[:, 1] * units.m,
+                z=ecef_ant_pos[:, 2] * units.m,
                 frame="itrs",
-                obstime=obs_time,
+                obstime=Time(unique_times[time_index], format="jd"),
             )
-            itrs_lat_lon_alt = self.telescope_location_lat_lon_alt
-
-            frame_telescope_location = itrs_telescope_location.transform_to(phase_frame)
-
-            # astropy 2 vs 3 use a different keyword name
-            rep_keyword = "representation_type"
-            setattr(frame_telescope_location, rep_keyword, "cartesian")
-
-            if use_ant_pos:
-                # This promotion is REQUIRED to get the right answer when we
-                # add in the telescope location for ICRS
-                ecef_ant_pos = (
-                    np.float64(self.antenna_positions) + self.telescope_location
-                )
-
-                itrs_ant_coord = SkyCoord(
-                    x=ecef_ant_pos[:, 0] * units.m,
-                    y=ecef_ant_pos[:, 1] * units.m,
-                    z=ecef_ant_pos[:, 2] * units.m,
-                    frame="itrs",
-                    obstime=obs_time,
-                )
 
-                frame_ant_coord = itrs_ant_coord.transform_to(phase_frame)
+            frame_ant_coord = itrs_ant_coord.transform_to(phase_frame)
 
-                frame_ant_rel = (
-                    (frame_ant_coord.cartesian - frame_telescope_location.cartesian)
-                    .get_xyz()
-                    .T.value
+            frame_ant_rel = (
+                (
+                    frame_ant_coord.cartesian
+                    - frame_telescope_location.cartesian[time_index]
                 )
+                .get_xyz()
+                .T.value
+            )
 
-                frame_ant_uvw = uvutils.phase_uvw(
-                    frame_phase_center.ra.rad, frame_phase_center.dec.rad, frame_ant_rel
-                )
+            frame_ant_uvw = uvutils.phase_uvw(
+                frame_phase_center.ra.rad, frame_phase_center.dec.rad, frame_ant_rel
+            ).reshape(unique_times.size, n_ants, 3)
 
-                for bl_ind in inds:
-                    ant1_index = np.where(
-                        self.antenna_numbers == self.ant_1_array[bl_ind]
-                    )[0][0]
-                    ant2_index = np.where(
-                        self.antenna_numbers == self.ant_2_array[bl_ind]
-                    )[0][0]
-                    self.uvw_array[bl_ind, :] = (
-                        frame_ant_uvw[ant2_index, :] - frame_ant_uvw[ant1_index, :]
-                    )
-            else:
-                # Also, uvws should be thought of like ENU, not ECEF (or rotated ECEF)
-                # convert them to ECEF to transform between frames
-                uvws_use = self.uvw_array[inds, :]
-
-                uvw_ecef = uvutils.ECEF_from_ENU(uvws_use, *itrs_lat_lon_alt)
-
-                itrs_uvw_coord = SkyCoord(
-                    x=uvw_ecef[:, 0] * units.m,
-                    y=uvw_ecef[:, 1] * units.m,
-                    z=uvw_ecef[:, 2] * units.m,
-                    frame="itrs",
-                    obstime=obs_time,
-                )
-                frame_uvw_coord = itrs_uvw_coord.transform_to(phase_frame)
+            # the first argument of searchsorted must be sorted so find the sort
+            # indices to help with indexing without changing the object.
+            ant_sort = np.argsort(self.antenna_numbers)
+            ant1_index = ant_sort[
+                np.searchsorted(self.antenna_numbers[ant_sort], self.ant_1_array)
+            ]
+            ant2_index = ant_sort[
+                np.searchsorted(self.antenna_numbers[ant_sort], self.ant_2_array)
+            ]
+            self.uvw_array = (
+                frame_ant_uvw[unique_inverse, ant2_index, :]
+                - frame_ant_uvw[unique_inverse, ant1_index, :]
+            )
+        else:
+            # Also, uvws should be thought of like ENU, not ECEF (or rotated ECEF)
+            # convert them to ECEF to transform between frames
+            uvw_ecef = uvutils.ECEF_from_ENU(self.uvw_array, *itrs_lat_lon_alt)
+
+            itrs_uvw_coord = SkyCoord(
+                x=uvw_ecef[:, 0] * units.m,
+                y=uvw_ecef[:, 1] * units.m,
+                z=uvw_ecef[:, 2] * units.m,
+                frame="itrs",
+                obstime=Time(self.time_array, format="jd"),
+            )
+            frame_uvw_coord = itrs_uvw_coord.transform_to(phase_frame)
 
-                # this takes out the telescope location in the new frame,
-                # so these are vectors again
-                frame_rel_uvw = (
-                    frame_uvw_coord.cartesian.get_xyz().value.T
-                    - frame_telescope_location.cartesian.get_xyz().value
-                )
+            # this takes out the telescope location in the new frame,
+            # so these are vectors again
+            frame_rel_uvw = (
+                frame_uvw_coord.cartesian.get_xyz().value.T
+                - frame_telescope_location.cartesian.get_xyz().value.T[unique_inverse]
+            )
 
-                self.uvw_array[inds, :] = uvutils.phase_uvw(
-                    frame_phase_center.ra.rad, frame_phase_center.dec.rad, frame_rel_uvw
-                )
+            self.uvw_array = uvutils.phase_uvw(
+                frame_phase_center.ra.rad, frame_phase_center.dec.rad, frame_rel_uvw
+            )
 
         # calculate data and apply phasor
         if not self.metadata_only:
@@ -2834,24 +2909,13 @@ class UVData(UVBase):
         history_update_string = " Combined data along "
         n_axes = 0
 
-        # Create blt arrays for convenience
+        # Create integer baseline-time keys for convenience, times that agree
+        # to within the time tolerance get the same key.
         prec_t = -2 * np.floor(np.log10(this._time_array.tols[-1])).astype(int)
-        prec_b = 8
-        this_blts = np.array(
-            [
-                "_".join(
-                    ["{1:.{0}f}".format(prec_t, blt[0]), str(blt[1]).zfill(prec_b)]
-                )
-                for blt in zip(this.time_array, this.baseline_array)
-            ]
-        )
-        other_blts = np.array(
-            [
-                "_".join(
-                    ["{1:.{0}f}".format(prec_t, blt[0]), str(blt[1]).zfill(prec_b)]
-                )
-                for blt in zip(other.time_array, other.baseline_array)
-            ]
+        this_blts, other_blts = uvutils._get_blt_keys(
+            [this.time_array, other.time_array],
+            [this.baseline_array, other.baseline_array],
+            prec_t,
         )
         # Check we don't have overlapping data
         both_pol, this_pol_ind, other_pol_ind = np.intersect1d(
@@ -2867,28 +2931,16 @@ class UVData(UVBase):
             len(both_pol) > 0 and len(both_freq) > 0 and len(both_blts) > 0
         ):
             # check that overlapping data is not valid
-            this_inds = np.ravel_multi_index(
-                (
-                    this_blts_ind[:, np.newaxis, np.newaxis, np.newaxis],
-                    np.zeros((this.Nspws, 1, 1, 1), dtype=np.int),
-                    this_freq_ind[np.newaxis, np.newaxis, :, np.newaxis],
-                    this_pol_ind[np.newaxis, np.newaxis, np.newaxis, :],
-                ),
-                this.data_array.shape,
-            ).flatten()
-            this_all_zero = np.all(this.data_array.flatten()[this_inds] == 0)
-            this_all_flag = np.all(this.flag_array.flatten()[this_inds])
-            other_inds = np.ravel_multi_index(
-                (
-                    other_blts_ind[:, np.newaxis, np.newaxis, np.newaxis],
-                    np.zeros((this.Nspws, 1, 1, 1), dtype=np.int),
-                    other_freq_ind[np.newaxis, np.newaxis, :, np.newaxis],
-                    other_pol_ind[np.newaxis, np.newaxis, np.newaxis, :],
-                ),
-                other.data_array.shape,
-            ).flatten()
-            other_all_zero = np.all(other.data_array.flatten()[other_inds] == 0)
-            other_all_flag = np.all(other.flag_array.flatten()[other_inds])
+            this_inds = np.ix_(
+                this_blts_ind, np.arange(this.Nspws), this_freq_ind, this_pol_ind
+            )
+            this_all_zero = np.all(this.data_array[this_inds] == 0)
+            this_all_flag = np.all(this.flag_array[this_inds])
+            other_inds = np.ix_(
+                other_blts_ind, np.arange(this.Nspws), other_freq_ind, other_pol_ind
+            )
+            other_all_zero = np.all(other.data_array[other_inds] == 0)
+            other_all_flag = np.all(other.flag_array[other_inds])
 
             if this_all_zero and this_all_flag:
                 # we're fine to overwrite; update history accordingly
@@ -2978,21 +3030,14 @@ class UVData(UVBase):
                 )
                 raise ValueError(msg)
 
-        # Pad out self to accommodate new data
+        # Work out where the elements of each object go along each axis of the
+        # combined object. Axes that other adds new elements to are sorted.
+        this_nblts = this.Nblts
         if len(bnew_inds) > 0:
             this_blts = np.concatenate((this_blts, new_blts))
             blt_order = np.argsort(this_blts)
-            if not self.metadata_only:
-                zero_pad = np.zeros(
-                    (len(bnew_inds), this.Nspws, this.Nfreqs, this.Npols)
-                )
-                this.data_array = np.concatenate([this.data_array, zero_pad], axis=0)
-                this.nsample_array = np.concatenate(
-                    [this.nsample_array, zero_pad], axis=0
-                )
-                this.flag_array = np.concatenate(
-                    [this.flag_array, 1 - zero_pad], axis=0
-                ).astype(np.bool)
+            this_blts = this_blts[blt_order]
+            this_blt_pos = np.argsort(blt_order)[:this_nblts]
             this.uvw_array = np.concatenate(
                 [this.uvw_array, other.uvw_array[bnew_inds, :]], axis=0
             )[blt_order, :]
@@ -3014,75 +3059,69 @@ class UVData(UVBase):
             this.baseline_array = np.concatenate(
                 [this.baseline_array, other.baseline_array[bnew_inds]]
             )[blt_order]
+        else:
+            this_blt_pos = None
+        other_blt_pos, _ = uvutils._find_indices(this_blts, other_blts)
 
+        this_nfreqs = this.Nfreqs
         if len(fnew_inds) > 0:
             this.freq_array = np.concatenate(
                 [this.freq_array, other.freq_array[:, fnew_inds]], axis=1
             )
             f_order = np.argsort(this.freq_array[0, :])
-            if not self.metadata_only:
-                zero_pad = np.zeros(
-                    (this.data_array.shape[0], this.Nspws, len(fnew_inds), this.Npols)
-                )
-                this.data_array = np.concatenate([this.data_array, zero_pad], axis=2)
-                this.nsample_array = np.concatenate(
-                    [this.nsample_array, zero_pad], axis=2
-                )
-                this.flag_array = np.concatenate(
-                    [this.flag_array, 1 - zero_pad], axis=2
-                ).astype(np.bool)
+            this.freq_array = this.freq_array[:, f_order]
+            this_freq_pos = np.argsort(f_order)[:this_nfreqs]
+        else:
+            this_freq_pos = None
+        other_freq_pos, _ = uvutils._find_indices(
+            this.freq_array[0, :], other.freq_array[0, :]
+        )
+
+        this_npols = this.Npols
         if len(pnew_inds) > 0:
             this.polarization_array = np.concatenate(
                 [this.polarization_array, other.polarization_array[pnew_inds]]
             )
             p_order = np.argsort(np.abs(this.polarization_array))
-            if not self.metadata_only:
-                zero_pad = np.zeros(
-                    (
-                        this.data_array.shape[0],
-                        this.Nspws,
-                        this.data_array.shape[2],
-                        len(pnew_inds),
-                    )
-                )
-                this.data_array = np.concatenate([this.data_array, zero_pad], axis=3)
-                this.nsample_array = np.concatenate(
-                    [this.nsample_array, zero_pad], axis=3
-                )
-                this.flag_array = np.concatenate(
-                    [this.flag_array, 1 - zero_pad], axis=3
-                ).astype(np.bool)
-
-        # Now populate the data
-        pol_t2o = np.nonzero(
-            np.in1d(this.polarization_array, other.polarization_array)
-        )[0]
-        freq_t2o = np.nonzero(np.in1d(this.freq_array[0, :], other.freq_array[0, :]))[0]
-        blt_t2o = np.nonzero(np.in1d(this_blts, other_blts))[0]
-        if not self.metadata_only:
-            this.data_array[np.ix_(blt_t2o, [0], freq_t2o, pol_t2o)] = other.data_array
-            this.nsample_array[
-                np.ix_(blt_t2o, [0], freq_t2o, pol_t2o)
-            ] = other.nsample_array
-            this.flag_array[np.ix_(blt_t2o, [0], freq_t2o, pol_t2o)] = other.flag_array
+            this.polarization_array = this.polarization_array[p_order]
+            this_pol_pos = np.argsort(p_order)[:this_npols]
+        else:
+            this_pol_pos = None
+        other_pol_pos, _ = uvutils._find_indices(
+            this.polarization_array, other.polarization_array
+        )
 
+        # Now populate the data, allocating the combined arrays once and
+        # writing the data from both objects directly into them.
         if not self.metadata_only:
-            if len(bnew_inds) > 0:
-                for name, param in zip(this._data_params, this.data_like_parameters):
-                    setattr(this, name, param[blt_order, :, :, :])
-
-            if len(fnew_inds) > 0:
-                for name, param in zip(this._data_params, this.data_like_parameters):
-                    setattr(this, name, param[:, :, f_order, :])
-
-            if len(pnew_inds) > 0:
-                for name, param in zip(this._data_params, this.data_like_parameters):
-                    setattr(this, name, param[:, :, :, p_order])
-
-        if len(fnew_inds) > 0:
-            this.freq_array = this.freq_array[:, f_order]
-        if len(pnew_inds) > 0:
-            this.polarization_array = this.polarization_array[p_order]
+            combined_shape = (
+                this_blts.size,
+                this.Nspws,
+                this.freq_array.shape[1],
+                this.polarization_array.size,
+            )
+            this_index = uvutils._get_multi_axis_index(
+                [this_blt_pos, None, this_freq_pos, this_pol_pos], combined_shape
+            )
+            other_index = uvutils._get_multi_axis_index(
+                [other_blt_pos, None, other_freq_pos, other_pol_pos], combined_shape
+            )
+            padded = len(bnew_inds) > 0 or len(fnew_inds) > 0 or len(pnew_inds) > 0
+            for name in this._data_params:
+                this_param = getattr(this, name)
+                other_param = getattr(other, name)
+                if padded:
+                    if name == "flag_array":
+                        combined = np.ones(combined_shape, dtype=np.bool)
+                    else:
+                        combined = np.zeros(
+                            combined_shape,
+                            dtype=np.result_type(this_param, other_param),
+                        )
+                    combined[this_index] = this_param
+                    setattr(this, name, combined)
+                    this_param = combined
+                this_param[other_index] = other_param
 
         # Update N parameters (e.g. Npols)
         this.Ntimes = len(np.unique(this.time_array))
@@ -3224,7 +3263,7 @@ class UVData(UVBase):
         inplace=False,
     ):
         """
-        Concatenate two UVData objects along specified axis with almost no checking.
+        Concatenate UVData objects along specified axis with almost no checking.
 
         Warning! This method assumes all the metadata along other axes is sorted
         the same way. The __add__ method is much safer, it checks all the metadata,
@@ -3233,8 +3272,11 @@ class UVData(UVBase):
 
         Parameters
         ----------
-        other : UVData object
-            Another UVData object which will be added to self.
+        other : UVData object or list of UVData objects
+            UVData object or list of UVData objects which will be added to self.
+            Concatenating a list of objects in one call is much faster than
+            concatenating them one at a time because the combined arrays are
+            only allocated once.
         axis : str
             Axis to concatenate files along. This enables fast concatenation
             along the specified axis without the normal checking that all other
@@ -3270,14 +3312,14 @@ class UVData(UVBase):
             Option to check acceptable range of the values of parameters after
             combining objects.
         inplace : bool
-            If True, overwrite self as we go, otherwise create a third object
-            as the sum of the two.
+            If True, overwrite self as we go, otherwise create a new object
+            as the sum of self and other.
 
         Raises
         ------
         ValueError
-            If other is not a UVData object, axis is not an allowed value or if
-            self and other are not compatible.
+            If other is not a UVData object (or a list of UVData objects), axis
+            is not an allowed value or if self and other are not compatible.
         """
         if inplace:
             this = self
@@ -3287,15 +3329,21 @@ class UVData(UVBase):
         this.check(
             check_extra=check_extra, run_check_acceptability=run_check_acceptability
         )
-        if not issubclass(other.__class__, this.__class__):
-            if not issubclass(this.__class__, other.__class__):
-                raise ValueError(
-                    "Only UVData (or subclass) objects can be "
-                    "added to a UVData (or subclass) object"
-                )
-        other.check(
-            check_extra=check_extra, run_check_acceptability=run_check_acceptability
-        )
+        if isinstance(other, (list, tuple)):
+            other_list = list(other)
+        else:
+            other_list = [other]
+        for other in other_list:
+            if not issubclass(other.__class__, this.__class__):
+                if not issubclass(this.__class__, other.__class__):
+                    raise ValueError(
+                        "Only UVData (or subclass) objects can be "
+                        "added to a UVData (or subclass) object"
+                    )
+            other.check(
+                check_extra=check_extra,
+                run_check_acceptability=run_check_acceptability,
+            )
 
         if phase_center_radec is not None and unphase_to_drift:
             raise ValueError(
@@ -3309,11 +3357,12 @@ class UVData(UVBase):
                     phase_frame=orig_phase_frame, use_ant_pos=use_ant_pos
                 )
 
-            if other.phase_type != "drift":
-                warnings.warn("Unphasing other UVData object to drift")
-                other.unphase_to_drift(
-                    phase_frame=orig_phase_frame, use_ant_pos=use_ant_pos
-                )
+            for other in other_list:
+                if other.phase_type != "drift":
+                    warnings.warn("Unphasing other UVData object to drift")
+                    other.unphase_to_drift(
+                        phase_frame=orig_phase_frame, use_ant_pos=use_ant_pos
+                    )
 
         if phase_center_radec is not None:
             if np.array(phase_center_radec).size != 2:
@@ -3346,32 +3395,33 @@ class UVData(UVBase):
                     allow_rephase=True,
                 )
 
-            # If other object is not phased or is not phased close to
-            # phase_center_radec, (re)phase it.
-            # Close is defined using the phase_center_ra/dec tolerances.
-            if other.phase_type == "drift" or (
-                not np.isclose(
-                    other.phase_center_ra,
-                    phase_center_radec[0],
-                    rtol=other._phase_center_ra.tols[0],
-                    atol=other._phase_center_ra.tols[1],
-                )
-                or not np.isclose(
-                    other.phase_center_dec,
-                    phase_center_radec[1],
-                    rtol=other._phase_center_dec.tols[0],
-                    atol=other._phase_center_dec.tols[1],
-                )
-            ):
-                warnings.warn("Phasing other UVData object to phase_center_radec")
-                other.phase(
-                    phase_center_radec[0],
-                    phase_center_radec[1],
-                    phase_frame=phase_frame,
-                    orig_phase_frame=orig_phase_frame,
-                    use_ant_pos=use_ant_pos,
-                    allow_rephase=True,
-                )
+            for other in other_list:
+                # If other object is not phased or is not phased close to
+                # phase_center_radec, (re)phase it.
+                # Close is defined using the phase_center_ra/dec tolerances.
+                if other.phase_type == "drift" or (
+                    not np.isclose(
+                        other.phase_center_ra,
+                        phase_center_radec[0],
+                        rtol=other._phase_center_ra.tols[0],
+                        atol=other._phase_center_ra.tols[1],
+                    )
+                    or not np.isclose(
+                        other.phase_center_dec,
+                        phase_center_radec[1],
+                        rtol=other._phase_center_dec.tols[0],
+                        atol=other._phase_center_dec.tols[1],
+                    )
+                ):
+                    warnings.warn("Phasing other UVData object to phase_center_radec")
+                    other.phase(
+                        phase_center_radec[0],
+                        phase_center_radec[1],
+                        phase_frame=phase_frame,
+                        orig_phase_frame=orig_phase_frame,
+                        use_ant_pos=use_ant_pos,
+                        allow_rephase=True,
+                    )
 
         allowed_axes = ["blt", "freq", "polarization"]
         if axis not in allowed_axes:
@@ -3425,22 +3475,26 @@ class UVData(UVBase):
         history_update_string += " axis using pyuvdata."
         this.history += history_update_string
 
-        this.history = uvutils._combine_histories(this.history, other.history)
+        for other in other_list:
+            this.history = uvutils._combine_histories(this.history, other.history)
 
         # Actually check compatibility parameters
-        for a in compatibility_params:
-            params_match = getattr(this, a) == getattr(other, a)
-            if not params_match:
-                msg = (
-                    "UVParameter " + a[1:] + " does not match. Cannot combine objects."
-                )
-                raise ValueError(msg)
+        for other in other_list:
+            for a in compatibility_params:
+                params_match = getattr(this, a) == getattr(other, a)
+                if not params_match:
+                    msg = (
+                        "UVParameter "
+                        + a[1:]
+                        + " does not match. Cannot combine objects."
+                    )
+                    raise ValueError(msg)
 
         if axis == "freq":
             this.freq_array = np.concatenate(
-                [this.freq_array, other.freq_array], axis=1
+                [this.freq_array] + [other.freq_array for other in other_list], axis=1
             )
-            this.Nfreqs = this.Nfreqs + other.Nfreqs
+            this.Nfreqs = this.Nfreqs + sum(other.Nfreqs for other in other_list)
 
             freq_separation = np.diff(this.freq_array[0, :])
             if not np.isclose(
@@ -3461,21 +3515,26 @@ class UVData(UVBase):
                     "Combined frequencies are not contiguous. This will make "
                     "it impossible to write this data out to some file types."
                 )
-            if not self.metadata_only:
+            if not this.metadata_only:
                 this.data_array = np.concatenate(
-                    [this.data_array, other.data_array], axis=2
+                    [this.data_array] + [other.data_array for other in other_list],
+                    axis=2,
                 )
                 this.nsample_array = np.concatenate(
-                    [this.nsample_array, other.nsample_array], axis=2
+                    [this.nsample_array]
+                    + [other.nsample_array for other in other_list],
+                    axis=2,
                 )
                 this.flag_array = np.concatenate(
-                    [this.flag_array, other.flag_array], axis=2
+                    [this.flag_array] + [other.flag_array for other in other_list],
+                    axis=2,
                 )
         elif axis == "polarization":
             this.polarization_array = np.concatenate(
-                [this.polarization_array, other.polarization_array]
+                [this.polarization_array]
+                + [other.polarization_array for other in other_list]
             )
-            this.Npols = this.Npols + other.Npols
+            this.Npols = this.Npols + sum(other.Npols for other in other_list)
 
             pol_separation = np.diff(this.polarization_array)
             if np.min(pol_separation) < np.max(pol_separation):
@@ -3484,43 +3543,62 @@ class UVData(UVBase):
                     "make it impossible to write this data out to some file types."
                 )
 
-            if not self.metadata_only:
+            if not this.metadata_only:
                 this.data_array = np.concatenate(
-                    [this.data_array, other.data_array], axis=3
+                    [this.data_array] + [other.data_array for other in other_list],
+                    axis=3,
                 )
                 this.nsample_array = np.concatenate(
-                    [this.nsample_array, other.nsample_array], axis=3
+                    [this.nsample_array]
+                    + [other.nsample_array for other in other_list],
+                    axis=3,
                 )
                 this.flag_array = np.concatenate(
-                    [this.flag_array, other.flag_array], axis=3
+                    [this.flag_array] + [other.flag_array for other in other_list],
+                    axis=3,
                 )
         elif axis == "blt":
-            this.Nblts = this.Nblts + other.Nblts
-            this.ant_1_array = np.concatenate([this.ant_1_array, other.ant_1_array])
-            this.ant_2_array = np.concatenate([this.ant_2_array, other.ant_2_array])
+            this.Nblts = this.Nblts + sum(other.Nblts for other in other_list)
+            this.ant_1_array = np.concatenate(
+                [this.ant_1_array] + [other.ant_1_array for other in other_list]
+            )
+            this.ant_2_array = np.concatenate(
+                [this.ant_2_array] + [other.ant_2_array for other in other_list]
+            )
             this.Nants_data = int(
-                len(np.unique(self.ant_1_array.tolist() + self.ant_2_array.tolist()))
+                len(np.unique(this.ant_1_array.tolist() + this.ant_2_array.tolist()))
+            )
+            this.uvw_array = np.concatenate(
+                [this.uvw_array] + [other.uvw_array for other in other_list], axis=0
+            )
+            this.time_array = np.concatenate(
+                [this.time_array] + [other.time_array for other in other_list]
             )
-            this.uvw_array = np.concatenate([this.uvw_array, other.uvw_array], axis=0)
-            this.time_array = np.concatenate([this.time_array, other.time_array])
             this.Ntimes = len(np.unique(this.time_array))
-            this.lst_array = np.concatenate([this.lst_array, other.lst_array])
+            this.lst_array = np.concatenate(
+                [this.lst_array] + [other.lst_array for other in other_list]
+            )
             this.baseline_array = np.concatenate(
-                [this.baseline_array, other.baseline_array]
+                [this.baseline_array] + [other.baseline_array for other in other_list]
             )
             this.Nbls = len(np.unique(this.baseline_array))
             this.integration_time = np.concatenate(
-                [this.integration_time, other.integration_time]
+                [this.integration_time]
+                + [other.integration_time for other in other_list]
             )
-            if not self.metadata_only:
+            if not this.metadata_only:
                 this.data_array = np.concatenate(
-                    [this.data_array, other.data_array], axis=0
+                    [this.data_array] + [other.data_array for other in other_list],
+                    axis=0,
                 )
                 this.nsample_array = np.concatenate(
-                    [this.nsample_array, other.nsample_array], axis=0
+                    [this.nsample_array]
+                    + [other.nsample_array for other in other_list],
+                    axis=0,
                 )
                 this.flag_array = np.concatenate(
-                    [this.flag_array, other.flag_array], axis=0
+                    [this.flag_array] + [other.flag_array for other in other_list],
+                    axis=0,
                 )
 
         # Check final object is self-consistent
@@ -4393,7 +4471,7 @@ class UVData(UVBase):
 
         self.history = self.history + history_update_string
 
-    def select(
+    def get_selection_plan(
         self,
         antenna_nums=None,
         antenna_names=None,
@@ -4405,21 +4483,16 @@ class UVData(UVBase):
         time_range=None,
         polarizations=None,
         blt_inds=None,
-        run_check=True,
-        check_extra=True,
-        run_check_acceptability=True,
-        inplace=True,
-        keep_all_metadata=True,
     ):
         """
-        Downselect data to keep on the object along various axes.
+        Make a selection plan that can be applied to many UVData objects.
 
-        Axes that can be selected along include antenna names or numbers,
-        antenna pairs, frequencies, times and polarizations. Specific
-        baseline-time indices can also be selected, but this is not commonly
-        used.
-        The history attribute on the object will be updated to identify the
-        operations performed.
+        The indices to keep are calculated from the metadata on this object,
+        the plan can then be applied (with `SelectionPlan.apply`) to this
+        object or any other UVData object with the same baselines, frequencies
+        and polarizations (and times if selecting on times). This avoids
+        recalculating the indices when doing the same select on many files.
+        The selection keywords are the same as for `select`.
 
         Parameters
         ----------
@@ -4470,30 +4543,11 @@ class UVData(UVBase):
         blt_inds : array_like of int, optional
             The baseline-time indices to keep in the object. This is
             not commonly used.
-        run_check : bool
-            Option to check for the existence and proper shapes of parameters
-            after downselecting data on this object (the default is True,
-            meaning the check will be run).
-        check_extra : bool
-            Option to check optional parameters as well as required ones (the
-            default is True, meaning the optional parameters will be checked).
-        run_check_acceptability : bool
-            Option to check acceptable range of the values of parameters after
-            downselecting data on this object (the default is True, meaning the
-            acceptable range check will be done).
-        inplace : bool
-            Option to perform the select directly on self or return a new UVData
-            object with just the selected data (the default is True, meaning the
-            select will be done on self).
-        keep_all_metadata : bool
-            Option to keep all the metadata associated with antennas, even those
-            that do do not have data associated with them after the select option.
 
         Returns
         -------
-        UVData object or None
-            None is returned if inplace is True, otherwise a new UVData object
-            with just the selected data is returned
+        SelectionPlan object
+            The selection plan.
 
         Raises
         ------
@@ -4501,17 +4555,15 @@ class UVData(UVBase):
             If any of the parameters are set to inappropriate values.
 
         """
-        if inplace:
-            uv_object = self
-        else:
-            uv_object = self.copy()
+        from .selection_plan import SelectionPlan
 
+        blt_inds_in = blt_inds
         (
             blt_inds,
             freq_inds,
             pol_inds,
             history_update_string,
-        ) = uv_object._select_preprocess(
+        ) = self._select_preprocess(
             antenna_nums,
             antenna_names,
             ant_str,
@@ -4524,41 +4576,153 @@ class UVData(UVBase):
             blt_inds,
         )
 
-        # do select operations on everything except data_array, flag_array
-        # and nsample_array
-        uv_object._select_metadata(
-            blt_inds, freq_inds, pol_inds, history_update_string, keep_all_metadata
+        # the metadata the indices were calculated from
+        layout = {"Nblts": self.Nblts, "Nfreqs": self.Nfreqs, "Npols": self.Npols}
+        if blt_inds is not None:
+            layout["baseline_array"] = self.baseline_array.copy()
+            if times is not None or time_range is not None or blt_inds_in is not None:
+                layout["time_array"] = self.time_array.copy()
+        if freq_inds is not None:
+            layout["freq_array"] = self.freq_array.copy()
+        if pol_inds is not None:
+            layout["polarization_array"] = self.polarization_array.copy()
+
+        return SelectionPlan(
+            blt_inds, freq_inds, pol_inds, history_update_string, layout
         )
 
-        if self.metadata_only:
-            if not inplace:
-                return uv_object
-            else:
-                return
+    def select(
+        self,
+        antenna_nums=None,
+        antenna_names=None,
+        ant_str=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        polarizations=None,
+        blt_inds=None,
+        run_check=True,
+        check_extra=True,
+        run_check_acceptability=True,
+        inplace=True,
+        keep_all_metadata=True,
+    ):
+        """
+        Downselect data to keep on the object along various axes.
 
-        if blt_inds is not None:
-            for param_name, param in zip(
-                self._data_params, uv_object.data_like_parameters
-            ):
-                setattr(uv_object, param_name, param[blt_inds, :, :, :])
+        Axes that can be selected along include antenna names or numbers,
+        antenna pairs, frequencies, times and polarizations. Specific
+        baseline-time indices can also be selected, but this is not commonly
+        used.
+        The history attribute on the object will be updated to identify the
+        operations performed.
 
-        if freq_inds is not None:
-            for param_name, param in zip(
-                self._data_params, uv_object.data_like_parameters
-            ):
-                setattr(uv_object, param_name, param[:, :, freq_inds, :])
+        Parameters
+        ----------
+        antenna_nums : array_like of int, optional
+            The antennas numbers to keep in the object (antenna positions and
+            names for the removed antennas will be retained unless
+            `keep_all_metadata` is False). This cannot be provided if
+            `antenna_names` is also provided.
+        antenna_names : array_like of str, optional
+            The antennas names to keep in the object (antenna positions and
+            names for the removed antennas will be retained unless
+            `keep_all_metadata` is False). This cannot be provided if
+            `antenna_nums` is also provided.
+        bls : list of tuple, optional
+            A list of antenna number tuples (e.g. [(0, 1), (3, 2)]) or a list of
+            baseline 3-tuples (e.g. [(0, 1, 'xx'), (2, 3, 'yy')]) specifying baselines
+            to keep in the object. For length-2 tuples, the ordering of the numbers
+            within the tuple does not matter. For length-3 tuples, the polarization
+            string is in the order of the two antennas. If length-3 tuples are
+            provided, `polarizations` must be None.
+        ant_str : str, optional
+            A string containing information about what antenna numbers
+            and polarizations to keep in the object.  Can be 'auto', 'cross', 'all',
+            or combinations of antenna numbers and polarizations (e.g. '1',
+            '1_2', '1x_2y').  See tutorial for more examples of valid strings and
+            the behavior of different forms for ant_str.
+            If '1x_2y,2y_3y' is passed, both polarizations 'xy' and 'yy' will
+            be kept for both baselines (1, 2) and (2, 3) to return a valid
+            pyuvdata object.
+            An ant_str cannot be passed in addition to any of `antenna_nums`,
+            `antenna_names`, `bls` args or the `polarizations` parameters,
+            if it is a ValueError will be raised.
+        frequencies : array_like of float, optional
+            The frequencies to keep in the object, each value passed here should
+            exist in the freq_array.
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to keep in the object.
+        times : array_like of float, optional
+            The times to keep in the object, each value passed here should
+            exist in the time_array. Cannot be used with `time_range`.
+        time_range : array_like of float, optional
+            The time range in Julian Date to keep in the object, must be
+            length 2. Some of the times in the object should fall between the
+            first and last elements. Cannot be used with `times`.
+        polarizations : array_like of int, optional
+            The polarizations numbers to keep in the object, each value passed
+            here should exist in the polarization_array.
+        blt_inds : array_like of int, optional
+            The baseline-time indices to keep in the object. This is
+            not commonly used.
+        run_check : bool
+            Option to check for the existence and proper shapes of parameters
+            after downselecting data on this object (the default is True,
+            meaning the check will be run).
+        check_extra : bool
+            Option to check optional parameters as well as required ones (the
+            default is True, meaning the optional parameters will be checked).
+        run_check_acceptability : bool
+            Option to check acceptable range of the values of parameters after
+            downselecting data on this object (the default is True, meaning the
+            acceptable range check will be done).
+        inplace : bool
+            Option to perform the select directly on self or return a new UVData
+            object with just the selected data (the default is True, meaning the
+            select will be done on self).
+        keep_all_metadata : bool
+            Option to keep all the metadata associated with antennas, even those
+            that do do not have data associated with them after the select option.
 
-        if pol_inds is not None:
-            for param_name, param in zip(
-                self._data_params, uv_object.data_like_parameters
-            ):
-                setattr(uv_object, param_name, param[:, :, :, pol_inds])
+        Returns
+        -------
+        UVData object or None
+            None is returned if inplace is True, otherwise a new UVData object
+            with just the selected data is returned
 
-        # check if object is uv_object-consistent
-        if run_check:
-            uv_object.check(
-                check_extra=check_extra, run_check_acceptability=run_check_acceptability
-            )
+        Raises
+        ------
+        ValueError
+            If any of the parameters are set to inappropriate values.
+
+        """
+        if inplace:
+            uv_object = self
+        else:
+            uv_object = self.copy()
+
+        selection_plan = uv_object.get_selection_plan(
+            antenna_nums=antenna_nums,
+            antenna_names=antenna_names,
+            ant_str=ant_str,
+            bls=bls,
+            frequencies=frequencies,
+            freq_chans=freq_chans,
+            times=times,
+            time_range=time_range,
+            polarizations=polarizations,
+            blt_inds=blt_inds,
+        )
+        selection_plan.apply(
+            uv_object,
+            keep_all_metadata=keep_all_metadata,
+            run_check=run_check,
+            check_extra=check_extra,
+            run_check_acceptability=run_check_acceptability,
+        )
 
         if not inplace:
             return uv_object
@@ -4710,66 +4874,47 @@ class UVData(UVBase):
             temp_new_samples[mask_close_floor]
         )
 
-        n_new_samples = np.asarray(list(map(int, np.ceil(temp_new_samples))))
+        n_new_samples = np.ceil(temp_new_samples).astype(int)
 
-        temp_Nblts = np.sum(n_new_samples)
+        # each original sample is repeated n_new_samples times
+        upsample_inds = np.repeat(inds_to_upsample[0], n_new_samples)
+        # index of each new sample within its original sample
+        new_sample_inds = np.arange(upsample_inds.size) - np.repeat(
+            np.cumsum(n_new_samples) - n_new_samples, n_new_samples
+        )
+        n_new_samples = np.repeat(n_new_samples, n_new_samples)
 
-        temp_baseline = np.zeros((temp_Nblts,), dtype=np.int)
-        temp_time = np.zeros((temp_Nblts,))
-        temp_int_time = np.zeros((temp_Nblts,))
+        temp_baseline = self.baseline_array[upsample_inds]
         if self.metadata_only:
             temp_data = None
             temp_flag = None
             temp_nsample = None
         else:
-            temp_data = np.zeros(
-                (temp_Nblts, self.Nspws, self.Nfreqs, self.Npols),
-                dtype=self.data_array.dtype,
-            )
-            temp_flag = np.zeros(
-                (temp_Nblts, self.Nspws, self.Nfreqs, self.Npols),
-                dtype=self.flag_array.dtype,
-            )
-            temp_nsample = np.zeros(
-                (temp_Nblts, self.Nspws, self.Nfreqs, self.Npols),
-                dtype=self.nsample_array.dtype,
-            )
-
-        i0 = 0
-        for i, ind in enumerate(inds_to_upsample[0]):
-            i1 = i0 + n_new_samples[i]
-            temp_baseline[i0:i1] = self.baseline_array[ind]
-            if not self.metadata_only:
-                if summing_correlator_mode:
-                    temp_data[i0:i1] = self.data_array[ind] / n_new_samples[i]
-                else:
-                    temp_data[i0:i1] = self.data_array[ind]
-                temp_flag[i0:i1] = self.flag_array[ind]
-                temp_nsample[i0:i1] = self.nsample_array[ind]
-
-            # compute the new times of the upsampled array
-            t0 = self.time_array[ind]
-            dt = self.integration_time[ind] / n_new_samples[i]
-
-            # `offset` will be 0.5 or 1, depending on whether n_new_samples for
-            # this baseline is even or odd.
-            offset = 0.5 + 0.5 * (n_new_samples[i] % 2)
-            n2 = n_new_samples[i] // 2
-
-            # Figure out the new center for sample ii taking offset into
-            # account. Because `t0` is the central time for the original time
-            # sample, `nt` will range from negative to positive so that
-            # `temp_time` will result in the central time for the new samples.
-            # `idx2` tells us how to far to shift and in what direction for each
-            # new sample.
-            for ii, idx in enumerate(range(i0, i1)):
-                idx2 = ii + offset + n2 - n_new_samples[i]
-                nt = ((t0 * units.day) + (dt * idx2 * units.s)).to(units.day).value
-                temp_time[idx] = nt
-
-            temp_int_time[i0:i1] = dt
-
-            i0 = i1
+            temp_data = self.data_array[upsample_inds]
+            if summing_correlator_mode:
+                temp_data /= n_new_samples[:, np.newaxis, np.newaxis, np.newaxis]
+            temp_flag = self.flag_array[upsample_inds]
+            temp_nsample = self.nsample_array[upsample_inds]
+
+        # compute the new times of the upsampled array
+        t0 = self.time_array[upsample_inds]
+        dt = self.integration_time[upsample_inds] / n_new_samples
+
+        # `offset` will be 0.5 or 1, depending on whether n_new_samples for
+        # this baseline is even or odd.
+        offset = 0.5 + 0.5 * (n_new_samples % 2)
+        n2 = n_new_samples // 2
+
+        # Figure out the new center for each new sample taking offset into
+        # account. Because `t0` is the central time for the original time
+        # sample, `nt` will range from negative to positive so that
+        # `temp_time` will result in the central time for the new samples.
+        # `idx2` tells us how to far to shift and in what direction for each
+        # new sample.
+        idx2 = new_sample_inds + offset + n2 - n_new_samples
+        temp_time = ((t0 * units.day) + (dt * idx2 * units.s)).to(units.day).value
+
+        temp_int_time = dt
 
         # harmonize temporary arrays with existing ones
         inds_to_keep = np.nonzero(self.integration_time <= max_int_time)
@@ -4922,56 +5067,85 @@ class UVData(UVBase):
         else:
             bls_to_downsample = np.unique(self.baseline_array)
 
-        # figure out how many baseline times we'll end up with at the end
-        n_new_samples = 0
-        for bl in bls_to_downsample:
-            bl_inds = np.nonzero(self.baseline_array == bl)[0]
-            int_times = self.integration_time[bl_inds]
-
+        # gather the blts to downsample grouped by baseline (in baseline order),
+        # keeping the time order within each baseline
+        blt_inds = np.nonzero(np.isin(self.baseline_array, bls_to_downsample))[0]
+        blt_inds = blt_inds[np.argsort(self.baseline_array[blt_inds], kind="stable")]
+        _, bl_starts, bl_counts = np.unique(
+            self.baseline_array[blt_inds], return_index=True, return_counts=True
+        )
+        bl_index = np.repeat(np.arange(bl_starts.size), bl_counts)
+        int_times = self.integration_time[blt_inds]
+
+        # step through the times of all the baselines together, keeping a running
+        # total of the integration time to find where each averaging group ends.
+        running_int_time = np.zeros(bl_starts.size)
+        group_int_time = np.zeros(blt_inds.size)
+        over_min_int_time = np.zeros(blt_inds.size, dtype=bool)
+        for itime in range(np.amax(bl_counts)):
+            active = np.nonzero(bl_counts > itime)[0]
+            sample_inds = bl_starts[active] + itime
+            running_int_time[active] += int_times[sample_inds]
+            group_int_time[sample_inds] = running_int_time[active]
             if min_int_time is not None:
-                running_int_time = 0.0
-                for itime, int_time in enumerate(int_times):
-                    running_int_time += int_time
-                    over_min_int_time = running_int_time > min_int_time or np.isclose(
-                        running_int_time,
-                        min_int_time,
-                        rtol=self._integration_time.tols[0],
-                        atol=self._integration_time.tols[1],
-                    )
-                    last_sample = itime == len(bl_inds) - 1
-                    # We sum up all the samples found so far if we're over the
-                    # target minimum time, or we've hit the end of the time
-                    # samples for this baseline.
-                    if over_min_int_time or last_sample:
-                        if last_sample and not (over_min_int_time or keep_ragged):
-                            # don't do anything -- implicitly drop these integrations
-                            continue
-                        n_new_samples += 1
-                        running_int_time = 0.0
+                over_min = (running_int_time[active] > min_int_time) | np.isclose(
+                    running_int_time[active],
+                    min_int_time,
+                    rtol=self._integration_time.tols[0],
+                    atol=self._integration_time.tols[1],
+                )
             else:
-                n_bl_times = self.time_array[bl_inds].size
-                n_sample_temp = np.sum(n_bl_times / n_times_to_avg)
-                if keep_ragged and not np.isclose(
-                    n_sample_temp, np.floor(n_sample_temp)
-                ):
-                    n_new_samples += np.ceil(n_sample_temp).astype(int)
-                else:
-                    n_new_samples += np.floor(n_sample_temp).astype(int)
-
-            # figure out if there are any time gaps in the data
-            # meaning that the time differences are larger than the integration times
-            # time_array is in JD, need to convert to seconds for the diff
-            dtime = np.ediff1d(self.time_array[bl_inds]) * 24 * 3600
-            int_times = int_times
-            if len(np.unique(int_times)) == 1:
+                over_min = np.full(active.size, (itime + 1) % n_times_to_avg == 0)
+            over_min_int_time[sample_inds] = over_min
+            running_int_time[active[over_min]] = 0.0
+        last_sample = np.zeros(blt_inds.size, dtype=bool)
+        last_sample[bl_starts + bl_counts - 1] = True
+
+        # We sum up all the samples found so far if we're over the target
+        # minimum time, or we've hit the end of the time samples for the baseline.
+        group_ends = np.nonzero(over_min_int_time | last_sample)[0]
+        group_starts = np.concatenate(([0], group_ends[:-1] + 1))
+        if not keep_ragged:
+            # drop the integrations at the end that don't make a full group
+            keep_groups = over_min_int_time[group_ends]
+            group_starts = group_starts[keep_groups]
+            group_ends = group_ends[keep_groups]
+        group_counts = group_ends - group_starts + 1
+        temp_Nblts = group_ends.size
+
+        # figure out if there are any time gaps in the data
+        # meaning that the time differences are larger than the integration times
+        # time_array is in JD, need to convert to seconds for the diff
+        dtime = np.ediff1d(self.time_array[blt_inds]) * 24 * 3600
+        # only compare consecutive times on the same baseline
+        same_bl = bl_index[1:] == bl_index[:-1]
+        int_time_change = same_bl & (int_times[1:] != int_times[:-1])
+        varying_int_time = np.bincount(
+            bl_index[1:][int_time_change], minlength=bl_starts.size
+        ).astype(bool)
+        multi_time = bl_counts > 1
+        first_dtime = np.zeros(bl_starts.size)
+        first_dtime[multi_time] = dtime[bl_starts[multi_time]]
+        dtime_change = same_bl & (dtime != first_dtime[bl_index[1:]])
+        time_gap = np.bincount(
+            bl_index[1:][dtime_change], minlength=bl_starts.size
+        ).astype(bool)
+        dtime_mismatch = multi_time & ~np.isclose(first_dtime, int_times[bl_starts])
+        expected_dtimes = (int_times[:-1] + int_times[1:]) / 2
+        n_dtime_diff = np.bincount(
+            bl_index[1:][same_bl & ~np.isclose(dtime, expected_dtimes)],
+            minlength=bl_starts.size,
+        )
+        for bl_ind, bl in enumerate(self.baseline_array[blt_inds[bl_starts]]):
+            if not varying_int_time[bl_ind]:
                 # this baseline has all the same integration times
-                if len(np.unique(dtime)) > 1:
+                if time_gap[bl_ind]:
                     warnings.warn(
                         "There is a gap in the times of baseline {bl}. "
                         "The output may include averages across long "
                         "time gaps.".format(bl=self.baseline_to_antnums(bl))
                     )
-                elif not np.isclose(dtime[0], int_times[0]):
+                elif dtime_mismatch[bl_ind]:
                     warnings.warn(
                         "The time difference between integrations is "
                         "not the same as the integration time for "
@@ -4979,21 +5153,15 @@ class UVData(UVBase):
                         "longer time intervals than "
                         "expected".format(bl=self.baseline_to_antnums(bl))
                     )
-
-            else:
-                # varying integration times for this baseline, need to be more careful
-                expected_dtimes = (int_times[:-1] + int_times[1:]) / 2
-                wh_diff = np.nonzero(~np.isclose(dtime, expected_dtimes))
-                if wh_diff[0].size > 1:
-                    warnings.warn(
-                        "The time difference between integrations is "
-                        "different than the expected given the "
-                        "integration times for baseline {bl}. The "
-                        "output may include averages across long time "
-                        "gaps.".format(bl=self.baseline_to_antnums(bl))
-                    )
-
-        temp_Nblts = n_new_samples
+            elif n_dtime_diff[bl_ind] > 1:
+                # varying integration times for this baseline
+                warnings.warn(
+                    "The time difference between integrations is "
+                    "different than the expected given the "
+                    "integration times for baseline {bl}. The "
+                    "output may include averages across long time "
+                    "gaps.".format(bl=self.baseline_to_antnums(bl))
+                )
 
         input_phase_type = self.phase_type
         if input_phase_type == "drift":
@@ -5008,10 +5176,9 @@ class UVData(UVBase):
                 phase_time = Time(self.time_array[0], format="jd")
                 self.phase_to_time(phase_time)
 
-        # make temporary arrays
-        temp_baseline = np.zeros((temp_Nblts,), dtype=np.int)
+        temp_baseline = self.baseline_array[blt_inds[group_ends]]
+        temp_int_time = group_int_time[group_ends]
         temp_time = np.zeros((temp_Nblts,))
-        temp_int_time = np.zeros((temp_Nblts,))
         if self.metadata_only:
             temp_data = None
             temp_flag = None
@@ -5030,104 +5197,53 @@ class UVData(UVBase):
                 dtype=self.nsample_array.dtype,
             )
 
-        temp_idx = 0
-        for bl in bls_to_downsample:
-            bl_inds = np.nonzero(self.baseline_array == bl)[0]
-            running_int_time = 0.0
-            summing_idx = 0
-            n_sum = 0
-            for itime, int_time in enumerate(self.integration_time[bl_inds]):
-                running_int_time += int_time
-                n_sum += 1
-                if min_int_time is not None:
-                    over_min_int_time = running_int_time > min_int_time or np.isclose(
-                        running_int_time,
-                        min_int_time,
-                        rtol=self._integration_time.tols[0],
-                        atol=self._integration_time.tols[1],
-                    )
-                else:
-                    over_min_int_time = n_sum >= n_times_to_avg
-                last_sample = itime == len(bl_inds) - 1
-                # We sum up all the samples found so far if we're over the
-                # target minimum time, or we've hit the end of the time
-                # samples for this baseline.
-                if over_min_int_time or last_sample:
-                    if last_sample and not (over_min_int_time or keep_ragged):
-                        # don't do anything -- implicitly drop these integrations
-                        continue
-                    # sum together that number of samples
-                    temp_baseline[temp_idx] = bl
-                    # this might be wrong if some of the constituent times are
-                    # *totally* flagged
-                    averaging_idx = bl_inds[summing_idx : summing_idx + n_sum]
-                    # take potential non-uniformity of integration_time into account
-                    temp_time[temp_idx] = np.sum(
-                        self.time_array[averaging_idx]
-                        * self.integration_time[averaging_idx]
-                    ) / np.sum(self.integration_time[averaging_idx])
-                    temp_int_time[temp_idx] = running_int_time
-                    if not self.metadata_only:
-                        # if all inputs are flagged, the flag array should be True,
-                        # otherwise it should be False.
-                        # The sum below will be zero if it's all flagged and
-                        # greater than zero otherwise
-                        # Then we use a test against 0 to turn it into a Boolean
-                        temp_flag[temp_idx] = (
-                            np.sum(~self.flag_array[averaging_idx], axis=0) == 0
-                        )
-
-                        mask = self.flag_array[averaging_idx]
-                        # need to update mask if a downsampled visibility will
-                        # be flagged so that we don't set it to zero
-                        if (temp_flag[temp_idx]).any():
-                            ax1_inds, ax2_inds, ax3_inds = np.nonzero(
-                                temp_flag[temp_idx]
-                            )
-                            mask[:, ax1_inds, ax2_inds, ax3_inds] = False
-
-                        masked_data = np.ma.masked_array(
-                            self.data_array[averaging_idx], mask=mask
-                        )
-                        if summing_correlator_mode:
-                            temp_data[temp_idx] = np.sum(masked_data, axis=0)
-                        else:
-                            # take potential non-uniformity of integration_time into
-                            # account
-                            masked_int_time = np.ma.masked_array(
-                                np.ones_like(
-                                    self.data_array[averaging_idx],
-                                    dtype=self.integration_time.dtype,
-                                )
-                                * self.integration_time[
-                                    averaging_idx, np.newaxis, np.newaxis, np.newaxis
-                                ],
-                                mask=mask,
-                            )
-                            weighted_data = masked_data * masked_int_time
-                            temp_data[temp_idx] = np.sum(
-                                weighted_data, axis=0
-                            ) / np.sum(masked_int_time, axis=0)
-                        # nsample array is the fraction of data that we actually kept,
-                        # relative to the amount that went into the sum or average
-                        masked_nsample = np.ma.masked_array(
-                            self.nsample_array[averaging_idx], mask=mask
-                        )
-                        temp_nsample[temp_idx] = np.sum(masked_nsample, axis=0) / float(
-                            self.flag_array[averaging_idx].shape[0]
-                        )
-                    # increment counters and reset values
-                    temp_idx += 1
-                    summing_idx += n_sum
-                    running_int_time = 0.0
-                    n_sum = 0
+        # average all the groups with the same number of samples together,
+        # the samples for each group are along the second axis.
+        for n_sum in np.unique(group_counts):
+            temp_inds = np.nonzero(group_counts == n_sum)[0]
+            averaging_inds = blt_inds[
+                group_starts[temp_inds, np.newaxis] + np.arange(n_sum)
+            ]
+            # this might be wrong if some of the constituent times are
+            # *totally* flagged
+            # take potential non-uniformity of integration_time into account
+            avg_int_time = self.integration_time[averaging_inds]
+            temp_time[temp_inds] = np.sum(
+                self.time_array[averaging_inds] * avg_int_time, axis=1
+            ) / np.sum(avg_int_time, axis=1)
+            if self.metadata_only:
+                continue
 
-        # make sure we've populated the right number of baseline-times
-        assert temp_idx == temp_Nblts, (
-            "Wrong number of baselines. Got {:d},  expected {:d}. This is a bug, "
-            "please make an issue at https://github.com/RadioAstronomySoftwareGroup/"
-            "pyuvdata/issues".format(temp_idx, temp_Nblts)
-        )
+            # if all inputs are flagged, the flag array should be True,
+            # otherwise it should be False.
+            mask = self.flag_array[averaging_inds]
+            temp_flag[temp_inds] = np.all(mask, axis=1)
+            # need to update mask if a downsampled visibility will
+            # be flagged so that we don't set it to zero
+            mask &= ~temp_flag[temp_inds, np.newaxis]
+
+            avg_data = self.data_array[averaging_inds]
+            # zero the masked samples so non-finite values in flagged data do
+            # not propagate into the sum or average
+            avg_data[mask] = 0
+            if summing_correlator_mode:
+                temp_data[temp_inds] = np.sum(avg_data, axis=1)
+            else:
+                # take potential non-uniformity of integration_time into account
+                masked_int_time = np.where(
+                    mask, 0, avg_int_time[:, :, np.newaxis, np.newaxis, np.newaxis]
+                )
+                avg_data *= masked_int_time
+                temp_data[temp_inds] = np.sum(avg_data, axis=1) / np.sum(
+                    masked_int_time, axis=1
+                )
+                del masked_int_time
+            # nsample array is the fraction of data that we actually kept,
+            # relative to the amount that went into the sum or average
+            avg_nsample = self.nsample_array[averaging_inds]
+            avg_nsample[mask] = 0
+            temp_nsample[temp_inds] = np.sum(avg_nsample, axis=1) / float(n_sum)
+            del mask, avg_data, avg_nsample
 
         # harmonize temporary arrays with existing ones
         if min_int_time is not None:
@@ -5336,51 +5452,47 @@ class UVData(UVBase):
 
             if propagate_flags:
                 # if any contributors are flagged, the result should be flagged
-                self.flag_array = np.any(self.flag_array.reshape(shape_tuple), axis=3)
+                self.flag_array = np.any(mask, axis=3)
             else:
                 # if all inputs are flagged, the flag array should be True,
                 # otherwise it should be False.
                 # The sum below will be zero if it's all flagged and
                 # greater than zero otherwise
                 # Then we use a test against 0 to turn it into a Boolean
-                self.flag_array = (
-                    np.sum(~self.flag_array.reshape(shape_tuple), axis=3) == 0
-                )
+                self.flag_array = np.sum(~mask, axis=3) == 0
 
             # need to update mask if a downsampled visibility will be flagged
             # so that we don't set it to zero
-            for n_chan in np.arange(n_final_chan):
-                if (self.flag_array[:, :, n_chan]).any():
-                    ax0_inds, ax1_inds, ax3_inds = np.nonzero(
-                        self.flag_array[:, :, n_chan, :]
-                    )
-                    # Only if all entries are masked
-                    # May not happen due to propagate_flags keyword
-                    # mask should be left alone otherwise
-                    if np.all(mask[ax0_inds, ax1_inds, n_chan, :, ax3_inds]):
-                        mask[ax0_inds, ax1_inds, n_chan, :, ax3_inds] = False
-
-            masked_data = np.ma.masked_array(
-                self.data_array.reshape(shape_tuple), mask=mask
+            # Only if all entries are masked for all the flagged samples in a
+            # channel. May not happen due to propagate_flags keyword
+            # mask should be left alone otherwise
+            # This is written with array operations (rather than masked arrays)
+            # so that it also works on lazily loaded (e.g. dask) arrays.
+            all_masked = np.all(mask, axis=3)
+            unmask_chan = np.all(all_masked | ~self.flag_array, axis=(0, 1, 3))
+            unmask = (
+                self.flag_array & unmask_chan[np.newaxis, np.newaxis, :, np.newaxis]
             )
+            mask = mask & ~unmask[:, :, :, np.newaxis, :]
 
-            self.nsample_array = self.nsample_array.reshape(shape_tuple)
-            masked_nsample = np.ma.masked_array(self.nsample_array, mask=mask)
+            data = self.data_array.reshape(shape_tuple)
+            nsample = np.where(mask, 0, self.nsample_array.reshape(shape_tuple))
 
             if summing_correlator_mode:
-                self.data_array = np.sum(masked_data, axis=3).data
+                self.data_array = np.sum(np.where(mask, 0, data), axis=3)
             else:
                 # need to weight by the n_sample_array
-                self.data_array = (
-                    np.sum(masked_data * masked_nsample, axis=3)
-                    / np.sum(masked_nsample, axis=3)
-                ).data
+                weighted_sum = np.sum(np.where(mask, 0, data * nsample), axis=3)
+                nsample_sum = np.sum(nsample, axis=3)
+                # leave samples with no weight as their (zero) sum rather than
+                # dividing by zero
+                self.data_array = weighted_sum / np.where(
+                    nsample_sum == 0, 1, nsample_sum
+                )
 
             # nsample array is the fraction of data that we actually kept,
             # relative to the amount that went into the sum or average
-            self.nsample_array = (
-                np.sum(masked_nsample, axis=3) / float(n_chan_to_avg)
-            ).data
+            self.nsample_array = np.sum(nsample, axis=3) / float(n_chan_to_avg)
 
     def get_redundancies(
         self,
@@ -5519,8 +5631,7 @@ class UVData(UVBase):
         # TODO should be an assert that each baseline only ends up in one group
 
         # Map group index to blt indices in the compressed array.
-        bl_array_comp = self.baseline_array
-        uniq_bl = np.unique(bl_array_comp)
+        bl_dict, _ = self._get_blt_inds_cache()
 
         group_blti = {}
         Nblts_full = 0
@@ -5528,8 +5639,8 @@ class UVData(UVBase):
             for bl in gp:
                 # First baseline in the group that is also in the compressed
                 # baseline array.
-                if bl in uniq_bl:
-                    group_blti[i] = np.where(bl == bl_array_comp)[0]
+                if bl in bl_dict:
+                    group_blti[i] = bl_dict[bl]
                     # add number of blts for this group
                     Nblts_full += group_blti[i].size * len(gp)
                     break
@@ -5822,15 +5933,30 @@ class UVData(UVBase):
         self,
         filepath,
         axis=None,
+        antenna_nums=None,
+        antenna_names=None,
+        ant_str=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        polarizations=None,
+        blt_inds=None,
+        keep_all_metadata=True,
         data_column="DATA",
         pol_order="AIPS",
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
+        blt_chunk_size=None,
     ):
         """
         Read in data from a measurement set.
 
+        Supports reading only selected portions of the data, only the selected
+        rows, channels and polarizations of the data columns are read.
+
         Parameters
         ----------
         filepath : str
@@ -5842,6 +5968,60 @@ class UVData(UVBase):
             objects. Please see the docstring for fast_concat for details.
             Allowed values are: 'blt', 'freq', 'polarization'. Only used if
             multiple files are passed.
+        antenna_nums : array_like of int, optional
+            The antennas numbers to include when reading data into the object
+            (antenna positions and names for the removed antennas will be retained
+            unless `keep_all_metadata` is False). This cannot be provided if
+            `antenna_names` is also provided.
+        antenna_names : array_like of str, optional
+            The antennas names to include when reading data into the object
+            (antenna positions and names for the removed antennas will be retained
+            unless `keep_all_metadata` is False). This cannot be provided if
+            `antenna_nums` is also provided.
+        bls : list of tuple, optional
+            A list of antenna number tuples (e.g. [(0, 1), (3, 2)]) or a list of
+            baseline 3-tuples (e.g. [(0, 1, 'xx'), (2, 3, 'yy')]) specifying baselines
+            to include when reading data into the object. For length-2 tuples,
+            the ordering of the numbers within the tuple does not matter. For
+            length-3 tuples, the polarization string is in the order of the two
+            antennas. If length-3 tuples are provided, `polarizations` must be
+            None.
+        ant_str : str, optional
+            A string containing information about what antenna numbers
+            and polarizations to include when reading data into the object.
+            Can be 'auto', 'cross', 'all', or combinations of antenna numbers
+            and polarizations (e.g. '1', '1_2', '1x_2y').  See tutorial for more
+            examples of valid strings and the behavior of different forms for ant_str.
+            If '1x_2y,2y_3y' is passed, both polarizations 'xy' and 'yy' will
+            be kept for both baselines (1, 2) and (2, 3) to return a valid
+            pyuvdata object.
+            An ant_str cannot be passed in addition to any of `antenna_nums`,
+            `antenna_names`, `bls` args or the `polarizations` parameters,
+            if it is a ValueError will be raised.
+        frequencies : array_like of float, optional
+            The frequencies to include when reading data into the object, each
+            value passed here should exist in the freq_array.
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to include when reading data into the
+            object.
+        times : array_like of float, optional
+            The times to include when reading data into the object, each value
+            passed here should exist in the time_array in the file.
+            Cannot be used with `time_range`.
+        time_range : array_like of float, optional
+            The time range in Julian Date to include when reading data into
+            the object, must be length 2. Some of the times in the file should
+            fall between the first and last elements.
+            Cannot be used with `times`.
+        polarizations : array_like of int, optional
+            The polarizations numbers to include when reading data into the
+            object, each value passed here should exist in the polarization_array.
+        blt_inds : array_like of int, optional
+            The baseline-time indices to include when reading data into the
+            object. This is not commonly used.
+        keep_all_metadata : bool
+            Option to keep all the metadata associated with antennas, even those
+            that do not have data associated with them after the select option.
         data_column : str
             name of CASA data column to read into data_array. Options are:
             'DATA', 'MODEL', or 'CORRECTED_DATA'
@@ -5859,6 +6039,11 @@ class UVData(UVBase):
             Option to check acceptable range of the values of parameters after
             reading in the file (the default is True, meaning the acceptable
             range check will be done).
+        blt_chunk_size : int
+            Number of baseline-times (rows) to read from the table at once, the
+            data are written into the final arrays one chunk at a time to bound
+            the size of the temporary arrays. Defaults to the number of
+            baseline-times in about 64 MiB of visibilities.
 
         Raises
         ------
@@ -5869,6 +6054,10 @@ class UVData(UVBase):
             If the data are have multiple subarrays or are multi source or have
             multiple spectral windows.
             If the data have multiple data description ID values.
+            If incompatible select keywords are set (e.g. `ant_str` with other
+            antenna selectors, `times` and `time_range`) or select keywords
+            exclude all data or if keywords are set to the wrong type.
+            If `blt_chunk_size` is less than 1.
 
         """
         if isinstance(filepath, (list, tuple, np.ndarray)):
@@ -5883,11 +6072,23 @@ class UVData(UVBase):
         ms_obj = ms.MS()
         ms_obj.read_ms(
             filepath,
+            antenna_nums=antenna_nums,
+            antenna_names=antenna_names,
+            ant_str=ant_str,
+            bls=bls,
+            frequencies=frequencies,
+            freq_chans=freq_chans,
+            times=times,
+            time_range=time_range,
+            polarizations=polarizations,
+            blt_inds=blt_inds,
+            keep_all_metadata=keep_all_metadata,
             run_check=run_check,
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
             data_column=data_column,
             pol_order=pol_order,
+            blt_chunk_size=blt_chunk_size,
         )
         self._convert_from_filetype(ms_obj)
         del ms_obj
@@ -5909,6 +6110,12 @@ class UVData(UVBase):
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
+        n_workers=1,
+        antenna_nums=None,
+        freq_chans=None,
+        times=None,
+        time_range=None,
+        keep_all_metadata=True,
     ):
         """
         Read in MWA correlator gpu box files.
@@ -5963,6 +6170,26 @@ class UVData(UVBase):
             Option to check acceptable range of the values of parameters after
             reading in the file (the default is True, meaning the acceptable
             range check will be done).
+        n_workers : int
+            Number of gpubox files to read concurrently using a thread pool.
+        antenna_nums : array_like of int, optional
+            The antennas numbers to include when reading data into the object
+            (antenna positions and names for the removed antennas will be retained
+            unless `keep_all_metadata` is False).
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to include when reading data into the
+            object. Gpubox files for coarse channels that contain none of these
+            frequency channels are not read.
+        times : array_like of float, optional
+            The times to include when reading data into the object, each value
+            passed here should exist in the time_array.
+        time_range : array_like of float, optional
+            The time range in Julian Date to include when reading data into
+            the object, must be length 2. Some of the times in the object should
+            fall between the first and last elements. Cannot be used with `times`.
+        keep_all_metadata : bool
+            Option to keep all the metadata associated with antennas, even those
+            that do not have data associated with them after the select option.
 
         Raises
         ------
@@ -5998,6 +6225,12 @@ class UVData(UVBase):
             run_check=run_check,
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
+            n_workers=n_workers,
+            antenna_nums=antenna_nums,
+            freq_chans=freq_chans,
+            times=times,
+            time_range=time_range,
+            keep_all_metadata=keep_all_metadata,
         )
         self._convert_from_filetype(corr_obj)
         del corr_obj
@@ -6021,6 +6254,7 @@ class UVData(UVBase):
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
+        blt_chunk_size=None,
     ):
         """
         Read in header, metadata and data from a single uvfits file.
@@ -6108,6 +6342,11 @@ class UVData(UVBase):
             Option to check acceptable range of the values of parameters after
             reading in the file (the default is True, meaning the acceptable
             range check will be done). Ignored if read_data is False.
+        blt_chunk_size : int
+            Number of baseline-times to read from the file at once, the data
+            are written into the final arrays one chunk at a time to bound the
+            size of the temporary arrays. Defaults to the number of
+            baseline-times in about 64 MiB of the raw data.
 
         Raises
         ------
@@ -6120,6 +6359,7 @@ class UVData(UVBase):
             If the data are multi source or have multiple
             spectral windows.
             If the metadata are not internally consistent or missing.
+            If `blt_chunk_size` is less than 1.
 
         """
         from . import uvfits
@@ -6149,6 +6389,7 @@ class UVData(UVBase):
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
             keep_all_metadata=keep_all_metadata,
+            blt_chunk_size=blt_chunk_size,
         )
         self._convert_from_filetype(uvfits_obj)
         del uvfits_obj
@@ -6174,6 +6415,7 @@ class UVData(UVBase):
         check_extra=True,
         run_check_acceptability=True,
         multidim_index=False,
+        lazy=False,
     ):
         """
         Read a UVH5 file.
@@ -6271,6 +6513,12 @@ class UVData(UVBase):
             simultaneously along all data axes. Otherwise index one axis at-a-time.
             This only works if data selection is sliceable along all but one axis.
             If indices are not well-matched to data chunks, this can be slow.
+        lazy : bool
+            If True, do not read the data, flags and nsamples into memory.
+            Instead, set the data_array, flag_array and nsample_array to dask
+            arrays that reference the datasets on disk, chunked to match the
+            on-disk chunks. Sections of these arrays are only read when they
+            are computed (e.g. by `get_data`). Requires dask.
 
         Raises
         ------
@@ -6312,6 +6560,7 @@ class UVData(UVBase):
             data_array_dtype=data_array_dtype,
             keep_all_metadata=keep_all_metadata,
             multidim_index=multidim_index,
+            lazy=lazy,
         )
         self._convert_from_filetype(uvh5_obj)
         del uvh5_obj
@@ -6358,6 +6607,9 @@ class UVData(UVBase):
         run_check_acceptability=True,
         skip_bad_files=False,
         multidim_index=False,
+        lazy=False,
+        n_workers=1,
+        executor="thread",
     ):
         """
         Read a generic file into a UVData object.
@@ -6542,6 +6794,26 @@ class UVData(UVBase):
             simultaneously along all data axes. Otherwise index one axis at-a-time.
             This only works if data selection is sliceable along all but one axis.
             If indices are not well-matched to data chunks, this can be slow.
+        lazy : bool
+            [Only for HDF5] If True, set the data_array, flag_array and
+            nsample_array to dask arrays that reference the datasets on disk
+            rather than reading them into memory. Sections of these arrays
+            are only read when they are computed. Requires dask.
+        n_workers : int
+            Number of workers to use to read the files concurrently when
+            reading multiple files. The files are still combined in the order
+            they are passed. Default is 1 (files are read one at a time). Up to
+            `n_workers` files are read ahead of the one being combined, so up to
+            that many extra objects may be held in memory at once. When
+            reading a single MWA correlator FITS data set, this sets the number
+            of gpubox files to read concurrently instead.
+        executor : str
+            Type of worker pool to use if n_workers is greater than 1, one of
+            "thread" or "process". Threads work well for file types whose
+            readers release the GIL during I/O (e.g. uvh5), processes avoid the
+            GIL entirely at the cost of pickling the objects read in each
+            worker back to the main process. Note that warnings raised while
+            reading files in worker processes are not shown.
 
         Raises
         ------
@@ -6553,8 +6825,15 @@ class UVData(UVBase):
             If the data are multi source or have multiple
             spectral windows.
             If phase_center_radec is not None and is not length 2.
+            If executor is not one of "thread" or "process".
+            If n_workers is less than 1.
 
         """
+        if executor not in ["thread", "process"]:
+            raise ValueError('executor must be one of "thread" or "process".')
+        if n_workers < 1:
+            raise ValueError("n_workers must be a positive integer.")
+
         if isinstance(filename, (list, tuple, np.ndarray)):
             # this is either a list of separate files to read or a list of
             # FHD files or MWA correlator FITS files
@@ -6657,6 +6936,8 @@ class UVData(UVBase):
                         check_extra=check_extra,
                         run_check_acceptability=run_check_acceptability,
                         skip_bad_files=skip_bad_files,
+                        multidim_index=multidim_index,
+                        lazy=lazy,
                     )
                     unread = False
                 except KeyError:
@@ -6675,72 +6956,118 @@ class UVData(UVBase):
                 phase_center_radec = [self.phase_center_ra, self.phase_center_dec]
 
             if len(filename) > file_num + 1:
-                for f in filename[file_num + 1 :]:
-                    uv2 = UVData()
-                    try:
-                        uv2.read(
-                            f,
-                            file_type=file_type,
-                            phase_center_radec=phase_center_radec,
-                            antenna_nums=antenna_nums,
-                            antenna_names=antenna_names,
-                            ant_str=ant_str,
-                            bls=bls,
-                            frequencies=frequencies,
-                            freq_chans=freq_chans,
-                            times=times,
-                            polarizations=polarizations,
-                            blt_inds=blt_inds,
-                            time_range=time_range,
-                            keep_all_metadata=keep_all_metadata,
-                            read_data=read_data,
-                            phase_type=phase_type,
-                            correct_lat_lon=correct_lat_lon,
-                            use_model=use_model,
-                            data_column=data_column,
-                            pol_order=pol_order,
-                            data_array_dtype=data_array_dtype,
-                            run_check=run_check,
-                            check_extra=check_extra,
-                            run_check_acceptability=run_check_acceptability,
-                            skip_bad_files=skip_bad_files,
-                        )
-                    except KeyError:
-                        warnings.warn("Failed to read {f}".format(f=f))
-                        if skip_bad_files:
-                            continue
-                        else:
-                            raise
-                    if axis is not None:
-                        self.fast_concat(
-                            uv2,
-                            axis,
-                            phase_center_radec=phase_center_radec,
-                            unphase_to_drift=unphase_to_drift,
-                            phase_frame=phase_frame,
-                            orig_phase_frame=orig_phase_frame,
-                            use_ant_pos=phase_use_ant_pos,
-                            run_check=run_check,
-                            check_extra=check_extra,
-                            run_check_acceptability=run_check_acceptability,
-                            inplace=True,
-                        )
+                read_kwargs = {
+                    "file_type": file_type,
+                    "phase_center_radec": phase_center_radec,
+                    "antenna_nums": antenna_nums,
+                    "antenna_names": antenna_names,
+                    "ant_str": ant_str,
+                    "bls": bls,
+                    "frequencies": frequencies,
+                    "freq_chans": freq_chans,
+                    "times": times,
+                    "polarizations": polarizations,
+                    "blt_inds": blt_inds,
+                    "time_range": time_range,
+                    "keep_all_metadata": keep_all_metadata,
+                    "read_data": read_data,
+                    "phase_type": phase_type,
+                    "correct_lat_lon": correct_lat_lon,
+                    "use_model": use_model,
+                    "data_column": data_column,
+                    "pol_order": pol_order,
+                    "data_array_dtype": data_array_dtype,
+                    "run_check": run_check,
+                    "check_extra": check_extra,
+                    "run_check_acceptability": run_check_acceptability,
+                    "skip_bad_files": skip_bad_files,
+                    "multidim_index": multidim_index,
+                    "lazy": lazy,
+                }
+                other_files = filename[file_num + 1 :]
+                if n_workers > 1:
+                    # decode the files concurrently, they are still combined
+                    # in order below. Only n_workers files are submitted at a
+                    # time (another is submitted as each one is combined) so
+                    # at most n_workers decoded objects wait to be combined.
+                    if executor == "thread":
+                        pool = concurrent.futures.ThreadPoolExecutor(n_workers)
                     else:
-                        self.__iadd__(
-                            uv2,
-                            phase_center_radec=phase_center_radec,
-                            unphase_to_drift=unphase_to_drift,
-                            phase_frame=phase_frame,
-                            orig_phase_frame=orig_phase_frame,
-                            use_ant_pos=phase_use_ant_pos,
-                            run_check=run_check,
-                            check_extra=check_extra,
-                            run_check_acceptability=run_check_acceptability,
-                        )
+                        pool = concurrent.futures.ProcessPoolExecutor(n_workers)
+                    files_to_submit = iter(other_files)
+                    futures = collections.deque(
+                        pool.submit(_read_file, f, read_kwargs)
+                        for f in itertools.islice(files_to_submit, n_workers)
+                    )
+                else:
+                    pool = None
 
-                del uv2
+                uv_list = []
+                try:
+                    for f in other_files:
+                        try:
+                            if pool is None:
+                                uv2 = _read_file(f, read_kwargs)
+                            else:
+                                future = futures.popleft()
+                                try:
+                                    uv2 = future.result()
+                                finally:
+                                    for next_file in itertools.islice(
+                                        files_to_submit, 1
+                                    ):
+                                        futures.append(
+                                            pool.submit(
+                                                _read_file, next_file, read_kwargs
+                                            )
+                                        )
+                        except KeyError:
+                            warnings.warn("Failed to read {f}".format(f=f))
+                            if skip_bad_files:
+                                continue
+                            else:
+                                raise
+                        if axis is not None:
+                            # concatenate all the objects in one go below
+                            uv_list.append(uv2)
+                        else:
+                            self.__iadd__(
+                                uv2,
+                                phase_center_radec=phase_center_radec,
+                                unphase_to_drift=unphase_to_drift,
+                                phase_frame=phase_frame,
+                                orig_phase_frame=orig_phase_frame,
+                                use_ant_pos=phase_use_ant_pos,
+                                run_check=run_check,
+                                check_extra=check_extra,
+                                run_check_acceptability=run_check_acceptability,
+                            )
+                        del uv2
+                finally:
+                    if pool is not None:
+                        # on an error, drop the files that have not been
+                        # started rather than waiting for them to be read
+                        for future in futures:
+                            future.cancel()
+                        pool.shutdown(wait=False)
+
+                if len(uv_list) > 0:
+                    self.fast_concat(
+                        uv_list,
+                        axis,
+                        phase_center_radec=phase_center_radec,
+                        unphase_to_drift=unphase_to_drift,
+                        phase_frame=phase_frame,
+                        orig_phase_frame=orig_phase_frame,
+                        use_ant_pos=phase_use_ant_pos,
+                        run_check=run_check,
+                        check_extra=check_extra,
+                        run_check_acceptability=run_check_acceptability,
+                        inplace=True,
+                    )
+                del uv_list
         else:
-            if file_type in ["fhd", "ms", "mwa_corr_fits"]:
+            if file_type in ["fhd"]:
                 if (
                     antenna_nums is not None
                     or antenna_names is not None
@@ -6774,7 +7101,7 @@ class UVData(UVBase):
                     select_blt_inds = blt_inds
                 else:
                     select = False
-            elif file_type in ["uvfits", "uvh5"]:
+            elif file_type in ["uvfits", "uvh5", "ms"]:
                 select = False
             elif file_type in ["miriad"]:
                 if (
@@ -6823,6 +7150,54 @@ class UVData(UVBase):
                     select_blt_inds = blt_inds
                 else:
                     select = False
+            elif file_type in ["mwa_corr_fits"]:
+                if (
+                    antenna_names is not None
+                    or ant_str is not None
+                    or bls is not None
+                    or frequencies is not None
+                    or polarizations is not None
+                    or blt_inds is not None
+                ):
+
+                    if blt_inds is not None:
+                        if (
+                            antenna_nums is not None
+                            or freq_chans is not None
+                            or times is not None
+                            or time_range is not None
+                        ):
+                            warnings.warn(
+                                "Warning: blt_inds is set along with select "
+                                "on read keywords that are supported by "
+                                "read_mwa_corr_fits and may downselect blts. "
+                                "This may result in incorrect results "
+                                "because the select on read will happen "
+                                "before the blt_inds selection so the indices "
+                                "may not match the expected locations."
+                            )
+                    else:
+                        warnings.warn(
+                            "Warning: a select on read keyword is set that is "
+                            "not supported by read_mwa_corr_fits. This select "
+                            "will be done after reading the file."
+                        )
+                    select = True
+                    # these are all done by partial read, so set to None
+                    select_antenna_nums = None
+                    select_freq_chans = None
+                    select_times = None
+                    select_time_range = None
+
+                    # these aren't supported by partial read, so do it in select
+                    select_antenna_names = antenna_names
+                    select_ant_str = ant_str
+                    select_bls = bls
+                    select_frequencies = frequencies
+                    select_polarizations = polarizations
+                    select_blt_inds = blt_inds
+                else:
+                    select = False
 
             # reading a single "file". Call the appropriate file-type read
             if file_type == "uvfits":
@@ -6875,6 +7250,12 @@ class UVData(UVBase):
                     phase_to_pointing_center=phase_to_pointing_center,
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
+                    n_workers=n_workers,
+                    antenna_nums=antenna_nums,
+                    freq_chans=freq_chans,
+                    times=times,
+                    time_range=time_range,
+                    keep_all_metadata=keep_all_metadata,
                 )
 
             elif file_type == "fhd":
@@ -6889,6 +7270,17 @@ class UVData(UVBase):
             elif file_type == "ms":
                 self.read_ms(
                     filename,
+                    antenna_nums=antenna_nums,
+                    antenna_names=antenna_names,
+                    ant_str=ant_str,
+                    bls=bls,
+                    frequencies=frequencies,
+                    freq_chans=freq_chans,
+                    times=times,
+                    time_range=time_range,
+                    polarizations=polarizations,
+                    blt_inds=blt_inds,
+                    keep_all_metadata=keep_all_metadata,
                     run_check=run_check,
                     check_extra=check_extra,
                     run_check_acceptability=run_check_acceptability,
@@ -6916,6 +7308,7 @@ class UVData(UVBase):
                     data_array_dtype=data_array_dtype,
                     keep_all_metadata=keep_all_metadata,
                     multidim_index=multidim_index,
+                    lazy=lazy,
                 )
                 select = False
 
@@ -7038,6 +7431,7 @@ class UVData(UVBase):
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
+        blt_chunk_size=None,
     ):
         """
         Write the data to a uvfits file.
@@ -7065,6 +7459,10 @@ class UVData(UVBase):
             Option to check acceptable range of the values of parameters before
             writing the file (the default is True, meaning the acceptable
             range check will be done).
+        blt_chunk_size : int
+            Number of baseline-times to convert and write to the file at once,
+            this bounds the size of the temporary arrays. Defaults to the number
+            of baseline-times in about 64 MiB of the file's data.
 
         Raises
         ------
@@ -7078,6 +7476,7 @@ class UVData(UVBase):
             Any of ['antenna_positions', 'gst0', 'rdate', 'earth_omega', 'dut1',
             'timesys'] are not set on the object and `spoof_nonessential` is False.
             If the `timesys` parameter is not set to "UTC".
+            If `blt_chunk_size` is less than 1.
         TypeError
             If any entry in extra_keywords is not a single string or number.
 
@@ -7091,6 +7490,7 @@ class UVData(UVBase):
             run_check=run_check,
             check_extra=check_extra,
             run_check_acceptability=run_check_acceptability,
+            blt_chunk_size=blt_chunk_size,
         )
         del uvfits_obj
 
@@ -7106,6 +7506,8 @@ class UVData(UVBase):
         flags_compression="lzf",
         nsample_compression="lzf",
         data_write_dtype=None,
+        blt_chunk_size=None,
+        background_write=False,
     ):
         """
         Write a completely in-memory UVData object to a UVH5 file.
@@ -7133,6 +7535,15 @@ class UVData(UVBase):
             as data_array will be used. Otherwise, a numpy dtype object must be
             specified with an 'r' field and an 'i' field for real and imaginary
             parts, respectively. See uvh5.py for an example of defining such a datatype.
+        blt_chunk_size : int
+            Number of baseline-times to write at a time. The data-like arrays
+            are converted to the output datatypes one chunk at a time, which
+            limits the extra memory needed for the conversion to the size of a
+            chunk. Default is None, meaning all the baseline-times are written
+            at once.
+        background_write : bool
+            Option to write each chunk to disk on a background thread while the
+            next chunk is being converted. Only useful if blt_chunk_size is set.
         run_check : bool
             Option to check for the existence and proper shapes of parameters
             after before writing the file (the default is True,
@@ -7157,6 +7568,8 @@ class UVData(UVBase):
             flags_compression=flags_compression,
             nsample_compression=nsample_compression,
             data_write_dtype=data_write_dtype,
+            blt_chunk_size=blt_chunk_size,
+            background_write=background_write,
         )
         del uvh5_obj
 
@@ -7328,3 +7741,28 @@ class UVData(UVBase):
             add_to_history=add_to_history,
         )
         del uvh5_obj
+
+
+def _read_file(filename, read_kwargs):
+    """
+    Read a single file into a new UVData object.
+
+    This is a module level function so that it can be used with both thread and
+    process pools when reading multiple files in `UVData.read`.
+
+    Parameters
+    ----------
+    filename : str
+        The file to read.
+    read_kwargs : dict
+        Keyword arguments to pass to `UVData.read`.
+
+    Returns
+    -------
+    UVData object
+        The object read from the file.
+
+    """
+    uv = UVData()
+    uv.read(filename, **read_kwargs)
+    return uv
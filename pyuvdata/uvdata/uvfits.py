@@ -182,6 +182,7 @@ class UVFITS(UVData):
         check_extra,
         run_check_acceptability,
         keep_all_metadata,
+        blt_chunk_size=None,
     ):
         """
         Read just the visibility and flag data of the uvfits file.
@@ -202,34 +203,14 @@ class UVFITS(UVData):
             blt_inds,
         )
 
-        if blt_inds is not None:
-            blt_frac = len(blt_inds) / float(self.Nblts)
-        else:
-            blt_frac = 1
-
-        if freq_inds is not None:
-            freq_frac = len(freq_inds) / float(self.Nfreqs)
-        else:
-            freq_frac = 1
-
-        if pol_inds is not None:
-            pol_frac = len(pol_inds) / float(self.Npols)
-        else:
-            pol_frac = 1
-
-        min_frac = np.min([blt_frac, freq_frac, pol_frac])
-
-        if min_frac == 1:
+        if all(
+            inds is None or len(inds) == axis_len
+            for inds, axis_len in zip(
+                [blt_inds, freq_inds, pol_inds], [self.Nblts, self.Nfreqs, self.Npols]
+            )
+        ):
             # no select, read in all the data
-            if vis_hdu.header["NAXIS"] == 7:
-                raw_data_array = vis_hdu.data.data[:, 0, 0, :, :, :, :]
-                assert self.Nspws == raw_data_array.shape[1]
-
-            else:
-                # in many uvfits files the spw axis is left out,
-                # here we put it back in so the dimensionality stays the same
-                raw_data_array = vis_hdu.data.data[:, 0, 0, :, :, :]
-                raw_data_array = raw_data_array[:, np.newaxis, :, :]
+            blt_inds, freq_inds, pol_inds = None, None, None
         else:
             # do select operations on everything except data_array, flag_array
             # and nsample_array
@@ -237,63 +218,52 @@ class UVFITS(UVData):
                 blt_inds, freq_inds, pol_inds, history_update_string, keep_all_metadata
             )
 
-            # just read in the right portions of the data and flag arrays
-            if blt_frac == min_frac:
-                if vis_hdu.header["NAXIS"] == 7:
-                    raw_data_array = vis_hdu.data.data[blt_inds, :, :, :, :, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :, :]
-                    assert self.Nspws == raw_data_array.shape[1]
-                else:
-                    # in many uvfits files the spw axis is left out,
-                    # here we put it back in so the dimensionality stays the same
-                    raw_data_array = vis_hdu.data.data[blt_inds, :, :, :, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :]
-                    raw_data_array = raw_data_array[:, np.newaxis, :, :, :]
-                if freq_frac < 1:
-                    raw_data_array = raw_data_array[:, :, freq_inds, :, :]
-                if pol_frac < 1:
-                    raw_data_array = raw_data_array[:, :, :, pol_inds, :]
-            elif freq_frac == min_frac:
-                if vis_hdu.header["NAXIS"] == 7:
-                    raw_data_array = vis_hdu.data.data[:, :, :, :, freq_inds, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :, :]
-                    assert self.Nspws == raw_data_array.shape[1]
-                else:
-                    # in many uvfits files the spw axis is left out,
-                    # here we put it back in so the dimensionality stays the same
-                    raw_data_array = vis_hdu.data.data[:, :, :, freq_inds, :, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :]
-                    raw_data_array = raw_data_array[:, np.newaxis, :, :, :]
-
-                if blt_frac < 1:
-                    raw_data_array = raw_data_array[blt_inds, :, :, :, :]
-                if pol_frac < 1:
-                    raw_data_array = raw_data_array[:, :, :, pol_inds, :]
-            else:
-                if vis_hdu.header["NAXIS"] == 7:
-                    raw_data_array = vis_hdu.data.data[:, :, :, :, :, pol_inds, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :, :]
-                    assert self.Nspws == raw_data_array.shape[1]
-                else:
-                    # in many uvfits files the spw axis is left out,
-                    # here we put it back in so the dimensionality stays the same
-                    raw_data_array = vis_hdu.data.data[:, :, :, :, pol_inds, :]
-                    raw_data_array = raw_data_array[:, 0, 0, :, :, :]
-                    raw_data_array = raw_data_array[:, np.newaxis, :, :, :]
-
-                if blt_frac < 1:
-                    raw_data_array = raw_data_array[blt_inds, :, :, :, :]
-                if freq_frac < 1:
-                    raw_data_array = raw_data_array[:, :, freq_inds, :, :]
-
-        assert len(raw_data_array.shape) == 5
-        # FITS uvw direction convention is opposite ours and Miriad's.
-        # So conjugate the visibilities and flip the uvws:
-        self.data_array = (
-            raw_data_array[:, :, :, :, 0] - 1j * raw_data_array[:, :, :, :, 1]
+        # This is a memory map if the data are not scaled, so only the parts
+        # of the file that are indexed below are read.
+        raw_data = vis_hdu.data.data
+        if vis_hdu.header["NAXIS"] == 7:
+            assert self.Nspws == raw_data.shape[3]
+        # use slices rather than index arrays where possible
+        freq_index = uvutils._inds_to_index(freq_inds)
+        pol_index = uvutils._inds_to_index(pol_inds)
+
+        if blt_chunk_size is None:
+            # bound the raw data read at once to about 64 MiB
+            row_nbytes = raw_data.dtype.itemsize * np.prod(raw_data.shape[1:])
+            blt_chunk_size = max(1, int(2 ** 26 // row_nbytes))
+        elif blt_chunk_size < 1:
+            raise ValueError("blt_chunk_size must be a positive integer.")
+
+        self.data_array = np.empty(
+            (self.Nblts, self.Nspws, self.Nfreqs, self.Npols),
+            dtype=np.result_type(raw_data.dtype, np.complex64),
         )
-        self.flag_array = raw_data_array[:, :, :, :, 2] <= 0
-        self.nsample_array = np.abs(raw_data_array[:, :, :, :, 2])
+        self.flag_array = np.empty(self.data_array.shape, dtype=np.bool_)
+        self.nsample_array = np.empty(
+            self.data_array.shape, dtype=raw_data.dtype.newbyteorder("=")
+        )
+
+        # read the data in blocks of baseline-times, writing them directly into
+        # the final arrays.
+        for start in range(0, self.Nblts, blt_chunk_size):
+            out_inds = slice(start, min(start + blt_chunk_size, self.Nblts))
+            if blt_inds is None:
+                block_inds = out_inds
+            else:
+                block_inds = uvutils._inds_to_index(blt_inds[out_inds])
+            raw_block = raw_data[block_inds, 0, 0]
+            if vis_hdu.header["NAXIS"] == 6:
+                # in many uvfits files the spw axis is left out,
+                # here we put it back in so the dimensionality stays the same
+                raw_block = raw_block[:, np.newaxis]
+            raw_block = raw_block[:, :, freq_index][:, :, :, pol_index]
+
+            # FITS uvw direction convention is opposite ours and Miriad's.
+            # So conjugate the visibilities and flip the uvws:
+            self.data_array.real[out_inds] = raw_block[..., 0]
+            np.negative(raw_block[..., 1], out=self.data_array.imag[out_inds])
+            np.less_equal(raw_block[..., 2], 0, out=self.flag_array[out_inds])
+            np.abs(raw_block[..., 2], out=self.nsample_array[out_inds])
 
         # check if object has all required UVParameters set
         if run_check:
@@ -319,6 +289,7 @@ class UVFITS(UVData):
         check_extra=True,
         run_check_acceptability=True,
         keep_all_metadata=True,
+        blt_chunk_size=None,
     ):
         """
         Read in header, metadata and data from a uvfits file.
@@ -399,6 +370,11 @@ class UVFITS(UVData):
             Option to check acceptable range of the values of parameters after
             reading in the file (the default is True, meaning the acceptable
             range check will be done). Ignored if read_data is False.
+        blt_chunk_size : int
+            Number of baseline-times to read from the file at once, the data
+            are written into the final arrays one chunk at a time to bound the
+            size of the temporary arrays. Defaults to the number of
+            baseline-times in about 64 MiB of the raw data.
 
         Raises
         ------
@@ -411,6 +387,7 @@ class UVFITS(UVData):
             If the data are multi source or have multiple
             spectral windows.
             If the metadata are not internally consistent or missing.
+            If `blt_chunk_size` is less than 1.
 
         """
         with fits.open(filename, memmap=True) as hdu_list:
@@ -613,6 +590,7 @@ class UVFITS(UVData):
                 check_extra,
                 run_check_acceptability,
                 keep_all_metadata,
+                blt_chunk_size=blt_chunk_size,
             )
 
     def write_uvfits(
@@ -624,6 +602,7 @@ class UVFITS(UVData):
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
+        blt_chunk_size=None,
     ):
         """
         Write the data to a uvfits file.
@@ -648,6 +627,10 @@ class UVFITS(UVData):
         run_check_acceptability : bool
             Option to check acceptable range of the values of parameters before
             writing the file.
+        blt_chunk_size : int
+            Number of baseline-times to convert and write to the file at once,
+            this bounds the size of the temporary arrays. Defaults to the number
+            of baseline-times in about 64 MiB of the file's data.
 
         Raises
         ------
@@ -661,6 +644,7 @@ class UVFITS(UVData):
             Any of ['antenna_positions', 'gst0', 'rdate', 'earth_omega', 'dut1',
             'timesys'] are not set on the object and `spoof_nonessential` is False.
             If the `timesys` parameter is not set to "UTC".
+            If `blt_chunk_size` is less than 1.
         TypeError
             If any entry in extra_keywords is not a single string or number.
 
@@ -730,27 +714,28 @@ class UVFITS(UVData):
                             "spoof this attribute.".format(attribute=p)
                         )
 
+        if blt_chunk_size is None:
+            # bound the data converted at once to about 64 MiB
+            row_nbytes = 4 * 3 * self.Nspws * self.Nfreqs * self.Npols
+            blt_chunk_size = max(1, 2 ** 26 // row_nbytes)
+        elif blt_chunk_size < 1:
+            raise ValueError("blt_chunk_size must be a positive integer.")
+        blt_chunks = [
+            slice(start, min(start + blt_chunk_size, self.Nblts))
+            for start in range(0, self.Nblts, blt_chunk_size)
+        ]
+
         # check for unflagged data with nsample = 0. Warn if any found
-        wh_nsample0 = np.where(self.nsample_array == 0)
-        if np.any(~self.flag_array[wh_nsample0]):
+        if any(
+            np.any((self.nsample_array[chunk] == 0) & ~self.flag_array[chunk])
+            for chunk in blt_chunks
+        ):
             warnings.warn(
                 "Some unflagged data has nsample = 0. Flags and "
                 "nsamples are combined in uvfits files such that "
                 "these data will appear to be flagged."
             )
 
-        weights_array = self.nsample_array * np.where(self.flag_array, -1, 1)
-        # FITS uvw direction convention is opposite ours and Miriad's.
-        # So conjugate the visibilities and flip the uvws:
-        data_array = np.conj(
-            self.data_array[:, np.newaxis, np.newaxis, :, :, :, np.newaxis]
-        )
-        weights_array = weights_array[:, np.newaxis, np.newaxis, :, :, :, np.newaxis]
-        # uvfits_array_data shape will be  (Nblts,1,1,[Nspws],Nfreqs,Npols,3)
-        uvfits_array_data = np.concatenate(
-            [data_array.real, data_array.imag, weights_array], axis=6
-        )
-
         # FITS uvw direction convention is opposite ours and Miriad's.
         # So conjugate the visibilities and flip the uvws:
         uvw_array_sec = -1 * self.uvw_array / const.c.to("m/s").value
@@ -839,10 +824,13 @@ class UVFITS(UVData):
             parnames_use.append("LST     ")
             group_parameter_list.append(lst_array_2)
 
+        # Make the header from a single group, the data are streamed to the
+        # file in chunks of baseline-times below.
+        # The data shape in the file is (Nblts,1,1,Nspws,Nfreqs,Npols,3)
         hdu = fits.GroupData(
-            uvfits_array_data,
+            np.zeros((1, 1, 1, self.Nspws, self.Nfreqs, self.Npols, 3), np.float32),
             parnames=parnames_use,
-            pardata=group_parameter_list,
+            pardata=[par[:1] for par in group_parameter_list],
             bitpix=-32,
         )
         hdu = fits.GroupsHDU(hdu)
@@ -1024,5 +1012,36 @@ class UVFITS(UVData):
         # skipping for now and limiting to a single spw
 
         # write the file
-        hdulist = fits.HDUList(hdus=[hdu, ant_hdu])
-        hdulist.writeto(filename, overwrite=True)
+        hdu.verify("exception")
+        hdu.header["GCOUNT"] = self.Nblts
+        with open(filename, "wb") as fileobj:
+            fileobj.write(hdu.header.tostring().encode("ascii"))
+            data_nbytes = 0
+            for chunk in blt_chunks:
+                # each group is the group parameters followed by the data
+                nblts = chunk.stop - chunk.start
+                group_array = np.empty(
+                    (nblts, len(parnames_use) + self.data_array[0].size * 3),
+                    dtype=">f4",
+                )
+                for par_ind, par in enumerate(group_parameter_list):
+                    group_array[:, par_ind] = par[chunk]
+                vis_array = group_array[:, len(parnames_use) :].reshape(
+                    self.data_array[chunk].shape + (3,)
+                )
+                # FITS uvw direction convention is opposite ours and Miriad's.
+                # So conjugate the visibilities and flip the uvws:
+                vis_array[..., 0] = self.data_array[chunk].real
+                vis_array[..., 1] = -self.data_array[chunk].imag
+                vis_array[..., 2] = np.where(
+                    self.flag_array[chunk],
+                    -self.nsample_array[chunk],
+                    self.nsample_array[chunk],
+                )
+                group_array.tofile(fileobj)
+                data_nbytes += group_array.nbytes
+            # pad the data to a whole number of 2880 byte FITS blocks
+            fileobj.write(b"\0" * (-data_nbytes % 2880))
+
+        with fits.open(filename, mode="append") as hdu_list:
+            hdu_list.append(ant_hdu)
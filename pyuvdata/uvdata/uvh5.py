@@ -6,6 +6,7 @@
 import numpy as np
 import os
 import warnings
+import concurrent.futures
 import h5py
 
 from .uvdata import UVData
@@ -359,6 +360,49 @@ def _index_dset(dset, indices):
     return arr
 
 
+class _LazyDataset(object):
+    """
+    An array-like reference to a UVH5 dataset, for building lazy dask arrays.
+
+    This only stores the file name and dataset path, and reopens the file each
+    time it is indexed, so it does not hold an open file handle and can be
+    pickled (e.g. for use with dask distributed schedulers).
+
+    Parameters
+    ----------
+    filename : str
+        The UVH5 file containing the dataset.
+    name : str
+        The path to the dataset within the file, e.g. "/Data/visdata".
+    dtype_out : numpy dtype, optional
+        If set, the dataset is assumed to have a custom (integer) compound
+        datatype, and is cast to this complex datatype on read.
+    """
+
+    def __init__(self, filename, name, dtype_out=None):
+        self.filename = filename
+        self.name = name
+        self.dtype_out = dtype_out
+        with h5py.File(filename, "r") as f:
+            dset = f[name]
+            self.shape = dset.shape
+            # dask uses this to align its chunks with the on-disk chunks
+            self.chunks = dset.chunks
+            if dtype_out is None:
+                self.dtype = dset.dtype
+            else:
+                self.dtype = np.dtype(dtype_out)
+        self.ndim = len(self.shape)
+
+    def __getitem__(self, indices):
+        """Read the requested section of the dataset from disk."""
+        with h5py.File(self.filename, "r") as f:
+            dset = f[self.name]
+            if self.dtype_out is not None:
+                return _read_complex_astype(dset, indices, self.dtype_out)
+            return dset[indices]
+
+
 class UVH5(UVData):
     """
     A class for UVH5 file objects.
@@ -567,6 +611,7 @@ class UVH5(UVData):
         data_array_dtype,
         keep_all_metadata,
         multidim_index,
+        lazy=False,
     ):
         """
         Read the data-size arrays (data, flags, nsamples) from a file.
@@ -639,7 +684,51 @@ class UVH5(UVData):
         else:
             custom_dtype = False
 
-        if min_frac == 1:
+        if lazy:
+            try:
+                import dask.array as da
+            except ImportError as e:  # pragma: no cover
+                raise ImportError(
+                    "dask is not installed but is required for lazy loading "
+                    "of uvh5 files. Install dask using conda or pip."
+                ) from e
+
+            # build dask arrays backed by the on-disk datasets. Nothing is read
+            # until a section of an array is actually computed.
+            filename = dgrp.file.filename
+            if custom_dtype:
+                visdata = _LazyDataset(
+                    filename, dgrp["visdata"].name, dtype_out=data_array_dtype
+                )
+            else:
+                visdata = _LazyDataset(filename, dgrp["visdata"].name)
+            flags = _LazyDataset(filename, dgrp["flags"].name)
+            nsamples = _LazyDataset(filename, dgrp["nsamples"].name)
+            lazy_arrays = [
+                da.from_array(dset, chunks="auto", asarray=True)
+                for dset in [visdata, flags, nsamples]
+            ]
+
+            if min_frac < 1:
+                self._select_metadata(
+                    blt_inds,
+                    freq_inds,
+                    pol_inds,
+                    history_update_string,
+                    keep_all_metadata,
+                )
+                # dask only supports fancy indexing along one axis at a time
+                for ind, arr in enumerate(lazy_arrays):
+                    if blt_inds is not None:
+                        arr = arr[blt_inds, :, :, :]
+                    if freq_inds is not None:
+                        arr = arr[:, :, freq_inds, :]
+                    if pol_inds is not None:
+                        arr = arr[:, :, :, pol_inds]
+                    lazy_arrays[ind] = arr
+
+            self.data_array, self.flag_array, self.nsample_array = lazy_arrays
+        elif min_frac == 1:
             # no select, read in all the data
             inds = (np.s_[:], np.s_[:], np.s_[:], np.s_[:])
             if custom_dtype:
@@ -842,6 +931,7 @@ class UVH5(UVData):
         data_array_dtype=np.complex128,
         keep_all_metadata=True,
         multidim_index=False,
+        lazy=False,
     ):
         """
         Read in data from a UVH5 file.
@@ -931,6 +1021,12 @@ class UVH5(UVData):
             simultaneously along all data axes. Otherwise index one axis at-a-time.
             This only works if data selection is sliceable along all but one axis.
             If indices are not well-matched to data chunks, this can be slow.
+        lazy : bool
+            If True, do not read the data, flags and nsamples into memory.
+            Instead, set the data_array, flag_array and nsample_array to dask
+            arrays that reference the datasets on disk, chunked to match the
+            on-disk chunks. Sections of these arrays are only read when they
+            are computed (e.g. by `get_data`). Requires dask.
 
         Returns
         -------
@@ -983,6 +1079,7 @@ class UVH5(UVData):
                 data_array_dtype,
                 keep_all_metadata,
                 multidim_index,
+                lazy=lazy,
             )
 
         return
@@ -1097,6 +1194,8 @@ class UVH5(UVData):
         nsample_compression="lzf",
         data_write_dtype=None,
         add_to_history=None,
+        blt_chunk_size=None,
+        background_write=False,
     ):
         """
         Write an in-memory UVData object to a UVH5 file.
@@ -1134,6 +1233,15 @@ class UVH5(UVData):
             numpy dtype object must be specified with an 'r' field and an 'i'
             field for real and imaginary parts, respectively. See uvh5.py for
             an example of defining such a datatype.
+        blt_chunk_size : int
+            Number of baseline-times to write at a time. The data-like arrays
+            are converted to the output datatypes one chunk at a time, which
+            limits the extra memory needed for the conversion to the size of a
+            chunk. Default is None, meaning all the baseline-times are written
+            at once.
+        background_write : bool
+            Option to write each chunk to disk on a background thread while the
+            next chunk is being converted. Only useful if blt_chunk_size is set.
 
         Returns
         -------
@@ -1166,6 +1274,9 @@ class UVH5(UVData):
                 check_extra=check_extra, run_check_acceptability=run_check_acceptability
             )
 
+        if blt_chunk_size is not None and blt_chunk_size < 1:
+            raise ValueError("blt_chunk_size must be a positive integer.")
+
         if os.path.exists(filename):
             if clobber:
                 print("File exists; clobbering")
@@ -1187,38 +1298,108 @@ class UVH5(UVData):
                     data_write_dtype = "c16"
             if data_write_dtype not in ("c8", "c16"):
                 _check_uvh5_dtype(data_write_dtype)
-                visdata = dgrp.create_dataset(
-                    "visdata",
-                    self.data_array.shape,
-                    chunks=chunks,
-                    compression=data_compression,
-                    dtype=data_write_dtype,
-                )
-                indices = (np.s_[:], np.s_[:], np.s_[:], np.s_[:])
-                _write_complex_astype(self.data_array, visdata, indices)
-            else:
-                visdata = dgrp.create_dataset(
-                    "visdata",
-                    chunks=chunks,
-                    data=self.data_array,
-                    compression=data_compression,
-                    dtype=data_write_dtype,
-                )
-            dgrp.create_dataset(
+            visdata = dgrp.create_dataset(
+                "visdata",
+                self.data_array.shape,
+                chunks=chunks,
+                compression=data_compression,
+                dtype=data_write_dtype,
+            )
+            flags = dgrp.create_dataset(
                 "flags",
+                self.flag_array.shape,
                 chunks=chunks,
-                data=self.flag_array,
                 compression=flags_compression,
+                dtype="b1",
             )
-            dgrp.create_dataset(
+            nsamples = dgrp.create_dataset(
                 "nsamples",
+                self.nsample_array.shape,
                 chunks=chunks,
-                data=self.nsample_array.astype(np.float32),
                 compression=nsample_compression,
+                dtype="f4",
+            )
+            self._write_data_arrays(
+                visdata,
+                flags,
+                nsamples,
+                blt_chunk_size=blt_chunk_size,
+                background_write=background_write,
             )
 
         return
 
+    def _write_data_arrays(
+        self, visdata, flags, nsamples, blt_chunk_size=None, background_write=False
+    ):
+        """
+        Write the data-like arrays to the datasets in chunks along the blt axis.
+
+        Parameters
+        ----------
+        visdata : h5py dataset
+            The dataset to write the data_array to.
+        flags : h5py dataset
+            The dataset to write the flag_array to.
+        nsamples : h5py dataset
+            The dataset to write the nsample_array to.
+        blt_chunk_size : int
+            Number of baseline-times to write at a time. Default is None, meaning
+            all the baseline-times are written at once.
+        background_write : bool
+            Option to write each chunk on a background thread while the next
+            chunk is being converted to the output datatypes.
+
+        Returns
+        -------
+        None
+
+        """
+        if blt_chunk_size is None:
+            blt_chunk_size = self.Nblts
+        custom_dtype = visdata.dtype.names is not None
+
+        def get_chunk(blt_slice):
+            # convert a chunk of the arrays to the output datatypes
+            data = self.data_array[blt_slice]
+            if not custom_dtype:
+                data = data.astype(visdata.dtype, copy=False)
+            return (
+                data,
+                self.flag_array[blt_slice],
+                self.nsample_array[blt_slice].astype(np.float32, copy=False),
+            )
+
+        def write_chunk(blt_slice, data, flag, nsample):
+            if custom_dtype:
+                indices = (blt_slice, np.s_[:], np.s_[:], np.s_[:])
+                _write_complex_astype(data, visdata, indices)
+            else:
+                visdata[blt_slice] = data
+            flags[blt_slice] = flag
+            nsamples[blt_slice] = nsample
+
+        blt_slices = [
+            slice(blt_start, min(blt_start + blt_chunk_size, self.Nblts))
+            for blt_start in range(0, self.Nblts, blt_chunk_size)
+        ]
+        if background_write and len(blt_slices) > 1:
+            # h5py serializes access to the file, so only use one writer
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                future = None
+                for blt_slice in blt_slices:
+                    chunk = get_chunk(blt_slice)
+                    if future is not None:
+                        future.result()
+                    future = pool.submit(write_chunk, blt_slice, *chunk)
+                    del chunk
+                future.result()
+        else:
+            for blt_slice in blt_slices:
+                write_chunk(blt_slice, *get_chunk(blt_slice))
+
+        return
+
     def initialize_uvh5_file(
         self,
         filename,
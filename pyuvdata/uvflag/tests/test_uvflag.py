@@ -706,6 +706,109 @@ def test_write_no_clobber():
     assert str(cm.value).startswith("File " + test_f_file + " exists;")
 
 
+def _get_select_kwargs(uvf):
+    """Build selections along every axis, with irregularly spaced indices."""
+    unique_times = np.unique(uvf.time_array)
+    select_kwargs = {
+        "times": unique_times[[0, 2]],
+        "freq_chans": [1, 5, 6, 40],
+        "polarizations": uvf.polarization_array[:1],
+    }
+    if uvf.type == "baseline":
+        select_kwargs["bls"] = uvf.get_antpairs()[:3]
+    elif uvf.type == "antenna":
+        # out of order to check the antenna order is kept
+        select_kwargs["antenna_nums"] = uvf.ant_array[[5, 1, 3]]
+
+    return select_kwargs
+
+
+@cases_decorator
+@pytest.mark.parametrize("uvf_mode", ["to_flag", "to_metric"])
+def test_read_select(input_uvf, uvf_mode, test_outfile):
+    uvf = input_uvf
+    getattr(uvf, uvf_mode)()
+    uvf.write(test_outfile, clobber=True)
+    select_kwargs = _get_select_kwargs(uvf)
+
+    uvf2 = UVFlag()
+    uvf2.read(test_outfile, **select_kwargs)
+    uvf.select(**select_kwargs)
+    assert uvf == uvf2
+
+
+def test_read_select_list(test_outfile):
+    uv = UVData()
+    uv.read_miriad(test_d_file)
+    uv.time_array -= 1
+    uvf = UVFlag(uv)
+    uvf.write(test_outfile, clobber=True)
+    freq_chans = np.arange(0, 64, 2)
+
+    uvf.read([test_outfile, test_f_file], freq_chans=freq_chans)
+    uvf2 = UVFlag([test_outfile, test_f_file])
+    uvf2.select(freq_chans=freq_chans)
+    assert uvf.Nfreqs == freq_chans.size
+    assert np.array_equal(uvf.metric_array, uvf2.metric_array)
+    assert np.array_equal(uvf.weights_array, uvf2.weights_array)
+    assert np.array_equal(uvf.freq_array, uvf2.freq_array)
+
+
+@cases_decorator
+@pytest.mark.parametrize("uvf_mode", ["to_flag", "to_metric"])
+def test_write_part(input_uvf, uvf_mode, test_outfile):
+    uvf = input_uvf
+    getattr(uvf, uvf_mode)()
+    if uvf.mode == "metric":
+        uvf.metric_array = np.random.normal(size=uvf.metric_array.shape)
+    else:
+        uvf.flag_array = np.random.random(uvf.flag_array.shape) > 0.5
+
+    uvf.initialize_file(test_outfile, clobber=True)
+    for times in np.array_split(np.unique(uvf.time_array), 2):
+        uvf_part = uvf.select(times=times, inplace=False)
+        data_kwargs = {
+            param: getattr(uvf_part, param) for param in uvf_part._data_params
+        }
+        uvf.write_part(test_outfile, times=times, **data_kwargs)
+    uvf2 = UVFlag(test_outfile)
+    assert uvf == uvf2
+
+    # irregular selections along several axes
+    select_kwargs = _get_select_kwargs(uvf)
+    uvf.initialize_file(test_outfile, clobber=True)
+    uvf_part = uvf.select(**select_kwargs, inplace=False)
+    data_kwargs = {param: getattr(uvf_part, param) for param in uvf_part._data_params}
+    uvf.write_part(test_outfile, **select_kwargs, **data_kwargs)
+    uvf2 = UVFlag()
+    uvf2.read(test_outfile, **select_kwargs)
+    assert uvf_part == uvf2
+
+
+def test_write_part_errors(test_outfile):
+    uvf = UVFlag(test_f_file)
+    with pytest.raises(IOError, match="please first initialize it"):
+        uvf.write_part(test_outfile, metric_array=uvf.metric_array)
+
+    uvf.initialize_file(test_outfile)
+    with pytest.raises(ValueError, match="exists; skipping"):
+        uvf.initialize_file(test_outfile)
+
+    with pytest.raises(ValueError, match="At least one of metric_array"):
+        uvf.write_part(test_outfile)
+
+    with pytest.raises(ValueError, match="does not have a flag_array dataset"):
+        uvf.write_part(test_outfile, flag_array=np.zeros_like(uvf.metric_array))
+
+    with pytest.raises(ValueError, match="metric_array has shape"):
+        uvf.write_part(test_outfile, metric_array=uvf.metric_array, freq_chans=[0])
+
+    uvf2 = uvf.copy()
+    uvf2.time_array = uvf2.time_array + 1
+    with pytest.raises(ValueError, match="metadata in memory and metadata on disk"):
+        uvf2.write_part(test_outfile, metric_array=uvf.metric_array)
+
+
 def test_lst_from_uv():
     uv = UVData()
     uv.read_miriad(test_d_file)
@@ -1385,6 +1488,34 @@ def test_to_baseline_from_antenna(uvf_from_uvcal):
         assert np.all(uvf2.flag_array)
 
 
+def test_to_baseline_from_antenna_all_blts(uvf_from_uvcal):
+    uvf = uvf_from_uvcal
+    uvf.select(polarizations=uvf.polarization_array[0])
+    uvf.to_flag()
+    uv = UVData()
+    uv.read_miriad(test_d_file)
+
+    # use uv times for all but the last uvf time so some times are missing
+    uv_times = np.unique(uv.time_array)
+    uvf.time_array[:-1] = uv_times[: uvf.Ntimes - 1]
+    uvf.flag_array = np.random.RandomState(0).rand(*uvf.flag_array.shape) < 0.2
+    uvf2 = uvf.copy()
+    uvf2.to_baseline(uv, force_pol=True)
+
+    ant_list = list(uvf.ant_array)
+    for blt_ind in range(uv.Nblts):
+        ant1, ant2 = uv.ant_1_array[blt_ind], uv.ant_2_array[blt_ind]
+        time_ind = np.nonzero(uvf.time_array == uv.time_array[blt_ind])[0]
+        if ant1 not in ant_list or ant2 not in ant_list or time_ind.size == 0:
+            assert np.all(uvf2.flag_array[blt_ind])
+            continue
+        expected = (
+            uvf.flag_array[ant_list.index(ant1), :, :, time_ind[0]]
+            | uvf.flag_array[ant_list.index(ant2), :, :, time_ind[0]]
+        )
+        np.testing.assert_array_equal(uvf2.flag_array[blt_ind], expected)
+
+
 def test_to_baseline_errors():
     uvc = UVCal()
     uvc.read_calfits(test_c_file)
@@ -125,6 +125,109 @@ def flags2waterfall(uv, flag_array=None, keep_pol=False):
     return waterfall
 
 
+def _get_hyperslab(axis_inds, shape):
+    """Split indices along each axis of a dataset into a hyperslab and a remainder.
+
+    h5py only supports an increasing index list along one axis of a dataset.
+    Evenly spaced indices are converted to slices. Of the axes that still need
+    an index list, the most selective one is read with a sorted list and the
+    others with the slice bounding their indices, the rest of the indexing is
+    done in memory.
+
+    Parameters
+    ----------
+    axis_inds : tuple of array_like of int or None
+        Indices along each axis of the dataset, None means the whole axis.
+    shape : tuple of int
+        Shape of the dataset.
+
+    Returns
+    -------
+    dset_index : tuple
+        Index into the dataset.
+    mem_inds : tuple of array of int or None
+        Indices along each axis of the array read with `dset_index` to get the
+        requested elements, None if no indexing in memory is needed.
+
+    """
+    dset_index = [uvutils._inds_to_index(inds) for inds in axis_inds]
+    fancy_axes = [
+        axis for axis, index in enumerate(dset_index) if not isinstance(index, slice)
+    ]
+    if len(fancy_axes) == 0:
+        return tuple(dset_index), None
+
+    mem_inds = [None] * len(dset_index)
+    list_axis = min(
+        fancy_axes, key=lambda axis: np.unique(dset_index[axis]).size / shape[axis]
+    )
+    for axis in fancy_axes:
+        inds = dset_index[axis]
+        if axis == list_axis:
+            unique_inds, inverse = np.unique(inds, return_inverse=True)
+            dset_index[axis] = unique_inds
+            if unique_inds.size != inds.size or np.any(unique_inds != inds):
+                mem_inds[axis] = inverse
+        else:
+            dset_index[axis] = slice(inds.min(), inds.max() + 1)
+            mem_inds[axis] = inds - inds.min()
+
+    if all(inds is None for inds in mem_inds):
+        mem_inds = None
+    else:
+        mem_inds = tuple(mem_inds)
+
+    return tuple(dset_index), mem_inds
+
+
+def _read_dset_part(dset, axis_inds):
+    """Read part of a UVFlag HDF5 dataset.
+
+    Parameters
+    ----------
+    dset : h5py dataset
+        The dataset to read from.
+    axis_inds : tuple of array_like of int or None
+        Indices to read along each axis of the dataset, None means the whole
+        axis.
+
+    Returns
+    -------
+    ndarray
+        The requested part of the dataset.
+
+    """
+    dset_index, mem_inds = _get_hyperslab(axis_inds, dset.shape)
+    array = dset[dset_index]
+    if mem_inds is not None:
+        array = array[uvutils._get_multi_axis_index(mem_inds, array.shape)]
+
+    return array
+
+
+def _write_dset_part(dset, axis_inds, array):
+    """Write part of a UVFlag HDF5 dataset.
+
+    Parameters
+    ----------
+    dset : h5py dataset
+        The dataset to write to.
+    axis_inds : tuple of array_like of int or None
+        Indices to write to along each axis of the dataset, None means the
+        whole axis.
+    array : ndarray
+        The data to write, with the shape given by `axis_inds`.
+
+    """
+    dset_index, mem_inds = _get_hyperslab(axis_inds, dset.shape)
+    if mem_inds is not None:
+        # update the hyperslab in memory and write it back in one go
+        block = dset[dset_index]
+        block[uvutils._get_multi_axis_index(mem_inds, block.shape)] = array
+        array = block
+    dset[dset_index] = array
+
+
 class UVFlag(UVBase):
     """Object to handle flag arrays and waterfalls for interferometric datasets.
 
@@ -1108,13 +1211,14 @@ class UVFlag(UVBase):
                 arr = np.zeros_like(uv.flag_array, dtype=float)
                 warr = np.zeros_like(uv.flag_array, dtype=np.float)
                 sarr = self.metric_array
-            for i, t in enumerate(np.unique(self.time_array)):
-                ti = np.where(uv.time_array == t)
-                arr[ti, :, :, :] = sarr[i, :, :][np.newaxis, np.newaxis, :, :]
-                if self.mode == "metric":
-                    warr[ti, :, :, :] = self.weights_array[i, :, :][
-                        np.newaxis, np.newaxis, :, :
-                    ]
+            # baseline-times at times not in the waterfall are left at zero
+            time_inds, time_found = uvutils._find_indices(
+                np.unique(self.time_array), uv.time_array
+            )
+            time_inds = time_inds[time_found]
+            arr[time_found] = sarr[time_inds, np.newaxis]
+            if self.mode == "metric":
+                warr[time_found] = self.weights_array[time_inds, np.newaxis]
             if self.mode == "flag":
                 self.flag_array = arr
             elif self.mode == "metric":
@@ -1144,22 +1248,20 @@ class UVFlag(UVBase):
                     (uv.Nblts, self.Nspws, self.Nfreqs, self.Npols), True, dtype=bool
                 )
 
-                for t_index, bl in enumerate(uv.baseline_array):
-                    uvf_t_index = np.nonzero(uv.time_array[t_index] == self.time_array)[
-                        0
-                    ]
-                    if uvf_t_index.size > 0:
-                        # if the time is found in the array
-                        # input the or'ed data from each antenna
-                        ant1, ant2 = uv.baseline_to_antnums(bl)
-                        ant1_index = np.nonzero(np.array(self.ant_array) == ant1)
-                        ant2_index = np.nonzero(np.array(self.ant_array) == ant2)
-                        or_flag = np.logical_or(
-                            self.flag_array[ant1_index, :, :, uvf_t_index, :],
-                            self.flag_array[ant2_index, :, :, uvf_t_index, :],
-                        )
-
-                        baseline_flags[t_index, :, :, :] = or_flag.copy()
+                # baseline-times at times not in the antenna object stay flagged
+                time_inds, time_found = uvutils._find_indices(
+                    self.time_array, uv.time_array
+                )
+                time_inds = time_inds[time_found]
+                ant1_inds, _ = uvutils._find_indices(self.ant_array, uv.ant_1_array)
+                ant2_inds, _ = uvutils._find_indices(self.ant_array, uv.ant_2_array)
+                # put the time axis second so the gathered flags have the
+                # baseline shape
+                ant_flags = np.moveaxis(self.flag_array, 3, 1)
+                baseline_flags[time_found] = (
+                    ant_flags[ant1_inds[time_found], time_inds]
+                    | ant_flags[ant2_inds[time_found], time_inds]
+                )
 
                 self.flag_array = baseline_flags
 
@@ -2162,6 +2264,35 @@ class UVFlag(UVBase):
 
         self.history = self.history + history_update_string
 
+    def _get_data_axis_inds(self, blt_inds, ant_inds, freq_inds, pol_inds):
+        """Arrange the selected indices along the axes of the data-like arrays.
+
+        Parameters
+        ----------
+        blt_inds : list of int
+            list of baseline-time indices (time indices for "antenna" and
+            "waterfall" types). Can be None (to keep everything).
+        ant_inds : list of int
+            list of antenna indices, only used for "antenna" type. Can be None
+            (to keep everything).
+        freq_inds : list of int
+            list of frequency indices. Can be None (to keep everything).
+        pol_inds : list of int
+            list of polarization indices. Can be None (to keep everything).
+
+        Returns
+        -------
+        tuple of list of int or None
+            The indices along each axis of the data-like arrays.
+
+        """
+        if self.type == "baseline":
+            return (blt_inds, None, freq_inds, pol_inds)
+        elif self.type == "waterfall":
+            return (blt_inds, freq_inds, pol_inds)
+        else:
+            return (ant_inds, None, freq_inds, blt_inds, pol_inds)
+
     def select(
         self,
         antenna_nums=None,
@@ -2340,22 +2471,212 @@ class UVFlag(UVBase):
         if not inplace:
             return uv_object
 
+    def _read_header(self, header, history=""):
+        """Read the metadata from the header of a UVFlag HDF5 file.
+
+        Parameters
+        ----------
+        header : h5py datagroup
+            A reference to the "/Header" group of the file.
+        history : str
+            History string to append to UVFlag history attribute.
+
+        """
+        self.type = header["type"][()].decode("utf8")
+        if self.type == "antenna":
+            self._set_type_antenna()
+        elif self.type == "baseline":
+            self._set_type_baseline()
+        elif self.type == "waterfall":
+            self._set_type_waterfall()
+        else:
+            raise ValueError(
+                "File cannot be read. Received type "
+                "parameter: {receive} but "
+                "must be within acceptable values: "
+                "{expect}".format(
+                    receive=self.type, expect=(", ").join(self._type.acceptable_vals),
+                )
+            )
+
+        self.mode = header["mode"][()].decode("utf8")
+
+        if self.mode == "metric":
+            self._set_mode_metric()
+        elif self.mode == "flag":
+            self._set_mode_flag()
+        else:
+            raise ValueError(
+                "File cannot be read. Received mode "
+                "parameter: {receive} but "
+                "must be within acceptable values: "
+                "{expect}".format(
+                    receive=self.mode, expect=(", ").join(self._mode.acceptable_vals),
+                )
+            )
+
+        if "x_orientation" in header.keys():
+            self.x_orientation = header["x_orientation"][()].decode("utf8")
+
+        self.time_array = header["time_array"][()]
+        if "Ntimes" in header.keys():
+            self.Ntimes = int(header["Ntimes"][()])
+        else:
+            self.Ntimes = np.unique(self.time_array).size
+
+        # for antenna and waterfall, Nblts is used to define
+        # the size of some arrays but is equivalent to _Ntimes
+        # for baseline type nblts is should be stored
+        # if not it is read later
+        if "Nblts" in header.keys():
+            self.Nblts = int(header["Nblts"][()])
+        else:
+            self.Nblts = self.Ntimes
+
+        self.lst_array = header["lst_array"][()]
+
+        self.freq_array = header["freq_array"][()]
+        # older save files will not have this spws axis
+        # at least_2d will preserve shape of 2d arrays and
+        # promote 1D to (1, Nfreqs)
+        if self.type != "waterfall":
+            self.freq_array = np.atleast_2d(self.freq_array)
+
+        if "Nfreqs" in header.keys():
+            self.Nfreqs = int(header["Nfreqs"][()])
+        else:
+            self.Nfreqs = np.unique(self.freq_array).size
+
+        self.history = header["history"][()].decode("utf8")
+
+        self.history += history
+
+        if not uvutils._check_history_version(self.history, self.pyuvdata_version_str):
+            self.history += self.pyuvdata_version_str
+
+        if "label" in header.keys():
+            self.label = header["label"][()].decode("utf8")
+
+        polarization_array = header["polarization_array"][()]
+        if isinstance(polarization_array[0], np.string_):
+            polarization_array = np.asarray(polarization_array, dtype=np.str_)
+        self.polarization_array = polarization_array
+        self._check_pol_state()
+
+        if "Npols" in header.keys():
+            self.Npols = int(header["Npols"][()])
+        else:
+            self.Npols = len(self.polarization_array)
+
+        if self.type == "baseline":
+            self.baseline_array = header["baseline_array"][()]
+
+            #  if the Nblts was set via the antenna/waterfall method
+            # it needs to be overwritten  with the correct shape.
+            if self.Nblts == self.Ntimes:
+                self.Nblts = len(self.baseline_array)
+
+            if "Nbls" in header.keys():
+                self.Nbls = int(header["Nbls"][()])
+            else:
+                self.Nbls = np.unique(self.baseline_array).size
+
+            self.ant_1_array = header["ant_1_array"][()]
+            self.ant_2_array = header["ant_2_array"][()]
+
+            try:
+                self.Nants_telescope = int(header["Nants_telescope"][()])
+            except KeyError:
+                warnings.warn(
+                    "Nants_telescope not available in file, " "assuming < 2048."
+                )
+                self.Nants_telescope = 2047
+
+            if "Nants_data" in header.keys():
+                self.Nants_data = int(header["Nants_data"][()])
+            else:
+                self.Nants_data = int(
+                    len(self.ant_1_array.tolist() + self.ant_2_array.tolist())
+                )
+
+            if "Nspws" in header.keys():
+                self.Nspws = int(header["Nspws"][()])
+            else:
+                self.Nspws = np.shape(self.freq_array)[0]
+
+        elif self.type == "antenna":
+            self.ant_array = header["ant_array"][()]
+            try:
+                self.Nants_data = int(header["Nants_data"][()])
+            except KeyError:
+                warnings.warn(
+                    "Nants_data not available in file, "
+                    "attempting to calculate from ant_array."
+                )
+                self.Nants_data = len(self.ant_array)
+
+            if "Nspws" in header.keys():
+                self.Nspws = int(header["Nspws"][()])
+            else:
+                self.Nspws = np.shape(self.freq_array)[0]
+
     def read(
         self,
         filename,
         history="",
+        antenna_nums=None,
+        ant_inds=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        polarizations=None,
+        blt_inds=None,
         run_check=True,
         check_extra=True,
         run_check_acceptability=True,
     ):
         """Read in flag/metric data from a HDF5 file.
 
+        The selection keywords are applied while reading, only the selected
+        parts of the data-like datasets are read from disk.
+
         Parameters
         ----------
-        filename : str
-            The file name to read.
+        filename : str or list of str
+            The file name to read. If a list, the files are read and added
+            together.
         history : str
             History string to append to UVFlag history attribute.
+        antenna_nums : array_like of int, optional
+            The antennas numbers to include when reading data into the object.
+        ant_inds : array_like of int, optional
+            The antenna indices to include when reading data into the object.
+            This is not commonly used.
+        bls : list of tuple, optional
+            A list of antenna number tuples (e.g. [(0,1), (3,2)]) or a list of
+            baseline 3-tuples (e.g. [(0,1,'xx'), (2,3,'yy')]) specifying baselines
+            to include when reading data into the object. For length-2 tuples,
+            the ordering of the numbers within the tuple does not matter. For
+            length-3 tuples, the polarization string is in the order of the two
+            antennas. If length-3 tuples are provided, `polarizations` must be
+            None.
+        frequencies : array_like of float, optional
+            The frequencies to include when reading data into the object, each
+            value passed here should exist in the freq_array.
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to include when reading data into the
+            object.
+        times : array_like of float, optional
+            The times to include when reading data into the object, each value
+            passed here should exist in the time_array.
+        polarizations : array_like of int, optional
+            The polarizations numbers to include when reading data into the
+            object, each value passed here should exist in the
+            polarization_array.
+        blt_inds : array_like of int, optional
+            The baseline-time indices to include when reading data into the
+            object. This is not commonly used.
         run_check : bool
             Option to check for the existence and proper shapes of parameters
             after reading data.
@@ -2365,12 +2686,44 @@ class UVFlag(UVBase):
             Option to check acceptable range of the values of parameters after
             reading data.
 
+        Raises
+        ------
+        IOError
+            If the file does not exist.
+        ValueError
+            If the type or mode in the file is not recognized or if any of the
+            selection keywords are set to inappropriate values.
+
         """
+        select_kwargs = {
+            "antenna_nums": antenna_nums,
+            "ant_inds": ant_inds,
+            "bls": bls,
+            "frequencies": frequencies,
+            "freq_chans": freq_chans,
+            "times": times,
+            "polarizations": polarizations,
+            "blt_inds": blt_inds,
+        }
         if isinstance(filename, (tuple, list)):
-            self.read(filename[0])
+            self.read(
+                filename[0],
+                run_check=run_check,
+                check_extra=check_extra,
+                run_check_acceptability=run_check_acceptability,
+                **select_kwargs,
+            )
             if len(filename) > 1:
                 for f in filename[1:]:
-                    f2 = UVFlag(f, history=history)
+                    f2 = UVFlag()
+                    f2.read(
+                        f,
+                        history=history,
+                        run_check=run_check,
+                        check_extra=check_extra,
+                        run_check_acceptability=run_check_acceptability,
+                        **select_kwargs,
+                    )
                     self += f2
                 del f2
 
@@ -2380,166 +2733,107 @@ class UVFlag(UVBase):
 
             # Open file for reading
             with h5py.File(filename, "r") as f:
-                header = f["/Header"]
-
-                self.type = header["type"][()].decode("utf8")
-                if self.type == "antenna":
-                    self._set_type_antenna()
-                elif self.type == "baseline":
-                    self._set_type_baseline()
-                elif self.type == "waterfall":
-                    self._set_type_waterfall()
-                else:
-                    raise ValueError(
-                        "File cannot be read. Received type "
-                        "parameter: {receive} but "
-                        "must be within acceptable values: "
-                        "{expect}".format(
-                            receive=self.type,
-                            expect=(", ").join(self._type.acceptable_vals),
-                        )
+                self._read_header(f["/Header"], history=history)
+
+                if any(value is not None for value in select_kwargs.values()):
+                    (
+                        blt_inds,
+                        ant_inds,
+                        freq_inds,
+                        pol_inds,
+                        history_update_string,
+                    ) = self._select_preprocess(
+                        antenna_nums,
+                        bls,
+                        frequencies,
+                        freq_chans,
+                        times,
+                        polarizations,
+                        blt_inds,
+                        ant_inds,
                     )
-
-                self.mode = header["mode"][()].decode("utf8")
-
-                if self.mode == "metric":
-                    self._set_mode_metric()
-                elif self.mode == "flag":
-                    self._set_mode_flag()
-                else:
-                    raise ValueError(
-                        "File cannot be read. Received mode "
-                        "parameter: {receive} but "
-                        "must be within acceptable values: "
-                        "{expect}".format(
-                            receive=self.mode,
-                            expect=(", ").join(self._mode.acceptable_vals),
-                        )
+                    self._select_metadata(
+                        blt_inds, ant_inds, freq_inds, pol_inds, history_update_string
                     )
-
-                if "x_orientation" in header.keys():
-                    self.x_orientation = header["x_orientation"][()].decode("utf8")
-
-                self.time_array = header["time_array"][()]
-                if "Ntimes" in header.keys():
-                    self.Ntimes = int(header["Ntimes"][()])
-                else:
-                    self.Ntimes = np.unique(self.time_array).size
-
-                # for antenna and waterfall, Nblts is used to define
-                # the size of some arrays but is equivalent to _Ntimes
-                # for baseline type nblts is should be stored
-                # if not it is read later
-                if "Nblts" in header.keys():
-                    self.Nblts = int(header["Nblts"][()])
-                else:
-                    self.Nblts = self.Ntimes
-
-                self.lst_array = header["lst_array"][()]
-
-                self.freq_array = header["freq_array"][()]
-                # older save files will not have this spws axis
-                # at least_2d will preserve shape of 2d arrays and
-                # promote 1D to (1, Nfreqs)
-                if self.type != "waterfall":
-                    self.freq_array = np.atleast_2d(self.freq_array)
-
-                if "Nfreqs" in header.keys():
-                    self.Nfreqs = int(header["Nfreqs"][()])
                 else:
-                    self.Nfreqs = np.unique(self.freq_array).size
-
-                self.history = header["history"][()].decode("utf8")
+                    freq_inds, pol_inds = None, None
+                axis_inds = self._get_data_axis_inds(
+                    blt_inds, ant_inds, freq_inds, pol_inds
+                )
 
-                self.history += history
+                dgrp = f["/Data"]
+                if self.mode == "metric":
+                    self.metric_array = _read_dset_part(dgrp["metric_array"], axis_inds)
+                    self.weights_array = _read_dset_part(
+                        dgrp["weights_array"], axis_inds
+                    )
+                    if "weights_square_array" in dgrp:
+                        self.weights_square_array = _read_dset_part(
+                            dgrp["weights_square_array"], axis_inds
+                        )
+                elif self.mode == "flag":
+                    self.flag_array = _read_dset_part(dgrp["flag_array"], axis_inds)
 
-                if not uvutils._check_history_version(
-                    self.history, self.pyuvdata_version_str
-                ):
-                    self.history += self.pyuvdata_version_str
+            self.clear_unused_attributes()
 
-                if "label" in header.keys():
-                    self.label = header["label"][()].decode("utf8")
+            if run_check:
+                self.check(
+                    check_extra=check_extra,
+                    run_check_acceptability=run_check_acceptability,
+                )
 
-                polarization_array = header["polarization_array"][()]
-                if isinstance(polarization_array[0], np.string_):
-                    polarization_array = np.asarray(polarization_array, dtype=np.str_)
-                self.polarization_array = polarization_array
-                self._check_pol_state()
+    def _write_header(self, header):
+        """Write the metadata to the header of a UVFlag HDF5 file.
 
-                if "Npols" in header.keys():
-                    self.Npols = int(header["Npols"][()])
-                else:
-                    self.Npols = len(self.polarization_array)
+        Parameters
+        ----------
+        header : h5py datagroup
+            A reference to the "/Header" group of the file.
 
-                if self.type == "baseline":
-                    self.baseline_array = header["baseline_array"][()]
+        """
+        # write out metadata
+        header["type"] = np.string_(self.type)
+        header["mode"] = np.string_(self.mode)
 
-                    #  if the Nblts was set via the antenna/waterfall method
-                    # it needs to be overwritten  with the correct shape.
-                    if self.Nblts == self.Ntimes:
-                        self.Nblts = len(self.baseline_array)
+        header["Ntimes"] = self.Ntimes
+        header["time_array"] = self.time_array
+        header["lst_array"] = self.lst_array
 
-                    if "Nbls" in header.keys():
-                        self.Nbls = int(header["Nbls"][()])
-                    else:
-                        self.Nbls = np.unique(self.baseline_array).size
+        header["freq_array"] = self.freq_array
+        header["Nfreqs"] = self.Nfreqs
 
-                    self.ant_1_array = header["ant_1_array"][()]
-                    self.ant_2_array = header["ant_2_array"][()]
+        header["Npols"] = self.Npols
 
-                    try:
-                        self.Nants_telescope = int(header["Nants_telescope"][()])
-                    except KeyError:
-                        warnings.warn(
-                            "Nants_telescope not available in file, " "assuming < 2048."
-                        )
-                        self.Nants_telescope = 2047
+        if self.x_orientation is not None:
+            header["x_orientation"] = np.string_(self.x_orientation)
 
-                    if "Nants_data" in header.keys():
-                        self.Nants_data = int(header["Nants_data"][()])
-                    else:
-                        self.Nants_data = int(
-                            len(self.ant_1_array.tolist() + self.ant_2_array.tolist())
-                        )
-
-                    if "Nspws" in header.keys():
-                        self.Nspws = int(header["Nspws"][()])
-                    else:
-                        self.Nspws = np.shape(self.freq_array)[0]
+        if isinstance(self.polarization_array.item(0), str):
+            polarization_array = np.asarray(self.polarization_array, dtype=np.string_)
+        else:
+            polarization_array = self.polarization_array
+        header["polarization_array"] = polarization_array
 
-                elif self.type == "antenna":
-                    self.ant_array = header["ant_array"][()]
-                    try:
-                        self.Nants_data = int(header["Nants_data"][()])
-                    except KeyError:
-                        warnings.warn(
-                            "Nants_data not available in file, "
-                            "attempting to calculate from ant_array."
-                        )
-                        self.Nants_data = len(self.ant_array)
+        if not uvutils._check_history_version(self.history, self.pyuvdata_version_str):
+            self.history += self.pyuvdata_version_str
 
-                    if "Nspws" in header.keys():
-                        self.Nspws = int(header["Nspws"][()])
-                    else:
-                        self.Nspws = np.shape(self.freq_array)[0]
+        header["history"] = np.string_(self.history)
 
-                dgrp = f["/Data"]
-                if self.mode == "metric":
-                    self.metric_array = dgrp["metric_array"][()]
-                    self.weights_array = dgrp["weights_array"][()]
-                    if "weights_square_array" in dgrp:
-                        self.weights_square_array = dgrp["weights_square_array"][()]
-                elif self.mode == "flag":
-                    self.flag_array = dgrp["flag_array"][()]
+        header["label"] = np.string_(self.label)
 
-            self.clear_unused_attributes()
+        if self.type == "baseline":
+            header["baseline_array"] = self.baseline_array
+            header["Nbls"] = self.Nbls
+            header["Nblts"] = self.Nblts
+            header["ant_1_array"] = self.ant_1_array
+            header["ant_2_array"] = self.ant_2_array
+            header["Nants_data"] = self.Nants_data
+            header["Nants_telescope"] = self.Nants_telescope
+            header["Nspws"] = self.Nspws
 
-            if run_check:
-                self.check(
-                    check_extra=check_extra,
-                    run_check_acceptability=run_check_acceptability,
-                )
+        elif self.type == "antenna":
+            header["ant_array"] = self.ant_array
+            header["Nants_data"] = self.Nants_data
+            header["Nspws"] = self.Nspws
 
     def write(self, filename, clobber=False, data_compression="lzf"):
         """Write a UVFlag object to a hdf5 file.
@@ -2563,54 +2857,7 @@ class UVFlag(UVBase):
 
         with h5py.File(filename, "w") as f:
             header = f.create_group("Header")
-
-            # write out metadata
-            header["type"] = np.string_(self.type)
-            header["mode"] = np.string_(self.mode)
-
-            header["Ntimes"] = self.Ntimes
-            header["time_array"] = self.time_array
-            header["lst_array"] = self.lst_array
-
-            header["freq_array"] = self.freq_array
-            header["Nfreqs"] = self.Nfreqs
-
-            header["Npols"] = self.Npols
-
-            if self.x_orientation is not None:
-                header["x_orientation"] = np.string_(self.x_orientation)
-
-            if isinstance(self.polarization_array.item(0), str):
-                polarization_array = np.asarray(
-                    self.polarization_array, dtype=np.string_
-                )
-            else:
-                polarization_array = self.polarization_array
-            header["polarization_array"] = polarization_array
-
-            if not uvutils._check_history_version(
-                self.history, self.pyuvdata_version_str
-            ):
-                self.history += self.pyuvdata_version_str
-
-            header["history"] = np.string_(self.history)
-
-            header["label"] = np.string_(self.label)
-
-            if self.type == "baseline":
-                header["baseline_array"] = self.baseline_array
-                header["Nbls"] = self.Nbls
-                header["Nblts"] = self.Nblts
-                header["ant_1_array"] = self.ant_1_array
-                header["ant_2_array"] = self.ant_2_array
-                header["Nants_data"] = self.Nants_data
-                header["Nants_telescope"] = self.Nants_telescope
-                header["Nspws"] = self.Nspws
-
-            elif self.type == "antenna":
-                header["ant_array"] = self.ant_array
-                header["Nants_data"] = self.Nants_data
-                header["Nspws"] = self.Nspws
+            self._write_header(header)
 
             dgrp = f.create_group("Data")
             if self.mode == "metric":
@@ -2641,6 +2888,268 @@ class UVFlag(UVBase):
                     compression=data_compression,
                 )
 
+    def initialize_file(
+        self,
+        filename,
+        clobber=False,
+        chunks=True,
+        data_compression="lzf",
+        weights_square=None,
+    ):
+        """Initialize a UVFlag HDF5 file on disk to be written to in parts.
+
+        Only the metadata on the object is used, the data-like datasets are
+        created with the full shape and filled with zeros (or False for flags).
+        The data is then written with `write_part`, for example one file's
+        worth of metrics at a time, without holding the full data-like arrays
+        in memory.
+
+        Parameters
+        ----------
+        filename : str
+            The file to write to.
+        clobber : bool
+            Option to overwrite the file if it already exists.
+        chunks : tuple or bool
+            h5py.create_dataset chunks keyword. Tuple for chunk shape,
+            True for auto-chunking, None for no chunking. Default is True.
+        data_compression : str
+            HDF5 filter to apply when writing the data-like arrays.
+            If no compression is wanted, set to None.
+        weights_square : bool, optional
+            Option to create a weights_square_array dataset in "metric" mode.
+            Defaults to True if the object has a weights_square_array.
+
+        Raises
+        ------
+        ValueError
+            If the file already exists and clobber is False.
+
+        """
+        if os.path.exists(filename):
+            if clobber:
+                print("File " + filename + " exists; clobbering")
+            else:
+                raise ValueError("File " + filename + " exists; skipping")
+
+        if self.type == "baseline":
+            data_shape = (self.Nblts, self.Nspws, self.Nfreqs, self.Npols)
+        elif self.type == "waterfall":
+            data_shape = (self.Ntimes, self.Nfreqs, self.Npols)
+        else:
+            data_shape = (
+                self.Nants_data,
+                self.Nspws,
+                self.Nfreqs,
+                self.Ntimes,
+                self.Npols,
+            )
+
+        if self.mode == "flag":
+            dsets = {"flag_array": np.bool_}
+        else:
+            if weights_square is None:
+                weights_square = self.weights_square_array is not None
+            dsets = {"metric_array": np.float64, "weights_array": np.float64}
+            if weights_square:
+                dsets["weights_square_array"] = np.float64
+
+        with h5py.File(filename, "w") as f:
+            header = f.create_group("Header")
+            self._write_header(header)
+
+            dgrp = f.create_group("Data")
+            for name, dtype in dsets.items():
+                array = getattr(self, name)
+                if array is not None:
+                    dtype = array.dtype
+                dgrp.create_dataset(
+                    name,
+                    data_shape,
+                    chunks=chunks,
+                    dtype=dtype,
+                    compression=data_compression,
+                )
+
+    def _check_header(self, filename, run_check_acceptability=True):
+        """Check that the metadata in a file header matches the object's metadata.
+
+        Parameters
+        ----------
+        filename : str
+            The UVFlag HDF5 file to check.
+        run_check_acceptability : bool
+            Option to check acceptable range of the values of the metadata
+            read from the file.
+
+        Raises
+        ------
+        ValueError
+            If the metadata in the file does not match the object.
+
+        """
+        uvf_file = UVFlag()
+        with h5py.File(filename, "r") as f:
+            uvf_file._read_header(f["/Header"])
+        uvf_file.clear_unused_attributes()
+        uvf_file.check(
+            run_check_acceptability=run_check_acceptability, ignore_requirements=True
+        )
+
+        data_params = [
+            "_metric_array",
+            "_weights_array",
+            "_weights_square_array",
+            "_flag_array",
+        ]
+        for param in self:
+            if param in data_params:
+                continue
+            if getattr(self, param) != getattr(uvf_file, param):
+                raise ValueError(
+                    "The object metadata in memory and metadata on disk are different"
+                )
+
+    def write_part(
+        self,
+        filename,
+        metric_array=None,
+        weights_array=None,
+        weights_square_array=None,
+        flag_array=None,
+        check_header=True,
+        antenna_nums=None,
+        ant_inds=None,
+        bls=None,
+        frequencies=None,
+        freq_chans=None,
+        times=None,
+        polarizations=None,
+        blt_inds=None,
+        run_check_acceptability=True,
+    ):
+        """Write part of a UVFlag HDF5 file that was initialized with `initialize_file`.
+
+        The selection keywords define where the arrays go in the file, they are
+        interpreted against the metadata on this object (which must match the
+        file). Only the selected hyperslab of each dataset is written.
+
+        Parameters
+        ----------
+        filename : str
+            The file to write to. It must already exist, and is assumed to have
+            been initialized with `initialize_file`.
+        metric_array : array of float, optional
+            Metric data to write ("metric" mode files).
+        weights_array : array of float, optional
+            Weights to write ("metric" mode files).
+        weights_square_array : array of float, optional
+            Sums of squared weights to write ("metric" mode files initialized
+            with a weights_square_array dataset).
+        flag_array : array of bool, optional
+            Flags to write ("flag" mode files).
+        check_header : bool
+            Option to check that the metadata in the file header matches the
+            metadata on this object.
+        antenna_nums : array_like of int, optional
+            The antennas numbers to write data for.
+        ant_inds : array_like of int, optional
+            The antenna indices to write data for. This is not commonly used.
+        bls : list of tuple, optional
+            A list of antenna number tuples (e.g. [(0,1), (3,2)]) or a list of
+            baseline 3-tuples (e.g. [(0,1,'xx'), (2,3,'yy')]) specifying baselines
+            to write data for. For length-2 tuples, the ordering of the numbers
+            within the tuple does not matter. For length-3 tuples, the
+            polarization string is in the order of the two antennas. If length-3
+            tuples are provided, `polarizations` must be None.
+        frequencies : array_like of float, optional
+            The frequencies to write data for, each value passed here should
+            exist in the freq_array.
+        freq_chans : array_like of int, optional
+            The frequency channel numbers to write data for.
+        times : array_like of float, optional
+            The times to write data for, each value passed here should exist in
+            the time_array.
+        polarizations : array_like of int, optional
+            The polarizations numbers to write data for, each value passed here
+            should exist in the polarization_array.
+        blt_inds : array_like of int, optional
+            The baseline-time indices to write data for. This is not commonly
+            used.
+        run_check_acceptability : bool
+            If check_header, option to check acceptable range of the values of
+            the metadata in the file header.
+
+        Raises
+        ------
+        IOError
+            If the file does not exist.
+        ValueError
+            If no arrays are passed, if the file does not have a dataset for one
+            of the arrays, if the shape of an array does not match the selection
+            or if the metadata in the file does not match the object.
+
+        """
+        if not os.path.exists(filename):
+            raise IOError(
+                "{0} does not exist; please first initialize it with "
+                "initialize_file".format(filename)
+            )
+
+        arrays = {
+            "metric_array": metric_array,
+            "weights_array": weights_array,
+            "weights_square_array": weights_square_array,
+            "flag_array": flag_array,
+        }
+        arrays = {name: array for name, array in arrays.items() if array is not None}
+        if len(arrays) == 0:
+            raise ValueError(
+                "At least one of metric_array, weights_array, weights_square_array "
+                "or flag_array must be provided."
+            )
+
+        if check_header:
+            self._check_header(
+                filename, run_check_acceptability=run_check_acceptability
+            )
+
+        # figure out which "full file" indices to write data to
+        blt_inds, ant_inds, freq_inds, pol_inds, _ = self._select_preprocess(
+            antenna_nums,
+            bls,
+            frequencies,
+            freq_chans,
+            times,
+            polarizations,
+            blt_inds,
+            ant_inds,
+        )
+        axis_inds = self._get_data_axis_inds(blt_inds, ant_inds, freq_inds, pol_inds)
+
+        with h5py.File(filename, "r+") as f:
+            dgrp = f["/Data"]
+            # check all the arrays before writing any of them
+            for name, array in arrays.items():
+                if name not in dgrp:
+                    raise ValueError(
+                        "{0} does not have a {1} dataset.".format(filename, name)
+                    )
+                dset_shape = dgrp[name].shape
+                proper_shape = tuple(
+                    dset_shape[axis] if inds is None else len(inds)
+                    for axis, inds in enumerate(axis_inds)
+                )
+                if np.shape(array) != proper_shape:
+                    raise ValueError(
+                        "{0} has shape {1}; was expecting {2}".format(
+                            name, np.shape(array), proper_shape
+                        )
+                    )
+
+            for name, array in arrays.items():
+                _write_dset_part(dgrp[name], axis_inds, np.asarray(array))
+
     def from_uvdata(
         self,
         input,
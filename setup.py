@@ -90,10 +90,12 @@ extensions = [
 casa_reqs = ["python-casacore"]
 healpix_reqs = ["astropy_healpix"]
 cst_reqs = ["pyyaml"]
+dask_reqs = ["dask[array]"]
 test_reqs = (
     casa_reqs
     + healpix_reqs
     + cst_reqs
+    + dask_reqs
     + [
         "pytest",
         "pytest-xdist",
@@ -139,7 +141,8 @@ setup_args = {
         "casa": casa_reqs,
         "healpix": healpix_reqs,
         "cst": cst_reqs,
-        "all": casa_reqs + healpix_reqs + cst_reqs,
+        "dask": dask_reqs,
+        "all": casa_reqs + healpix_reqs + cst_reqs + dask_reqs,
         "test": test_reqs,
         "doc": doc_reqs,
         "dev": test_reqs + doc_reqs,